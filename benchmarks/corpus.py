@@ -0,0 +1,187 @@
+"""녹화된 게시판 페이지 모음(corpus) 읽기/쓰기
+
+corpus/<버전>/manifest.json 에 게시판별 목록 페이지와 상세 페이지 파일이 기록됩니다.
+
+    corpus/2025-03-07/
+        manifest.json
+        university_academic/list.html
+        university_contestevent/list.html
+        university_contestevent/detail_000.html
+"""
+
+import asyncio
+import json
+import random
+import socket
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import aiohttp
+from aiohttp import web
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+MANIFEST_NAME = "manifest.json"
+LIST_FILE = "list.html"
+
+Page = Tuple[bytes, Optional[str]]
+
+
+def list_versions(corpus_dir: Path = CORPUS_DIR):
+    """녹화된 corpus 버전 목록을 오래된 순으로 반환합니다."""
+    if not corpus_dir.exists():
+        return []
+    return sorted(
+        path.name
+        for path in corpus_dir.iterdir()
+        if (path / MANIFEST_NAME).exists()
+    )
+
+
+def resolve_version(version: Optional[str], corpus_dir: Path = CORPUS_DIR) -> Path:
+    """버전 폴더 경로를 반환합니다. 버전을 지정하지 않으면 가장 최근 버전을 사용합니다."""
+    if version:
+        path = corpus_dir / version
+        if not (path / MANIFEST_NAME).exists():
+            raise FileNotFoundError(f"corpus 버전을 찾을 수 없습니다: {path}")
+        return path
+    versions = list_versions(corpus_dir)
+    if not versions:
+        raise FileNotFoundError(
+            f"{corpus_dir}에 녹화된 corpus가 없습니다. record_fixtures로 먼저 녹화하세요."
+        )
+    return corpus_dir / versions[-1]
+
+
+def load_manifest(version_dir: Path) -> dict:
+    return json.loads((version_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+class CorpusPageSource:
+    """녹화된 페이지를 WebScraper.page_source로 제공합니다. 녹화되지 않은 URL은 None을 반환합니다."""
+
+    def __init__(self, version_dir: Path, board: dict):
+        self.pages: Dict[str, Tuple[Path, Optional[str]]] = {}
+        for url, page in board["pages"].items():
+            self.pages[url] = (version_dir / page["file"], page.get("content_type"))
+
+    async def get(self, url: str) -> Optional[Page]:
+        page = self.pages.get(url)
+        if page is None:
+            return None
+        path, content_type = page
+        return path.read_bytes(), content_type
+
+
+class RecordingPageSource:
+    """실제로 요청한 페이지를 게시판 폴더에 저장하는 page_source
+
+    목록 페이지는 list.html, 그 밖에 스크래퍼가 요청한 페이지는 detail_NNN.html로 저장합니다.
+    """
+
+    def __init__(self, version_dir: Path, collection_name: str, list_url: str):
+        self.version_dir = version_dir
+        self.board_dir = version_dir / collection_name
+        self.list_url = list_url
+        self.pages: Dict[str, dict] = {}
+
+    async def get(self, url: str) -> Optional[Page]:
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        print(f"  [실패] {url} 상태 코드: {response.status}")
+                        return None
+                    body = await response.read()
+                    content_type = response.headers.get("Content-Type")
+        except Exception as e:
+            print(f"  [실패] {url}: {e}")
+            return None
+
+        if url == self.list_url:
+            filename = LIST_FILE
+        else:
+            details = sum(1 for page in self.pages.values() if "detail_" in page["file"])
+            filename = f"detail_{details:03d}.html"
+        self.board_dir.mkdir(parents=True, exist_ok=True)
+        (self.board_dir / filename).write_bytes(body)
+        self.pages[url] = {
+            "file": f"{self.board_dir.name}/{filename}",
+            "content_type": content_type,
+        }
+        return body, content_type
+
+
+class CorpusServer:
+    """녹화된 corpus 전체를 로컬 HTTP로 제공하는 서버 (오프라인 재생용)
+
+    /page?url=<원래 URL>로 요청하면 녹화된 본문과 Content-Type을 돌려줍니다.
+    latency를 주면 (최소, 최대) 초 사이에서 무작위로 응답을 늦춰 실제 게시판 응답 시간을 흉내 냅니다.
+    """
+
+    def __init__(
+        self, version_dir: Path, latency: Tuple[float, float] = (0.0, 0.0), seed: int = 0
+    ):
+        self.pages: Dict[str, Tuple[Path, Optional[str]]] = {}
+        for board in load_manifest(version_dir)["boards"].values():
+            for url, page in board["pages"].items():
+                self.pages[url] = (version_dir / page["file"], page.get("content_type"))
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.base_url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self, host: str = "127.0.0.1"):
+        app = web.Application()
+        app.router.add_get("/page", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        # 빈 포트를 골라 바인딩
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((host, 0))
+        await web.SockSite(self._runner, sock).start()
+        self.base_url = f"http://{host}:{sock.getsockname()[1]}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        page = self.pages.get(request.query.get("url", ""))
+        if page is None:
+            return web.Response(status=404)
+
+        low, high = self.latency
+        if high > 0:
+            await asyncio.sleep(self.random.uniform(low, high))
+        path, content_type = page
+        headers = {"Content-Type": content_type} if content_type else {}
+        return web.Response(body=path.read_bytes(), headers=headers)
+
+
+class StubPageSource:
+    """CorpusServer에 HTTP로 요청해 페이지를 가져오는 page_source"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get(self, url: str) -> Optional[Page]:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        async with self._session.get(
+            f"{self.base_url}/page", params={"url": url}
+        ) as response:
+            if response.status != 200:
+                return None
+            return await response.read(), response.headers.get("Content-Type")
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+
+def new_version_name() -> str:
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
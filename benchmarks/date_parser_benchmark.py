@@ -0,0 +1,101 @@
+"""작성일 파서 검증 및 마이크로 벤치마크
+
+fixtures/date_formats.json의 모든 형식을 date_parser로 파싱해 기대값과 비교하고,
+기존 스크래퍼의 strptime 예외 연쇄 방식과 처리 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.date_parser_benchmark
+    python -m benchmarks.date_parser_benchmark --repeat 100000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from utils.date_parser import DateParser, KST
+from utils.scraper_type import ScraperType
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures" / "date_formats.json"
+
+# 기존 스크래퍼에서 쓰던 형식 순서
+LEGACY_FORMATS = ("%Y-%m-%d", "%Y.%m.%d", "%y.%m.%d")
+
+
+def legacy_parse(text: str):
+    """기존 스크래퍼의 try/except strptime 연쇄 방식"""
+    text = text.strip()
+    for fmt in LEGACY_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=KST)
+        except ValueError:
+            continue
+    return None
+
+
+def expected_value(expected):
+    if expected is None:
+        return None
+    if expected.startswith("today "):
+        hour, minute = map(int, expected.split(" ", 1)[1].split(":"))
+        now = datetime.now(KST)
+        return KST.localize(datetime(now.year, now.month, now.day, hour, minute))
+    return datetime.fromisoformat(expected)
+
+
+def verify(fixtures) -> bool:
+    """모든 fixture가 기대값대로 파싱되는지 확인합니다."""
+    parser = DateParser()
+    ok = True
+    for fixture in fixtures:
+        result = parser.parse(fixture["text"])
+        expected = expected_value(fixture["expected"])
+        passed = result == expected and (
+            result is None or result.utcoffset() == expected.utcoffset()
+        )
+        ok &= passed
+        print(
+            f"{'OK ' if passed else 'FAIL'} {fixture['source']:<30} "
+            f"{fixture['text'].strip()!r:<40} -> {result}"
+        )
+    return ok
+
+
+def benchmark(repeat: int):
+    """legacy 방식이 처리할 수 있는 세 가지 형식으로 시간을 비교합니다."""
+    samples = {
+        "%Y-%m-%d": "2025-03-07",
+        "%Y.%m.%d": "2025.03.07",
+        "%y.%m.%d": "25.03.07",
+    }
+    scraper_type = next(iter(ScraperType))
+    print(f"\n{'형식':<12}{'legacy µs':>12}{'cold µs':>12}{'warm µs':>12}")
+    for fmt, text in samples.items():
+        legacy = timeit.timeit(lambda: legacy_parse(text), number=repeat)
+        # cold: 형식 기억 없이 매번 처음부터 시도
+        cold = timeit.timeit(lambda: DateParser().parse(text), number=repeat)
+        # warm: 같은 스크래퍼 타입에서 성공한 형식을 먼저 시도
+        parser = DateParser()
+        parser.parse(text, scraper_type)
+        warm = timeit.timeit(lambda: parser.parse(text, scraper_type), number=repeat)
+        print(
+            f"{fmt:<12}{legacy / repeat * 1e6:>12.2f}"
+            f"{cold / repeat * 1e6:>12.2f}{warm / repeat * 1e6:>12.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작성일 파서 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    fixtures = json.loads(FIXTURES_PATH.read_text(encoding="utf-8"))
+    ok = verify(fixtures)
+    benchmark(args.repeat)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
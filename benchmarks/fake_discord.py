@@ -0,0 +1,143 @@
+"""오프라인 재생용 가짜 디스코드 클라이언트
+
+discord_bot.discord_bot의 client와 send_via_webhook을 대신해 실제 전송 없이 전송 기록을 남기고,
+디스코드의 전송 제한(봇 전역, 채널별, 웹훅별)을 흉내 내 제한에 걸리면 그만큼 기다립니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+
+@dataclass
+class SendRecord:
+    method: str  # "bot" 또는 "webhook"
+    channel_id: str
+    link: Optional[str]
+    sent_at: float  # time.monotonic()
+    waited: float  # 전송 제한으로 기다린 시간 (초)
+
+
+class RateLimitBucket:
+    """per초 동안 limit번까지 허용하는 이동 구간 전송 제한"""
+
+    def __init__(self, limit: int, per: float):
+        self.limit = limit
+        self.per = per
+        self.sent: Deque[float] = deque()
+
+    async def acquire(self) -> float:
+        """전송 가능할 때까지 기다리고, 기다린 시간(초)을 반환합니다."""
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            while self.sent and now - self.sent[0] >= self.per:
+                self.sent.popleft()
+            if len(self.sent) < self.limit:
+                self.sent.append(now)
+                return waited
+            delay = self.per - (now - self.sent[0])
+            waited += delay
+            await asyncio.sleep(delay)
+
+
+class FakePermissions:
+    send_messages = True
+    embed_links = True
+
+
+class FakeGuild:
+    me = None
+
+
+class FakeChannel:
+    """서버 채널 흉내 (권한은 항상 있음)"""
+
+    guild = FakeGuild()
+
+    def __init__(self, client: "FakeDiscordClient", channel_id: int):
+        self.client = client
+        self.id = channel_id
+        self.name = f"replay-{channel_id}"
+
+    def permissions_for(self, member):
+        return FakePermissions()
+
+    async def send(self, embeds=None, **kwargs):
+        await self.client.record_send("bot", str(self.id), embeds)
+
+
+class FakeUser:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FakeDiscordClient:
+    """send_notice/deliver가 사용하는 만큼만 구현한 디스코드 클라이언트
+
+    Args:
+        scraper_config: 구독 조회에 사용할 ScraperConfig (메모리 DB에 구독을 넣어 둠)
+        permission_cache: ChannelPermissionCache
+        limits: 전송 제한 설정
+            latency_ms: 요청 하나의 응답 시간
+            global_per_second: 봇 계정 전체 초당 요청 수
+            channel_limit: [횟수, 초] 채널별 메시지 전송 제한
+            webhook_limit: [횟수, 초] 웹훅별 전송 제한
+    """
+
+    def __init__(self, scraper_config, permission_cache, limits: dict):
+        self.scraper_config = scraper_config
+        self.permission_cache = permission_cache
+        self.user = FakeUser("replay-bot")
+        self.latency = limits.get("latency_ms", 0) / 1000
+        self.global_bucket = RateLimitBucket(limits.get("global_per_second", 50), 1.0)
+        self.channel_limit = tuple(limits.get("channel_limit", (5, 5.0)))
+        self.webhook_limit = tuple(limits.get("webhook_limit", (5, 2.0)))
+        self.channels: Dict[int, FakeChannel] = {}
+        self.buckets: Dict[str, RateLimitBucket] = {}
+        self.sends: List[SendRecord] = []
+        self.rate_limited = 0
+
+    async def wait_until_ready(self):
+        return
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            channel = self.channels[channel_id] = FakeChannel(self, channel_id)
+        return channel
+
+    async def fetch_user(self, user_id: int):
+        raise RuntimeError("재생 모드에서는 DM 구독을 사용하지 않습니다")
+
+    def _bucket(self, key: str, limit: tuple) -> RateLimitBucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = RateLimitBucket(*limit)
+        return bucket
+
+    async def record_send(self, method: str, channel_id: str, embeds) -> None:
+        if method == "bot":
+            waited = await self.global_bucket.acquire()
+            waited += await self._bucket(channel_id, self.channel_limit).acquire()
+        else:
+            waited = await self._bucket(f"webhook:{channel_id}", self.webhook_limit).acquire()
+        if waited > 0:
+            self.rate_limited += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        link = embeds[0].url if embeds else None
+        self.sends.append(
+            SendRecord(method, channel_id, link, time.monotonic(), waited)
+        )
+
+    async def send_via_webhook(
+        self, channel_id: str, webhook_url: str, embeds, summary: str
+    ) -> bool:
+        """discord_bot.send_via_webhook 대체"""
+        await self.record_send("webhook", channel_id, embeds)
+        self.scraper_config.record_delivery_success(channel_id)
+        return True
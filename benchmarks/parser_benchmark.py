@@ -0,0 +1,130 @@
+"""HTML 파서 백엔드별 파싱 시간/메모리 비교 벤치마크
+
+저장해둔 게시판 페이지(<페이지 폴더>/<collection_name>.html)를 백엔드별로 파싱하고
+get_list_elements까지의 시간과 tracemalloc 최대 메모리를 비교합니다.
+
+사용법:
+    python -m benchmarks.parser_benchmark --fetch      # 모든 게시판 페이지 저장
+    python -m benchmarks.parser_benchmark              # 저장된 페이지로 비교
+    python -m benchmarks.parser_benchmark --backends lxml selectolax --repeat 20
+    python -m benchmarks.parser_benchmark --full       # 목록 영역 없이 전체 파싱
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+import requests
+from utils.scraper_type import ScraperType
+from utils.scraper_factory import ScraperFactory
+from utils.web_scraper import decode_html
+from utils.html_parser import BACKENDS, resolve_backend, parse_html
+
+DEFAULT_PAGES_DIR = Path(__file__).parent / "pages"
+
+
+def fetch_pages(pages_dir: Path):
+    """RSS를 제외한 모든 게시판의 목록 페이지를 저장합니다."""
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    for scraper_type in ScraperType:
+        if scraper_type.name.endswith("_RSS") or "youtube" in scraper_type.get_url():
+            continue
+        try:
+            response = requests.get(scraper_type.get_url(), timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"[건너뜀] {scraper_type.get_korean_name()}: {e}")
+            continue
+        path = pages_dir / f"{scraper_type.get_collection_name()}.html"
+        path.write_bytes(response.content)
+        print(f"[저장] {path.name} ({len(response.content):,} bytes)")
+
+
+def measure(scraper, html_text: str, backend: str, repeat: int, full: bool = False):
+    """파싱 + 목록 선택 평균 시간(ms), 최대 메모리(KB), 목록 요소 수를 측정합니다."""
+    region = None if full else scraper.list_region
+    start = time.perf_counter()
+    for _ in range(repeat):
+        soup = parse_html(html_text, backend, region)
+        elements = scraper.get_list_elements(soup)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    soup = parse_html(html_text, backend, region)
+    scraper.get_list_elements(soup)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed_ms, peak / 1024, len(elements or [])
+
+
+def run(pages_dir: Path, backends, repeat: int, full: bool = False):
+    pages = sorted(pages_dir.glob("*.html"))
+    if not pages:
+        print(f"{pages_dir}에 저장된 페이지가 없습니다. --fetch로 먼저 저장하세요.")
+        return
+
+    # 설치되지 않은 백엔드는 대체 백엔드로 바뀌므로 중복 측정하지 않음
+    backends = list(dict.fromkeys(resolve_backend(backend) for backend in backends))
+    totals = {backend: [0.0, 0.0] for backend in backends}
+
+    header = f"{'게시판':<50}" + "".join(
+        f"{backend + ' ms':>16}{backend + ' KB':>16}" for backend in backends
+    )
+    print(header)
+    print("-" * len(header))
+
+    for path in pages:
+        try:
+            scraper_type = ScraperType.from_str(path.stem)
+        except KeyError:
+            continue
+        scraper = ScraperFactory().create_scraper(scraper_type)
+        if not scraper:
+            continue
+        html_text = decode_html(path.read_bytes())
+
+        row = f"{path.stem:<50}"
+        counts = set()
+        for backend in backends:
+            elapsed_ms, peak_kb, count = measure(
+                scraper, html_text, backend, repeat, full
+            )
+            totals[backend][0] += elapsed_ms
+            totals[backend][1] = max(totals[backend][1], peak_kb)
+            counts.add(count)
+            row += f"{elapsed_ms:>16.2f}{peak_kb:>16.0f}"
+        # 백엔드별로 찾은 목록 요소 수가 다르면 선택자 호환성 문제
+        if len(counts) > 1:
+            row += f"  ⚠ 요소 수 불일치 {sorted(counts)}"
+        print(row)
+
+    print("-" * len(header))
+    print(
+        f"{'합계 시간 / 최대 메모리':<50}"
+        + "".join(
+            f"{totals[backend][0]:>16.2f}{totals[backend][1]:>16.0f}"
+            for backend in backends
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument("--pages", type=Path, default=DEFAULT_PAGES_DIR)
+    parser.add_argument("--fetch", action="store_true", help="게시판 페이지를 새로 저장")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--full", action="store_true", help="목록 영역(LIST_REGION)을 무시하고 전체 파싱"
+    )
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch_pages(args.pages)
+    else:
+        run(args.pages, args.backends, args.repeat, args.full)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""게시판 페이지 녹화기
+
+모든 ScraperType(RSS/유튜브 제외)의 목록 페이지와, 파싱 중에 스크래퍼가 요청한
+상세 페이지를 corpus/<버전>/ 아래에 저장하고 manifest.json을 작성합니다.
+녹화한 corpus는 scraper_benchmark로 오프라인 측정/회귀 검사에 사용합니다.
+
+사용법:
+    python -m benchmarks.record_fixtures                      # 새 버전으로 전체 녹화
+    python -m benchmarks.record_fixtures --version 2025-03-07
+    python -m benchmarks.record_fixtures --only UNIVERSITY_ACADEMIC LAW_ACADEMIC
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from utils.scraper_type import ScraperType
+from utils.scraper_factory import ScraperFactory
+from utils.web_scraper import decode_html
+from benchmarks.corpus import (
+    CORPUS_DIR,
+    MANIFEST_NAME,
+    RecordingPageSource,
+    new_version_name,
+)
+
+
+def is_recordable(scraper_type: ScraperType) -> bool:
+    """HTML 목록 페이지가 있는 게시판인지 확인합니다."""
+    return (
+        not scraper_type.name.endswith("_RSS")
+        and "youtube" not in scraper_type.get_url()
+    )
+
+
+async def record_board(version_dir, scraper_type: ScraperType):
+    """게시판 하나를 녹화하고 manifest 항목을 반환합니다. 실패하면 None을 반환합니다."""
+    scraper = ScraperFactory().create_scraper(scraper_type)
+    if not scraper:
+        return None
+
+    source = RecordingPageSource(
+        version_dir, scraper_type.get_collection_name(), scraper.url
+    )
+    scraper.page_source = source
+
+    fetched = await scraper._fetch_bytes()
+    if fetched is None:
+        return None
+    body, content_type = fetched
+
+    # 파싱까지 실행해 상세 페이지 요청도 함께 녹화 (기존 공지가 없다고 보고 전체 파싱)
+    soup = scraper.parse_html(decode_html(body, content_type, scraper.url))
+    notices = await scraper.collect_notices(soup, set())
+
+    return {
+        "scraper_type": scraper_type.name,
+        "list_url": scraper.url,
+        "notice_count": len(notices),
+        "pages": source.pages,
+    }
+
+
+async def record(version: str, only=None):
+    version_dir = CORPUS_DIR / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+
+    boards = {}
+    for scraper_type in ScraperType:
+        if not is_recordable(scraper_type):
+            continue
+        if only and scraper_type.name not in only:
+            continue
+        board = await record_board(version_dir, scraper_type)
+        if board is None:
+            print(f"[건너뜀] {scraper_type.get_korean_name()}")
+            continue
+        boards[scraper_type.get_collection_name()] = board
+        print(
+            f"[저장] {scraper_type.get_collection_name()}: "
+            f"페이지 {len(board['pages'])}개, 공지 {board['notice_count']}개"
+        )
+
+    manifest = {
+        "version": version,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "boards": boards,
+    }
+    (version_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    print(f"\n{len(boards)}개 게시판을 {version_dir}에 녹화했습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 페이지 녹화")
+    parser.add_argument("--version", default=None, help="corpus 버전 이름 (기본: 현재 시각)")
+    parser.add_argument("--only", nargs="+", default=None, help="녹화할 ScraperType 이름")
+    args = parser.parse_args()
+
+    asyncio.run(record(args.version or new_version_name(), args.only))
+
+
+if __name__ == "__main__":
+    main()
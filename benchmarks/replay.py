@@ -0,0 +1,327 @@
+"""오프라인 전체 파이프라인 재생
+
+네트워크 없이 main.py의 확인 틱 전체(일정 → 스크래핑 → 중복 확인 → 저장 → 채널 전송)를 실행합니다.
+- 게시판 페이지: 녹화된 corpus를 로컬 HTTP 스텁 서버(CorpusServer)로 제공
+- DB: mongomock:// 메모리 DB (또는 --mongo-uri로 로컬 mongod)
+- 디스코드: 전송을 기록하고 전송 제한을 흉내 내는 가짜 클라이언트 (fake_discord.py)
+
+부하 프로필(profiles/<이름>.json)에 따라 구독 채널을 만들고, 정해진 틱마다 일부 게시판의 최신 공지를
+DB에서 지워 새로 올라온 공지로 만든 뒤, 게시 → 채널 도착 지연과 전송 처리량을 보고합니다.
+mongomock은 선택 설치입니다 (pip install mongomock).
+
+사용법:
+    python -m benchmarks.replay                                   # 최신 corpus, 기본 프로필
+    python -m benchmarks.replay --profile default --corpus 2025-03-07
+    python -m benchmarks.replay --save-report main                # 결과 저장
+    python -m benchmarks.replay --compare main                    # 저장한 결과와 비교
+    python -m benchmarks.replay --mongo-uri mongodb://localhost:27017
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+from config.env_loader import ENV
+from benchmarks.corpus import (
+    CorpusServer,
+    StubPageSource,
+    load_manifest,
+    resolve_version,
+)
+
+PROFILES_DIR = Path(__file__).parent / "profiles"
+REPORTS_DIR = Path(__file__).parent / "replays"
+
+# 비교할 때 값이 클수록 나쁜 지표와 작을수록 나쁜 지표
+HIGHER_IS_WORSE = (
+    "latency_p50_s",
+    "latency_p95_s",
+    "latency_p99_s",
+    "latency_max_s",
+    "fanout_p95_s",
+    "tick_max_s",
+    "total_s",
+)
+LOWER_IS_WORSE = ("sends_per_second",)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """최근접 순위 백분위수를 반환합니다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def seed_subscriptions(scraper_config, boards: list, profile: dict, rng: random.Random):
+    """프로필의 채널 수만큼 서버 채널 구독을 만듭니다. 모든 게시판에 구독자가 한 명 이상 있게 합니다."""
+    names = [scraper_type.get_collection_name() for scraper_type in boards]
+    low, high = profile["boards_per_channel"]
+    documents = []
+    for i in range(profile["channels"]):
+        count = min(rng.randint(low, high), len(names))
+        scrapers = {names[i % len(names)], *rng.sample(names, count - 1)}
+        document = {
+            "_id": str(900000000000000000 + i),
+            "channel_name": f"replay-{i}",
+            "guild_name": "replay",
+            "scrapers": sorted(scrapers),
+        }
+        if rng.random() < profile["webhook_ratio"]:
+            document["webhook_url"] = f"https://discord.com/api/webhooks/{i}/replay"
+        documents.append(document)
+
+    collection = scraper_config.server_channel_collection
+    collection.delete_many({})
+    collection.insert_many(documents)
+
+
+def post_burst(burst: dict, boards: list, rng: random.Random, posted: Dict[str, float]):
+    """무작위 게시판의 최신 공지를 DB에서 지워 다음 틱에 새 공지로 감지되게 합니다."""
+    from config.db_config import get_collection
+    from utils.scraper_factory import ScraperFactory
+
+    count = len(boards) if burst["boards"] == "all" else min(burst["boards"], len(boards))
+    now = time.monotonic()
+    for scraper_type in rng.sample(boards, count):
+        collection = get_collection(scraper_type.get_collection_name())
+        newest = list(
+            collection.find(sort=[("published", -1)], limit=burst["notices"])
+        )
+        if not newest:
+            continue
+        collection.delete_many({"_id": {"$in": [document["_id"] for document in newest]}})
+        for document in newest:
+            posted[document["link"]] = now
+        # 메모리에 들고 있는 등록 목록도 버려야 다시 감지됨
+        ScraperFactory().forget_seen(scraper_type)
+
+
+async def run(version_dir: Path, profile: dict, mongo_uri: str, db_name: str) -> dict:
+    manifest = load_manifest(version_dir)
+    board_names = sorted(board["scraper_type"] for board in manifest["boards"].values())
+    board_names = board_names[: profile["boards"]]
+
+    # 아래 모듈들은 가져올 때 ENV를 읽으므로 먼저 재생용 설정으로 바꿈
+    ENV["MONGODB_URI"] = mongo_uri
+    ENV["DB_NAME"] = db_name
+    ENV["PARSE_POOL_SIZE"] = 0
+    ENV["SCRAPE_MODE"] = "local"
+    ENV["ACTIVE_SCRAPERS"] = set(board_names)
+
+    import main
+    import discord_bot.discord_bot as bot_module
+    from config.db_config import ensure_notice_indexes, get_collection
+    from config.logger_config import setup_logger
+    from discord_bot.permission_cache import ChannelPermissionCache
+    from discord_bot.scraper_config import ScraperConfig
+    from utils.check_new_scraper import run_check_new_scraper
+    from utils.metrics import NEW_NOTICES
+    from utils.scheduler import scheduler
+    from utils.scraper_factory import ScraperFactory
+    from utils.scraper_type import ScraperType
+    from benchmarks.fake_discord import FakeDiscordClient
+
+    # main.py는 직접 실행할 때만 logger를 만듦
+    main.logger = setup_logger("main")
+    rng = random.Random(profile.get("seed", 0))
+    boards = [ScraperType[name] for name in board_names]
+
+    # 로컬 mongod를 쓰는 경우 이전 재생의 공지를 지움
+    for scraper_type in boards:
+        get_collection(scraper_type.get_collection_name()).delete_many({})
+    ensure_notice_indexes()
+
+    scraper_config = ScraperConfig()
+    seed_subscriptions(scraper_config, boards, profile, rng)
+    fake = FakeDiscordClient(
+        scraper_config, ChannelPermissionCache(), profile.get("discord", {})
+    )
+    bot_module.client = fake
+    bot_module.send_via_webhook = fake.send_via_webhook
+
+    low_ms, high_ms = profile.get("fetch_latency_ms", (0, 0))
+    server = CorpusServer(
+        version_dir, (low_ms / 1000, high_ms / 1000), profile.get("seed", 0)
+    )
+    await server.start()
+    source = StubPageSource(server.base_url)
+    ScraperFactory().page_source_factory = lambda scraper_type: source
+
+    # 일정 엔진은 가상 시계로 돌림
+    clock = [datetime.fromisoformat(profile["start"])]
+    scheduler.now = lambda: clock[0]
+
+    print(
+        f"corpus: {version_dir.name}, 게시판 {len(boards)}개, "
+        f"채널 {profile['channels']}개, 틱 {profile['ticks']}회"
+    )
+    started = time.monotonic()
+
+    # 비어 있는 컬렉션 초기화 (전송하지 않고 저장만)
+    await run_check_new_scraper()
+
+    main.notice_queue = asyncio.Queue(maxsize=main.NOTICE_QUEUE_SIZE)
+    worker = asyncio.create_task(main.delivery_worker())
+
+    posted: Dict[str, float] = {}
+    ticks = []
+    try:
+        for tick in range(1, profile["ticks"] + 1):
+            for burst in profile.get("bursts", []):
+                if burst["tick"] == tick:
+                    post_burst(burst, boards, rng, posted)
+
+            new_before = sum(NEW_NOTICES.values.values())
+            tick_started = time.monotonic()
+            await main.check_all_notices()
+            seconds = time.monotonic() - tick_started
+
+            checked = sum(1 for ran in scheduler.last_run.values() if ran == clock[0])
+            new = int(sum(NEW_NOTICES.values.values()) - new_before)
+            deferred = len(scheduler.deferred)
+            ticks.append(
+                {
+                    "tick": tick,
+                    "boards": checked,
+                    "deferred": deferred,
+                    "new": new,
+                    "seconds": round(seconds, 3),
+                }
+            )
+            print(
+                f"틱 {tick}: 게시판 {checked}개 (밀림 {deferred}개), 새 공지 {new}개, {seconds:.2f}s"
+            )
+            clock[0] += timedelta(minutes=profile["tick_minutes"])
+    finally:
+        worker.cancel()
+        await source.close()
+        await server.stop()
+
+    return {
+        "corpus": version_dir.name,
+        "profile": profile,
+        "ticks": ticks,
+        "summary": summarize(fake, posted, ticks, time.monotonic() - started),
+        "fetches": server.requests,
+    }
+
+
+def summarize(fake, posted: Dict[str, float], ticks: list, total: float) -> dict:
+    """전송 기록으로 처리량과 지연을 계산합니다."""
+    latencies = []
+    first_last: Dict[str, List[float]] = {}
+    for send in fake.sends:
+        if send.link not in posted:
+            continue
+        latencies.append(send.sent_at - posted[send.link])
+        span = first_last.setdefault(send.link, [send.sent_at, send.sent_at])
+        span[0] = min(span[0], send.sent_at)
+        span[1] = max(span[1], send.sent_at)
+    fanouts = [last - first for first, last in first_last.values()]
+    tick_seconds = [tick["seconds"] for tick in ticks]
+
+    return {
+        "posted": len(posted),
+        "delivered": len(first_last),
+        "missed": len(posted) - len(first_last),
+        "sends": len(fake.sends),
+        "webhook_sends": sum(1 for send in fake.sends if send.method == "webhook"),
+        "rate_limited": fake.rate_limited,
+        "rate_limit_wait_s": round(sum(send.waited for send in fake.sends), 3),
+        "sends_per_second": round(len(fake.sends) / max(sum(tick_seconds), 1e-6), 1),
+        "latency_p50_s": round(percentile(latencies, 0.5), 3),
+        "latency_p95_s": round(percentile(latencies, 0.95), 3),
+        "latency_p99_s": round(percentile(latencies, 0.99), 3),
+        "latency_max_s": round(max(latencies, default=0.0), 3),
+        "fanout_p95_s": round(percentile(fanouts, 0.95), 3),
+        "tick_max_s": round(max(tick_seconds, default=0.0), 3),
+        "total_s": round(total, 3),
+    }
+
+
+def print_report(summary: dict, baseline: dict = None, threshold: float = 0.2) -> bool:
+    """요약을 출력합니다. 기준 결과보다 나빠졌으면 False를 반환합니다."""
+    ok = True
+    print()
+    for key, value in summary.items():
+        row = f"{key:<22}{value:>12}"
+        base = (baseline or {}).get(key)
+        if base is not None and key in HIGHER_IS_WORSE + LOWER_IS_WORSE:
+            change = (value - base) / max(abs(base), 1e-6)
+            row += f"{change:>+10.0%}"
+            worse = change > threshold if key in HIGHER_IS_WORSE else change < -threshold
+            if worse:
+                row += "  ⚠ 나빠짐"
+                ok = False
+        print(row)
+
+    if summary["missed"]:
+        print(f"\n⚠ 게시한 공지 {summary['missed']}개가 전송되지 않았습니다.")
+        ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 전체 파이프라인 재생")
+    parser.add_argument("--corpus", default=None, help="corpus 버전 (기본: 최신)")
+    parser.add_argument("--profile", default="default", help="profiles/<이름>.json")
+    parser.add_argument(
+        "--mongo-uri", default="mongomock://replay", help="mongomock:// 또는 로컬 mongod 주소"
+    )
+    parser.add_argument("--db-name", default="replay-kookmin-feed")
+    parser.add_argument("--save-report", metavar="NAME", help="결과를 replays/<NAME>.json으로 저장")
+    parser.add_argument("--compare", metavar="NAME", help="저장된 결과와 비교")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="나빠짐으로 판단할 비율 (기본 0.2)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="INFO 로그도 출력")
+    args = parser.parse_args()
+
+    # 구독 DB(notification-recipient)를 덮어쓰므로 로컬 DB만 허용
+    if not args.mongo_uri.startswith("mongomock://") and not any(
+        host in args.mongo_uri for host in ("localhost", "127.0.0.1")
+    ):
+        print("재생은 mongomock:// 또는 로컬 mongod에서만 실행할 수 있습니다.")
+        sys.exit(2)
+
+    if not args.verbose:
+        # 채널마다 남기는 전송 로그가 측정을 방해하지 않도록 경고 이상만 출력
+        logging.disable(logging.INFO)
+
+    profile = json.loads(
+        (PROFILES_DIR / f"{args.profile}.json").read_text(encoding="utf-8")
+    )
+    version_dir = resolve_version(args.corpus)
+    report = asyncio.run(run(version_dir, profile, args.mongo_uri, args.db_name))
+
+    baseline = None
+    if args.compare:
+        data = json.loads(
+            (REPORTS_DIR / f"{args.compare}.json").read_text(encoding="utf-8")
+        )
+        if data["corpus"] != report["corpus"] or data["profile"] != report["profile"]:
+            print("⚠ 비교 대상은 다른 corpus/프로필로 실행되었습니다.")
+        baseline = data["summary"]
+
+    ok = print_report(report["summary"], baseline, args.threshold)
+
+    if args.save_report:
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = REPORTS_DIR / f"{args.save_report}.json"
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과를 저장했습니다: {path}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""녹화된 corpus로 모든 스크래퍼의 파싱 성능을 측정하는 벤치마크
+
+게시판마다 목록 페이지 디코딩 → 파싱 → get_list_elements → parse_notice_from_element
+(collect_notices)를 실행해 평균 시간, tracemalloc 할당량/최대 메모리, 공지 수를 보고합니다.
+상세 페이지 요청은 corpus에 녹화된 페이지로 대체되므로 네트워크를 사용하지 않습니다.
+
+사용법:
+    python -m benchmarks.scraper_benchmark                          # 최신 corpus로 측정
+    python -m benchmarks.scraper_benchmark --corpus 2025-03-07 --repeat 20
+    python -m benchmarks.scraper_benchmark --save-baseline main     # 결과를 기준값으로 저장
+    python -m benchmarks.scraper_benchmark --compare main           # 기준값과 비교
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from utils.scraper_type import ScraperType
+from utils.scraper_factory import ScraperFactory
+from utils.web_scraper import decode_html
+from benchmarks.corpus import (
+    LIST_FILE,
+    CorpusPageSource,
+    load_manifest,
+    resolve_version,
+)
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+
+async def parse_board(scraper, body: bytes, content_type):
+    """디코딩부터 공지 추출까지 한 번 실행하고 공지 목록을 반환합니다."""
+    soup = scraper.parse_html(decode_html(body, content_type, scraper.url))
+    return await scraper.collect_notices(soup, set())
+
+
+async def measure(scraper, body: bytes, content_type, repeat: int) -> dict:
+    """평균 시간(ms), 할당량(KB), 최대 메모리(KB), 공지 수를 측정합니다."""
+    # 첫 실행은 선택자 컴파일/형식 학습 등 준비 비용이 섞이므로 제외
+    notices = await parse_board(scraper, body, content_type)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await parse_board(scraper, body, content_type)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    await parse_board(scraper, body, content_type)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocated = sum(
+        stat.size_diff
+        for stat in after.compare_to(before, "filename")
+        if stat.size_diff > 0
+    )
+
+    return {
+        "time_ms": round(elapsed_ms, 3),
+        "alloc_kb": round(allocated / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "notices": len(notices),
+    }
+
+
+async def run(version_dir: Path, repeat: int, only=None) -> dict:
+    manifest = load_manifest(version_dir)
+    results = {}
+    for collection_name, board in sorted(manifest["boards"].items()):
+        if only and board["scraper_type"] not in only:
+            continue
+        try:
+            scraper_type = ScraperType[board["scraper_type"]]
+        except KeyError:
+            print(f"[건너뜀] 알 수 없는 스크래퍼 타입: {board['scraper_type']}")
+            continue
+        scraper = ScraperFactory().create_scraper(scraper_type)
+        if not scraper:
+            continue
+
+        scraper.page_source = CorpusPageSource(version_dir, board)
+        page = board["pages"].get(board["list_url"])
+        if page is None or not page["file"].endswith(LIST_FILE):
+            print(f"[건너뜀] 목록 페이지가 녹화되지 않음: {collection_name}")
+            continue
+        body = (version_dir / page["file"]).read_bytes()
+
+        results[collection_name] = await measure(
+            scraper, body, page.get("content_type"), repeat
+        )
+    return results
+
+
+def print_results(results: dict, baseline: dict = None, threshold: float = 0.2) -> bool:
+    """결과 표를 출력합니다. 기준값보다 느려졌거나 공지 수가 달라지면 False를 반환합니다."""
+    header = f"{'게시판':<45}{'시간 ms':>10}{'할당 KB':>10}{'최대 KB':>10}{'공지':>6}"
+    if baseline is not None:
+        header += f"{'시간 변화':>12}"
+    print(header)
+    print("-" * len(header))
+
+    ok = True
+    total_ms = 0.0
+    for name, result in results.items():
+        total_ms += result["time_ms"]
+        row = (
+            f"{name:<45}{result['time_ms']:>10.2f}{result['alloc_kb']:>10.0f}"
+            f"{result['peak_kb']:>10.0f}{result['notices']:>6}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            change = (result["time_ms"] - base["time_ms"]) / max(base["time_ms"], 1e-6)
+            row += f"{change:>+12.0%}"
+            if change > threshold:
+                row += "  ⚠ 느려짐"
+                ok = False
+            if result["notices"] != base["notices"]:
+                row += f"  ⚠ 공지 수 {base['notices']} → {result['notices']}"
+                ok = False
+        elif baseline is not None:
+            row += f"{'(신규)':>12}"
+        print(row)
+
+    print("-" * len(header))
+    print(f"{'합계':<45}{total_ms:>10.2f}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 파싱 벤치마크")
+    parser.add_argument("--corpus", default=None, help="corpus 버전 (기본: 최신)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--only", nargs="+", default=None, help="측정할 ScraperType 이름")
+    parser.add_argument("--save-baseline", metavar="NAME", help="결과를 기준값으로 저장")
+    parser.add_argument("--compare", metavar="NAME", help="저장된 기준값과 비교")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="느려짐으로 판단할 비율 (기본 0.2)"
+    )
+    args = parser.parse_args()
+
+    version_dir = resolve_version(args.corpus)
+    print(f"corpus: {version_dir.name}\n")
+    results = asyncio.run(run(version_dir, args.repeat, args.only))
+
+    baseline = None
+    if args.compare:
+        data = json.loads(
+            (BASELINES_DIR / f"{args.compare}.json").read_text(encoding="utf-8")
+        )
+        if data["corpus"] != version_dir.name:
+            print(f"⚠ 기준값은 다른 corpus({data['corpus']})로 측정되었습니다.\n")
+        baseline = data["results"]
+
+    ok = print_results(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+        path = BASELINES_DIR / f"{args.save_baseline}.json"
+        path.write_text(
+            json.dumps(
+                {"corpus": version_dir.name, "repeat": args.repeat, "results": results},
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"\n기준값을 저장했습니다: {path}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
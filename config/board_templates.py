@@ -0,0 +1,163 @@
+from typing import Dict
+from utils.board_template import (
+    BoardTemplate,
+    CompiledBoardTemplate,
+    TITLE_ATTR,
+    TITLE_TEXT_CLEAN,
+    TITLE_TEXT_RAW,
+)
+from utils.scraper_type import ScraperType
+
+# 학과 홈페이지 CMS(board-table / b-title-box) 공통 형태
+# 고정 공지가 td.b-num-box.num-notice로 표시되고 제목이 title 속성에 들어있는 게시판
+_SOCIAL_BOARD = dict(
+    list_selector="table.board-table tbody tr",
+    title_selector="td.b-td-left div.b-title-box a",
+    date_selector="span.b-date",
+    title_mode=TITLE_ATTR,
+    pinned_selector="td.b-num-box.num-notice",
+    list_region=("table", {"class": "board-table"}),
+    ordered_board=True,
+)
+
+# tbody tr 전체를 읽고 .b-date에서 날짜를 가져오는 게시판
+_CMS_BOARD = dict(
+    list_selector="tbody tr",
+    title_selector=".b-title-box a",
+    date_selector=".b-date",
+    list_region=("tbody", {}),
+    ordered_board=True,
+)
+
+# 날짜가 뒤에서 두 번째 칸에 있고 링크가 고정 주소를 쓰는 게시판
+_CMS_TABLE_BOARD = dict(
+    list_selector="table.board-table tbody tr",
+    title_selector=".b-title-box a",
+    date_selector="td:nth-last-child(2)",
+    list_region=("table", {"class": "board-table"}),
+)
+
+# ordered_board=True는 고정 공지를 구분할 수 있는 게시판만 지정합니다.
+# 고정 공지 표시가 없는 게시판(법과대학, 행정학과, SW중심대학)은 기본값(False)으로 끝까지 읽습니다.
+BOARD_TEMPLATES: Dict[ScraperType, BoardTemplate] = {
+    ScraperType.SOCIALSCIENCE_ACADEMIC: BoardTemplate(
+        **_SOCIAL_BOARD,
+        date_fallback_selectors=("td:nth-child(4)",),
+        base_url="https://social.kookmin.ac.kr",
+    ),
+    ScraperType.PHYSICALEDUCATION_ACADEMIC: BoardTemplate(
+        **_SOCIAL_BOARD,
+        pinned_text="공지",
+        base_url="https://sport.kookmin.ac.kr",
+    ),
+    ScraperType.SOCIALSCIENCE_COMMUNICATION_ADVERTISING_ACADEMIC: BoardTemplate(
+        **_SOCIAL_BOARD,
+        date_fallback_selectors=("td:last-child",),
+        base_url="https://adpr.kookmin.ac.kr",
+    ),
+    ScraperType.GLOBALHUMANITIES_EURASIAN_ACADEMIC: BoardTemplate(
+        **{**_SOCIAL_BOARD, "list_selector": "table.board-table > tbody > tr"},
+        pinned_row_class="b-top-box",
+        date_fallback_selectors=("td:nth-child(4)",),
+        base_url="https://cms.kookmin.ac.kr",
+    ),
+    ScraperType.COSS_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.FUTUREMOBILITY_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.NCCOSS_GENERAL: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.DESIGN_AUTOMOTIVE_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.SOCIALSCIENCE_COMMUNICATION_MEDIA_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.SOCIALSCIENCE_SOCIOLOGY_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_CLEAN,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.SOCIALSCIENCE_POLITICALSCIENCE_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        title_mode=TITLE_TEXT_RAW,
+        pinned_selector=".b-num-box.num-notice",
+    ),
+    ScraperType.SOCIALSCIENCE_EDUCATION_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        pinned_row_class="b-top-box",
+    ),
+    ScraperType.CREATIVEENGINEERING_ADVANCEDMATERIALS_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        pinned_row_class="b-top-box",
+    ),
+    ScraperType.CREATIVEENGINEERING_CIVIL_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        pinned_row_class="b-top-box",
+    ),
+    ScraperType.SCIENCETECHNOLOGY_SECURITY_ACADEMIC: BoardTemplate(
+        **_CMS_BOARD,
+        pinned_selector=".b-num-box span",
+        pinned_text="공지",
+    ),
+    ScraperType.DESIGN_INDUSTRIAL_ACADEMIC: BoardTemplate(
+        **_CMS_TABLE_BOARD,
+        link_base="http://cms.kookmin.ac.kr/id/intro/notice.do",
+        pinned_selector=".num-notice",
+        mark_pinned=False,
+        ordered_board=True,
+    ),
+    ScraperType.DESIGN_VISUAL_ACADEMIC: BoardTemplate(
+        **_CMS_TABLE_BOARD,
+        link_base="http://cms.kookmin.ac.kr/vcd/etc-board/vcdnotice.do",
+        pinned_selector=".num-notice",
+        mark_pinned=False,
+        ordered_board=True,
+    ),
+    ScraperType.LAW_ACADEMIC: BoardTemplate(
+        **_CMS_TABLE_BOARD,
+        link_base="https://law.kookmin.ac.kr/law/etc-board/notice01.do",
+    ),
+    ScraperType.SOCIALSCIENCE_PUBLICADMINISTRATION_ACADEMIC: BoardTemplate(
+        **_CMS_TABLE_BOARD,
+        title_mode=TITLE_TEXT_RAW,
+        article_param="articleNo",
+    ),
+    ScraperType.SOFTWARECENTERED_ACADEMIC: BoardTemplate(
+        list_selector="table tbody tr",
+        title_selector=".b-title-box a",
+        date_selector="td:nth-child(6)",
+        title_mode=TITLE_TEXT_RAW,
+        article_param="articleNo",
+        list_region=("table", {}),
+    ),
+}
+
+# 선택자는 프로세스당 한 번만 컴파일합니다
+_compiled_templates: Dict[ScraperType, CompiledBoardTemplate] = {}
+
+
+def get_board_template(scraper_type: ScraperType) -> CompiledBoardTemplate:
+    """스크래퍼 타입의 컴파일된 게시판 템플릿을 반환합니다.
+
+    Raises:
+        KeyError: 템플릿이 등록되지 않은 스크래퍼 타입인 경우
+    """
+    compiled = _compiled_templates.get(scraper_type)
+    if compiled is None:
+        compiled = BOARD_TEMPLATES[scraper_type].compile()
+        _compiled_templates[scraper_type] = compiled
+    return compiled
@@ -1,13 +1,39 @@
-import logging
-from pymongo import MongoClient
+import time
+from datetime import datetime, timezone
+from typing import List
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import DuplicateKeyError
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from config.env_loader import ENV
+from config.logger_config import setup_logger
+from utils.metrics import MONGO_SECONDS
 
-logger = logging.getLogger(__name__)
+logger = setup_logger(__name__)
 
 IS_PROD = ENV["IS_PROD"]  # env_loader에서 가져옴
 
+# mongomock:// 주소일 때 프로세스 안에서 공유하는 메모리 DB 클라이언트
+MOCK_URI_PREFIX = "mongomock://"
+_mock_client = None
+
+
+def _get_client():
+    """MONGODB_URI에 맞는 MongoDB 클라이언트를 반환합니다.
+
+    mongomock:// 주소이면 네트워크 없이 메모리 DB를 사용합니다 (오프라인 재생용, mongomock 선택 설치).
+    메모리 DB는 클라이언트마다 데이터가 따로이므로 하나를 만들어 계속 씁니다.
+    """
+    global _mock_client
+    uri = ENV["MONGODB_URI"]
+    if uri and uri.startswith(MOCK_URI_PREFIX):
+        if _mock_client is None:
+            import mongomock
+
+            _mock_client = mongomock.MongoClient()
+        return _mock_client
+    return MongoClient(uri)
+
 
 def get_database(db_name: str = None):
     """MongoDB 데이터베이스 연결을 반환합니다.
@@ -17,7 +43,7 @@ def get_database(db_name: str = None):
             미지정시 환경변수의 DB_NAME 또는 기본값 사용
     """
     try:
-        client = MongoClient(ENV["MONGODB_URI"])
+        client = _get_client()
         default_db = "dev-kookmin-feed" if not IS_PROD else "kookmin-feed"
         db_name = db_name or ENV["DB_NAME"] or default_db
         return client[db_name]
@@ -35,6 +61,8 @@ def get_collection(scraper_type: str, db_name: str = None):
 def close_database():
     """데이터베이스 연결을 종료합니다."""
     try:
+        if ENV["MONGODB_URI"] and ENV["MONGODB_URI"].startswith(MOCK_URI_PREFIX):
+            return
         client = MongoClient(ENV["MONGODB_URI"])
         client.close()
     except Exception as e:
@@ -43,8 +71,13 @@ def close_database():
 
 async def save_notice(
     notice: NoticeData, scraper_type: ScraperType, db_name: str = None
-):
-    """공지사항을 DB에 저장합니다."""
+) -> bool:
+    """공지사항을 DB에 저장합니다.
+
+    Returns:
+        bool: 같은 링크의 공지가 이미 저장되어 있으면(다른 워커가 먼저 저장한 경우 등) False
+    """
+    started = time.perf_counter()
     try:
         collection = get_collection(scraper_type.get_collection_name(), db_name)
         collection.insert_one(
@@ -53,7 +86,46 @@ async def save_notice(
                 "link": notice.link,
                 "published": notice.published.isoformat(),
                 "scraper_type": scraper_type.get_collection_name(),
+                # 요약 전송의 범위 조회에 사용하는 수집 시각 (UTC)
+                "created_at": datetime.now(timezone.utc),
             }
         )
+    except DuplicateKeyError:
+        logger.info("이미 저장된 공지사항입니다: %s", notice.link)
+        return False
     except Exception as e:
         logger.error(f"DB 저장 중 오류 발생: {e}")
+    finally:
+        MONGO_SECONDS.observe(time.perf_counter() - started, operation="save_notice")
+    return True
+
+
+def ensure_notice_indexes(db_name: str = None):
+    """모든 공지사항 컬렉션에 수집 시각(created_at) 인덱스와 링크 고유 인덱스를 생성합니다.
+
+    링크 고유 인덱스는 여러 스크랩 워커가 같은 공지를 동시에 저장해도 한 번만 저장되게 합니다.
+    (기존 컬렉션에 중복 링크가 있으면 생성에 실패하고 오류를 남깁니다.)
+    """
+    db = get_database(db_name)
+    for scraper_type in ScraperType:
+        try:
+            collection = db[scraper_type.get_collection_name()]
+            collection.create_index([("created_at", ASCENDING)])
+            collection.create_index([("link", ASCENDING)], unique=True)
+        except Exception as e:
+            logger.error(
+                f"인덱스 생성 중 오류 발생 ({scraper_type.get_collection_name()}): {e}"
+            )
+
+
+def find_notices_between(
+    collection_name: str, since: datetime, until: datetime, db_name: str = None
+) -> List[dict]:
+    """수집 시각이 [since, until) 범위인 공지사항을 오래된 순으로 반환합니다."""
+    collection = get_collection(collection_name, db_name)
+    return list(
+        collection.find(
+            {"created_at": {"$gte": since, "$lt": until}},
+            {"_id": 0, "title": 1, "link": 1, "published": 1, "created_at": 1},
+        ).sort("created_at", ASCENDING)
+    )
@@ -37,6 +37,53 @@ def load_env_file():
             "DB_NAME": os.getenv("DB_NAME"),
             "DISCORD_TOKEN": os.getenv("DISCORD_TOKEN"),
             "YOUTUBE_API_KEY": os.getenv("YOUTUBE_API_KEY"),
+            # 관리자 보고용 채널 ID (미설정시 로그로만 보고)
+            "ADMIN_CHANNEL_ID": os.getenv("ADMIN_CHANNEL_ID"),
+            # 연속 전송 실패(NotFound/Forbidden) 허용 횟수, 초과시 구독 비활성화
+            "SUBSCRIPTION_FAILURE_LIMIT": int(
+                os.getenv("SUBSCRIPTION_FAILURE_LIMIT", "3")
+            ),
+            # 공지 하나를 동시에 전송할 최대 채널 수
+            "DELIVERY_CONCURRENCY": int(os.getenv("DELIVERY_CONCURRENCY", "10")),
+            # 기본 HTML 파서 백엔드 (html.parser, lxml, selectolax)
+            "HTML_PARSER": os.getenv("HTML_PARSER", "html.parser"),
+            # 스크래퍼 타입별 파서 백엔드 (예: "LAW_ACADEMIC=selectolax,ARTS_ACADEMIC=lxml")
+            "HTML_PARSER_OVERRIDES": os.getenv("HTML_PARSER_OVERRIDES", ""),
+            # 목록 파싱용 프로세스 풀 크기 (0이면 이벤트 루프에서 직접 파싱)
+            "PARSE_POOL_SIZE": int(os.getenv("PARSE_POOL_SIZE", "0")),
+            # 스크래퍼별 단계 시간 기록을 덧붙일 JSON Lines 파일 경로 (미설정시 로그만)
+            "STAGE_TIMING_PATH": os.getenv("STAGE_TIMING_PATH"),
+            # local: 이 프로세스에서 스크래핑, shared: scrape_worker.py가 스크래핑하고 공유 대기열로 전달
+            "SCRAPE_MODE": os.getenv("SCRAPE_MODE", "local"),
+            # 스크랩 워커의 게시판 임대 유지 시간 (초), 워커가 죽으면 이 시간 뒤 다른 워커가 이어받음
+            "LEASE_SECONDS": int(os.getenv("LEASE_SECONDS", "120")),
+            # 페이지 요청 시간 제한 (초)
+            "FETCH_TIMEOUT": float(os.getenv("FETCH_TIMEOUT", "15")),
+            # 호스트별 회로 차단: 연속 실패 허용 횟수, 첫 대기 시간/최대 대기 시간 (초)
+            "CIRCUIT_FAILURE_THRESHOLD": int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3")),
+            "CIRCUIT_BASE_BACKOFF": float(os.getenv("CIRCUIT_BASE_BACKOFF", "600")),
+            "CIRCUIT_MAX_BACKOFF": float(os.getenv("CIRCUIT_MAX_BACKOFF", "21600")),
+            # 게시판별 확인 일정 파일 (작동 시간, 공휴일, 방학/수강신청 기간)
+            "SCHEDULE_PATH": os.getenv(
+                "SCHEDULE_PATH", str(root_dir / "config" / "schedule.json")
+            ),
+            # /metrics 지표 서버 주소 (포트 미설정시 서버를 띄우지 않음)
+            "METRICS_HOST": os.getenv("METRICS_HOST", "127.0.0.1"),
+            "METRICS_PORT": (
+                int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None
+            ),
+            # 로그 출력 형식 (text: 사람이 읽는 한 줄, json: scraper_type/tick_id를 포함한 JSON 한 줄)
+            "LOG_FORMAT": os.getenv("LOG_FORMAT", "text"),
+            # 실행할 스크래퍼 타입 이름 (쉼표로 구분, 미설정시 전체)
+            "ACTIVE_SCRAPERS": {
+                name.strip()
+                for name in os.getenv("ACTIVE_SCRAPERS", "").split(",")
+                if name.strip()
+            },
+            # 확인 틱 하나의 시간 예산 (초, 넘기면 남은 게시판은 다음 틱으로 넘김)
+            "TICK_BUDGET_SECONDS": float(os.getenv("TICK_BUDGET_SECONDS", "50")),
+            # 이벤트 루프 멈춤으로 볼 지연 (초, 0이면 루프 감시를 사용하지 않음)
+            "LOOP_WATCHDOG_THRESHOLD": float(os.getenv("LOOP_WATCHDOG_THRESHOLD", "0.5")),
             # 필요한 다른 환경 변수들도 여기에 추가
         }
     else:
@@ -1,43 +1,160 @@
+import asyncio
+import atexit
+import json
 import logging
+import queue
 import sys
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from config.env_loader import ENV
 
 environment = "DEV" if not ENV["IS_PROD"] else "PROD"  # 기본값은 DEV
 
+# 로그 레코드에 붙일 실행 문맥 (태스크마다 따로 유지됨)
+scraper_type_var: ContextVar[Optional[str]] = ContextVar("scraper_type", default=None)
+tick_id_var: ContextVar[Optional[int]] = ContextVar("tick_id", default=None)
+
+# 태스크별 현재 작업 이름 (ContextVar는 다른 스레드에서 읽을 수 없으므로 루프 감시 스레드용으로 따로 보관)
+_task_activity: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 모든 로거가 공유하는 대기열과, 대기열을 비우며 실제로 출력하는 백그라운드 스레드
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+
+
+def set_task_activity(activity: Optional[str]) -> Optional[str]:
+    """실행 중인 태스크의 현재 작업 이름을 바꾸고 이전 값을 반환합니다."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:  # 이벤트 루프 밖
+        return None
+    if task is None:
+        return None
+    previous = _task_activity.get(task)
+    if activity is None:
+        _task_activity.pop(task, None)
+    else:
+        _task_activity[task] = activity
+    return previous
+
+
+def get_task_activity(task: Optional[asyncio.Task]) -> Optional[str]:
+    """태스크의 현재 작업 이름 (게시판 이름, 명령어 등)을 반환합니다. 다른 스레드에서도 호출할 수 있습니다."""
+    if task is None:
+        return None
+    return _task_activity.get(task)
+
+
+@contextmanager
+def log_context(scraper_type=None, tick_id: Optional[int] = None):
+    """with 블록 안에서 남기는 로그에 scraper_type/tick_id를 붙입니다.
+
+    scraper_type은 태스크의 현재 작업 이름으로도 기록되어 루프 감시(loop_watchdog)가 참고합니다.
+    """
+    tokens = []
+    previous_activity = None
+    if scraper_type is not None:
+        tokens.append((scraper_type_var, scraper_type_var.set(scraper_type.name)))
+        previous_activity = set_task_activity(scraper_type.name)
+    if tick_id is not None:
+        tokens.append((tick_id_var, tick_id_var.set(tick_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+        if scraper_type is not None:
+            set_task_activity(previous_activity)
+
+
+class ContextFilter(logging.Filter):
+    """로그를 남기는 쪽의 문맥(scraper_type, tick_id)을 레코드에 기록합니다.
+
+    대기열에 넣기 전에 호출되어야 하므로 QueueHandler에 붙입니다.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.scraper_type = scraper_type_var.get()
+        record.tick_id = tick_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 출력합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        scraper_type = getattr(record, "scraper_type", None)
+        if scraper_type:
+            entry["scraper_type"] = scraper_type
+        tick_id = getattr(record, "tick_id", None)
+        if tick_id is not None:
+            entry["tick_id"] = tick_id
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _start_listener() -> QueueListener:
+    """stdout/stderr 핸들러를 가진 백그라운드 출력 스레드를 시작합니다."""
+    if ENV["LOG_FORMAT"] == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    # stdout 핸들러 (환경에 따라 DEBUG 또는 INFO 레벨)
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(formatter)
+    stdout_handler.setLevel(logging.INFO if environment == "PROD" else logging.DEBUG)
+
+    # stderr 핸들러 (ERROR 레벨)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.ERROR)
+    stderr_handler.setFormatter(formatter)
+
+    listener = QueueListener(
+        _log_queue, stdout_handler, stderr_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 종료할 때 대기열에 남은 로그를 모두 출력
+    atexit.register(listener.stop)
+    return listener
+
 
 def setup_logger(name: str) -> logging.Logger:
-    """로거를 설정하고 반환합니다."""
+    """로거를 설정하고 반환합니다.
+
+    로거는 레코드를 대기열에 넣기만 하고, 출력(I/O)은 백그라운드 스레드가 맡으므로
+    로그를 남겨도 이벤트 루프가 멈추지 않습니다.
+    """
+    global _listener
     logger = logging.getLogger(name)
 
     # 이미 핸들러가 설정되어 있다면 추가 설정하지 않음
     if logger.handlers:
         return logger
 
-    # 로그 포맷 설정
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    formatter = logging.Formatter(log_format)
-
-    # stdout 핸들러 (환경에 따라 DEBUG 또는 INFO 레벨)
-    stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setFormatter(formatter)
+    if _listener is None:
+        _listener = _start_listener()
 
-    # 환경에 따라 로그 레벨 설정
-    # 로거 레벨과 핸들러 레벨이 있기 때문에, 두개다 설정해야함.
+    # 환경에 따라 로그 레벨 설정 (출력 레벨은 백그라운드 스레드의 핸들러에서 다시 거름)
     if environment.lower() == "prod":
         logger.setLevel(logging.INFO)
-        stdout_handler.setLevel(logging.INFO)
     else:  # development
         logger.setLevel(logging.DEBUG)
-        stdout_handler.setLevel(logging.DEBUG)
-
-    # stderr 핸들러 (ERROR 레벨)
-    stderr_handler = logging.StreamHandler(sys.stderr)
-    stderr_handler.setLevel(logging.ERROR)
-    stderr_handler.setFormatter(formatter)
 
-    # 핸들러 추가
-    logger.addHandler(stdout_handler)
-    logger.addHandler(stderr_handler)
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.addFilter(ContextFilter())
+    logger.addHandler(queue_handler)
 
     # 로거가 상위 로거로 메시지를 전파하지 않도록 설정
     logger.propagate = False
@@ -0,0 +1,8 @@
+from config.env_loader import ENV
+
+# 개발 환경의 게시판 확인 주기 (분)
+# 운영 환경의 주기는 config/schedule.json에서 게시판별로 정합니다 (utils/scheduler.py)
+if ENV["IS_PROD"]:
+    INTERVAL = 10
+else:
+    INTERVAL = 2
@@ -1,7 +1,10 @@
 import discord
+from discord import app_commands
 from utils.scraper_type import ScraperType
 from config.logger_config import setup_logger
 from utils.scraper_category import ScraperCategory
+from utils.http_session import get_session
+from utils.delivery_mode import DeliveryMode
 
 logger = setup_logger(__name__)
 
@@ -88,6 +91,7 @@ class RegisterView(discord.ui.View):
                 channel_name = self.interaction.user.name
                 channel_type = "direct-messages"
                 guild_name = None  # DM은 서버가 없음
+                guild_id = None
             else:
                 # 서버 채널인 경우 관리자 권한 확인
                 if not self.interaction.permissions.administrator:
@@ -99,6 +103,7 @@ class RegisterView(discord.ui.View):
                 channel_name = self.interaction.channel.name
                 channel_type = "server-channels"
                 guild_name = self.interaction.guild.name  # 서버 이름 가져오기
+                guild_id = str(self.interaction.guild.id)
 
             if self.interaction.client.scraper_config.add_scraper(
                 channel_id,
@@ -106,6 +111,7 @@ class RegisterView(discord.ui.View):
                 channel_type,
                 scraper_type,
                 guild_name,
+                guild_id,
             ):
                 # 등록 성공 시 '완료' 메시지로 변경
                 await self.interaction.edit_original_response(content="✅ 완료")
@@ -378,3 +384,182 @@ async def setup(bot):
             await interaction.response.send_message(
                 "알림 목록 조회 중 오류가 발생했습니다.", ephemeral=True
             )
+
+    @bot.tree.command(
+        name="웹훅_전송",
+        description="이 채널의 알림을 봇 대신 웹훅으로 전송하도록 설정합니다",
+    )
+    @app_commands.choices(
+        mode=[
+            app_commands.Choice(name="켜기", value="on"),
+            app_commands.Choice(name="끄기", value="off"),
+        ]
+    )
+    async def configure_webhook(interaction: discord.Interaction, mode: str):
+        """서버 채널의 웹훅 전송 모드를 켜거나 끕니다."""
+        try:
+            if isinstance(interaction.channel, discord.DMChannel):
+                await interaction.response.send_message(
+                    "웹훅 전송은 서버 채널에서만 사용할 수 있습니다.", ephemeral=True
+                )
+                return
+
+            if not interaction.permissions.administrator:
+                await interaction.response.send_message(
+                    "이 명령어는 관리자 권한이 필요합니다.", ephemeral=True
+                )
+                return
+
+            channel_id = str(interaction.channel_id)
+            scraper_config = interaction.client.scraper_config
+
+            if not scraper_config.get_channel_scrapers(channel_id):
+                await interaction.response.send_message(
+                    "먼저 `/게시판_선택`으로 알림을 받을 게시판을 등록해주세요.",
+                    ephemeral=True,
+                )
+                return
+
+            webhook_url = scraper_config.get_webhook(channel_id)
+
+            if mode == "on":
+                if webhook_url:
+                    message = "❗ 이미 웹훅 전송이 설정되어 있습니다."
+                else:
+                    webhook = await interaction.channel.create_webhook(
+                        name="국민대 공지 알리미"
+                    )
+                    scraper_config.set_webhook(channel_id, webhook.url)
+                    message = "✅ 이 채널의 알림을 웹훅으로 전송합니다."
+                    logger.info(
+                        f"웹훅 전송 설정: 채널 ID - {channel_id} | 서버 이름 - {interaction.guild.name} | 채널 이름 - {interaction.channel.name}"
+                    )
+            else:
+                if not webhook_url:
+                    message = "❗ 웹훅 전송이 설정되어 있지 않습니다."
+                else:
+                    try:
+                        webhook = discord.Webhook.from_url(
+                            webhook_url, session=await get_session()
+                        )
+                        await webhook.delete()
+                    except discord.NotFound:
+                        pass
+                    scraper_config.clear_webhook(channel_id)
+                    message = "✅ 이 채널의 알림을 다시 봇으로 전송합니다."
+                    logger.info(
+                        f"웹훅 전송 해제: 채널 ID - {channel_id} | 서버 이름 - {interaction.guild.name} | 채널 이름 - {interaction.channel.name}"
+                    )
+
+            await interaction.response.send_message(message, ephemeral=True)
+
+        except discord.Forbidden:
+            await interaction.response.send_message(
+                "봇에 웹훅 관리 권한이 없습니다.", ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"웹훅 설정 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "웹훅 설정 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="알림_방식",
+        description="선택한 게시판의 알림을 실시간 또는 요약(매시간/매일)으로 받습니다",
+    )
+    @app_commands.describe(time="매일 요약을 받을 시각 (KST, HH:MM, 기본값 09:00)")
+    @app_commands.choices(mode=DeliveryMode.get_choices())
+    async def configure_delivery_mode(
+        interaction: discord.Interaction, mode: str, time: str = "09:00"
+    ):
+        """등록된 게시판의 전송 방식을 설정합니다."""
+        try:
+            is_dm = isinstance(interaction.channel, discord.DMChannel)
+            if not is_dm and not interaction.permissions.administrator:
+                await interaction.response.send_message(
+                    "이 명령어는 관리자 권한이 필요합니다.", ephemeral=True
+                )
+                return
+
+            delivery_mode = DeliveryMode.from_key(mode)
+            if delivery_mode == DeliveryMode.DAILY:
+                try:
+                    hour, minute = (int(part) for part in time.split(":"))
+                    if not (0 <= hour < 24 and 0 <= minute < 60):
+                        raise ValueError
+                    time = f"{hour:02d}:{minute:02d}"
+                except ValueError:
+                    await interaction.response.send_message(
+                        "시각은 HH:MM 형식으로 입력해주세요. (예: 09:00)",
+                        ephemeral=True,
+                    )
+                    return
+
+            channel_id = (
+                str(interaction.user.id) if is_dm else str(interaction.channel_id)
+            )
+            registered_scrapers = (
+                interaction.client.scraper_config.get_channel_scrapers(channel_id)
+            )
+            if not registered_scrapers:
+                await interaction.response.send_message(
+                    "현재 등록된 알림이 없습니다.", ephemeral=True
+                )
+                return
+
+            # 등록된 게시판 선택 메뉴 생성 (디스코드 제한: 최대 25개)
+            options = [discord.SelectOption(label="등록된 모든 게시판", value="all")]
+            options.extend(
+                discord.SelectOption(
+                    label=ScraperType.from_str(scraper).get_korean_name(),
+                    value=scraper,
+                )
+                for scraper in registered_scrapers[:24]
+            )
+            board_select = discord.ui.Select(
+                placeholder="전송 방식을 바꿀 게시판을 선택하세요", options=options
+            )
+
+            async def board_callback(interaction: discord.Interaction):
+                try:
+                    selected = board_select.values[0]
+                    targets = (
+                        registered_scrapers if selected == "all" else [selected]
+                    )
+                    for scraper in targets:
+                        interaction.client.scraper_config.set_delivery_mode(
+                            channel_id,
+                            ScraperType.from_str(scraper),
+                            delivery_mode,
+                            time,
+                        )
+
+                    mode_name = delivery_mode.get_korean_name()
+                    if delivery_mode == DeliveryMode.DAILY:
+                        mode_name = f"{mode_name} ({time} KST)"
+                    logger.info(
+                        f"전송 방식 변경: 채널 ID - {channel_id} | 게시판 - {selected} | 방식 - {mode_name}"
+                    )
+                    await interaction.response.edit_message(
+                        content=f"✅ 선택한 게시판의 알림을 {mode_name}(으)로 전송합니다.",
+                        view=None,
+                    )
+                except Exception as e:
+                    logger.error(f"전송 방식 변경 중 오류 발생: {e}")
+                    await interaction.response.send_message(
+                        "전송 방식 변경 중 오류가 발생했습니다.", ephemeral=True
+                    )
+
+            board_select.callback = board_callback
+            view = discord.ui.View(timeout=180)
+            view.add_item(board_select)
+
+            await interaction.response.send_message(
+                "전송 방식을 바꿀 게시판을 선택해주세요:", view=view, ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"전송 방식 설정 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "전송 방식 설정 중 오류가 발생했습니다.", ephemeral=True
+            )
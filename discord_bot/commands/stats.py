@@ -0,0 +1,249 @@
+import discord
+from discord import app_commands
+from utils.scraper_type import ScraperType
+from utils.latency_tracker import latency_tracker
+from utils.charset import charset_resolver
+from utils.stage_timer import stage_recorder
+from utils.circuit_breaker import circuit_breaker
+from utils.scraper_factory import ScraperFactory
+from utils.loop_watchdog import loop_watchdog
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# 디스코드 메시지 최대 길이
+MESSAGE_LIMIT = 2000
+
+
+def _truncate(message: str) -> str:
+    """디스코드 메시지 길이 제한에 맞게 자릅니다."""
+    if len(message) <= MESSAGE_LIMIT:
+        return message
+    return message[: MESSAGE_LIMIT - 4] + "\n..."
+
+
+async def _check_permission(interaction: discord.Interaction) -> bool:
+    """서버 채널에서는 관리자만 운영 통계를 볼 수 있습니다."""
+    if isinstance(interaction.channel, discord.DMChannel):
+        return True
+    if interaction.permissions.administrator:
+        return True
+    await interaction.response.send_message(
+        "이 명령어는 관리자 권한이 필요합니다.", ephemeral=True
+    )
+    return False
+
+
+async def _is_bot_owner(interaction: discord.Interaction) -> bool:
+    """명령어를 실행한 사용자가 봇 애플리케이션의 소유자(팀이면 팀원)인지 확인합니다."""
+    app = interaction.client.application or await interaction.client.application_info()
+    if app.team:
+        return any(member.id == interaction.user.id for member in app.team.members)
+    return app.owner is not None and app.owner.id == interaction.user.id
+
+
+async def _check_operator(interaction: discord.Interaction) -> bool:
+    """상태를 바꾸는 명령어는 봇 소유자 또는 관리자 채널(ADMIN_CHANNEL_ID)에서만 실행할 수 있습니다."""
+    admin_channel_id = ENV["ADMIN_CHANNEL_ID"]
+    if admin_channel_id and interaction.channel_id == int(admin_channel_id):
+        return True
+    if await _is_bot_owner(interaction):
+        return True
+    await interaction.response.send_message(
+        "이 명령어는 봇 소유자 또는 관리자 채널에서만 사용할 수 있습니다.", ephemeral=True
+    )
+    return False
+
+
+async def setup(bot):
+    """운영 통계 관련 명령어들을 봇에 등록합니다."""
+
+    @bot.tree.command(
+        name="통계_지연",
+        description="공지사항 감지부터 채널 전송까지의 지연 시간 통계를 보여줍니다",
+    )
+    @app_commands.describe(scraper="단계별 지연을 볼 게시판 (미지정시 전체 요약)")
+    async def latency_stats(interaction: discord.Interaction, scraper: str = None):
+        """스크래퍼 타입별/채널별 지연 시간 히스토그램 요약을 보여줍니다."""
+        try:
+            if not await _check_permission(interaction):
+                return
+
+            if scraper:
+                scraper_type = ScraperType.from_str(scraper)
+                lines = latency_tracker.get_stage_summaries(scraper_type)
+                title = f"**{scraper_type.get_korean_name()} 단계별 지연 시간**"
+            else:
+                lines = latency_tracker.get_scraper_summaries()
+                channel_lines = latency_tracker.get_channel_summaries()
+                if channel_lines:
+                    lines += ["", "**채널별 감지→전송 (느린 순)**"] + channel_lines
+                title = "**게시판별 감지→전송 지연 시간 (느린 순)**"
+
+            if not lines:
+                message = "아직 수집된 지연 시간 통계가 없습니다."
+            else:
+                message = title + "\n" + "\n".join(lines)
+
+            await interaction.response.send_message(
+                _truncate(message), ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"지연 시간 통계 조회 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "통계 조회 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="통계_인코딩",
+        description="게시판 페이지의 문자 인코딩 판정 통계를 보여줍니다",
+    )
+    async def charset_stats(interaction: discord.Interaction):
+        """인코딩 판정 출처(헤더/meta/호스트/추측)와 선언 불일치 통계를 보여줍니다."""
+        try:
+            if not await _check_permission(interaction):
+                return
+
+            lines = charset_resolver.get_summary_lines()
+            if not lines:
+                message = "아직 수집된 인코딩 통계가 없습니다."
+            else:
+                message = "**인코딩 판정 통계**\n" + "\n".join(lines)
+
+            await interaction.response.send_message(
+                _truncate(message), ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"인코딩 통계 조회 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "통계 조회 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="통계_단계",
+        description="게시판별 확인 작업의 단계별 소요 시간을 보여줍니다",
+    )
+    async def stage_stats(interaction: discord.Interaction):
+        """평균 확인 시간이 긴 게시판 순으로 가장 느린 단계를 보여줍니다."""
+        try:
+            if not await _check_permission(interaction):
+                return
+
+            lines = stage_recorder.get_summary_lines()
+            if not lines:
+                message = "아직 수집된 단계 시간 통계가 없습니다."
+            else:
+                message = "**게시판별 단계 소요 시간 (느린 순)**\n" + "\n".join(lines)
+
+            await interaction.response.send_message(
+                _truncate(message), ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"단계 시간 통계 조회 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "통계 조회 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="통계_호스트",
+        description="게시판 호스트별 회로 차단 상태를 보여줍니다",
+    )
+    async def circuit_stats(interaction: discord.Interaction):
+        """열린/시험 중인 회로와 실패 이력이 있는 호스트를 보여줍니다."""
+        try:
+            if not await _check_permission(interaction):
+                return
+
+            lines = circuit_breaker.get_summary_lines()
+            if not lines:
+                message = "모든 호스트가 정상입니다."
+            else:
+                message = "**호스트별 회로 상태**\n" + "\n".join(lines)
+
+            await interaction.response.send_message(
+                _truncate(message), ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"회로 상태 조회 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "통계 조회 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="통계_루프",
+        description="이벤트 루프를 오래 멈춘 작업과 호출 위치 순위를 보여줍니다",
+    )
+    async def loop_stats(interaction: discord.Interaction):
+        """멈춘 시간 합계가 큰 순서로 작업(게시판/명령어)과 코드 위치, 가장 심한 원인의 스택을 보여줍니다."""
+        try:
+            if not await _check_permission(interaction):
+                return
+
+            message = loop_watchdog.report()
+            offenders = loop_watchdog.top(1)
+            if offenders and offenders[0].stack:
+                message += "\n\n**1위 스택**\n```\n" + "\n".join(offenders[0].stack) + "\n```"
+
+            await interaction.response.send_message(
+                _truncate(message), ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"이벤트 루프 통계 조회 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "통계 조회 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @bot.tree.command(
+        name="스크래퍼_재설정",
+        description="게시판 템플릿 설정을 다시 읽어 실행 중인 스크래퍼에 적용합니다",
+    )
+    @app_commands.describe(scraper="특정 게시판만 다시 적용 (생략하면 전체)")
+    async def reload_scrapers(interaction: discord.Interaction, scraper: str = None):
+        """config/board_templates.py를 다시 읽고, 재사용 중인 스크래퍼의 페이지 상태를 초기화합니다."""
+        try:
+            if not await _check_operator(interaction):
+                return
+
+            scraper_type = None
+            if scraper:
+                scraper_type = ScraperType.from_str(scraper)
+                if not scraper_type:
+                    await interaction.response.send_message(
+                        "올바르지 않은 스크래퍼 타입입니다.", ephemeral=True
+                    )
+                    return
+
+            reloaded = ScraperFactory().reload(scraper_type)
+            await interaction.response.send_message(
+                f"스크래퍼 {reloaded}개에 설정을 다시 적용했습니다.", ephemeral=True
+            )
+
+        except Exception as e:
+            logger.error(f"스크래퍼 재설정 중 오류 발생: {e}")
+            await interaction.response.send_message(
+                "스크래퍼 재설정 중 오류가 발생했습니다.", ephemeral=True
+            )
+
+    @reload_scrapers.autocomplete("scraper")
+    async def reload_autocomplete(interaction: discord.Interaction, current: str):
+        """실행 중인 스크래퍼 중 입력과 일치하는 게시판을 제안합니다."""
+        return [
+            app_commands.Choice(name=scraper_type.get_korean_name(), value=scraper_type.name)
+            for scraper_type in ScraperFactory().get_cached_types()
+            if current in scraper_type.get_korean_name()
+        ][:25]
+
+    @latency_stats.autocomplete("scraper")
+    async def scraper_autocomplete(interaction: discord.Interaction, current: str):
+        """통계가 있는 게시판 중 입력과 일치하는 게시판을 제안합니다."""
+        return [
+            app_commands.Choice(name=scraper_type.get_korean_name(), value=scraper_type.name)
+            for scraper_type in latency_tracker.by_scraper
+            if current in scraper_type.get_korean_name()
+        ][:25]
@@ -8,7 +8,6 @@ from config.logger_config import setup_logger
 from web_scraper.rss_notice_scraper import RSSNoticeScraper
 import feedparser
 import aiohttp
-from bs4 import BeautifulSoup
 from utils.scraper_factory import ScraperFactory
 
 logger = setup_logger(__name__)
@@ -265,7 +264,7 @@ async def setup(bot):
                 )
             else:
                 # HTML 파싱
-                soup = BeautifulSoup(html, "html.parser")
+                soup = scraper.parse_html(html)
                 elements = scraper.get_list_elements(soup)
                 if not elements:
                     raise Exception("공지사항 목록을 찾을 수 없습니다")
@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import discord
+import pytz
+from config.db_config import find_notices_between
+from config.logger_config import setup_logger
+from discord_bot.discord_bot import client, deliver
+from utils.delivery_mode import DeliveryMode
+from utils.scraper_type import ScraperType
+
+logger = setup_logger(__name__)
+
+KST = pytz.timezone("Asia/Seoul")
+
+# 임베드 한 개(페이지)에 담을 공지사항 수, 메시지 한 개에 담을 임베드 수 (디스코드 제한 10개)
+NOTICES_PER_PAGE = 10
+EMBEDS_PER_MESSAGE = 10
+# 메시지 한 개에 담긴 임베드 글자 수 합계 제한 (디스코드 제한 6000자)
+EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """MongoDB에서 읽은 naive UTC datetime을 aware datetime으로 변환합니다."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def get_due_window(
+    setting: dict, now: datetime
+) -> Optional[Tuple[datetime, datetime]]:
+    """요약 전송 시점이 되었으면 조회할 수집 시각 범위 [since, until)를 반환합니다.
+
+    Args:
+        setting (dict): `delivery_modes.<collection_name>`에 저장된 설정
+        now (datetime): 현재 시각 (KST)
+
+    Returns:
+        Optional[Tuple[datetime, datetime]]: UTC 기준 범위, 아직 전송 시점이 아니면 None
+    """
+    mode = DeliveryMode.from_key(setting.get("mode"))
+    if mode == DeliveryMode.HOURLY:
+        until = now.replace(minute=0, second=0, microsecond=0)
+        period = timedelta(hours=1)
+    elif mode == DeliveryMode.DAILY:
+        hour, minute = (int(part) for part in setting.get("time", "09:00").split(":"))
+        until = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if until > now:
+            until -= timedelta(days=1)
+        period = timedelta(days=1)
+    else:
+        return None
+
+    until = until.astimezone(timezone.utc)
+    last_sent = _as_utc(setting.get("last_sent"))
+    if last_sent is not None and last_sent >= until:
+        return None
+
+    # 마지막 전송 이후부터, 단 최대 한 주기까지만 모아서 전송
+    since = until - period
+    if last_sent is not None and last_sent > since:
+        since = last_sent
+    return since, until
+
+
+def build_digest_embeds(
+    scraper_type: ScraperType, mode: DeliveryMode, notices: List[dict]
+) -> List[discord.Embed]:
+    """공지사항 목록을 페이지 단위 임베드로 나눕니다."""
+    pages = [
+        notices[i : i + NOTICES_PER_PAGE]
+        for i in range(0, len(notices), NOTICES_PER_PAGE)
+    ]
+    embeds = []
+    for page_number, page in enumerate(pages, start=1):
+        lines = []
+        for notice in page:
+            published = datetime.fromisoformat(notice["published"])
+            date_text = (
+                f" ({published.strftime('%Y-%m-%d')})" if published.year > 1970 else ""
+            )
+            lines.append(f"• [{notice['title'][:150]}]({notice['link']}){date_text}")
+
+        embed = discord.Embed(
+            title=f"{scraper_type.get_korean_name()} {mode.get_korean_name()}",
+            description="\n".join(lines),
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(
+            text=f"{page_number}/{len(pages)} 페이지 · 총 {len(notices)}개의 공지사항"
+        )
+        embeds.append(embed)
+    return embeds
+
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """임베드를 메시지 단위로 묶습니다.
+
+    메시지 하나에는 임베드 EMBEDS_PER_MESSAGE개, 글자 수 합계(len(embed)) EMBED_CHARS_PER_MESSAGE자까지 담습니다.
+    """
+    messages: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (
+            len(current) >= EMBEDS_PER_MESSAGE or chars + size > EMBED_CHARS_PER_MESSAGE
+        ):
+            messages.append(current)
+            current, chars = [], 0
+        current.append(embed)
+        chars += size
+    if current:
+        messages.append(current)
+    return messages
+
+
+async def send_due_digests():
+    """전송 시점이 된 요약 구독에 공지사항 요약을 전송합니다.
+
+    같은 게시판·같은 범위의 조회 결과는 구독자 간에 공유하므로
+    구독자 수와 관계없이 게시판·범위마다 한 번만 DB를 조회합니다.
+    """
+    await client.wait_until_ready()
+
+    now = datetime.now(KST)
+    aggregates: Dict[Tuple[str, datetime, datetime], List[dict]] = {}
+
+    for subscription in client.scraper_config.get_digest_subscriptions():
+        channel_id = subscription["_id"]
+        for collection_name, setting in subscription.get("delivery_modes", {}).items():
+            try:
+                window = get_due_window(setting, now)
+                if window is None:
+                    continue
+
+                since, until = window
+                key = (collection_name, since, until)
+                if key not in aggregates:
+                    aggregates[key] = find_notices_between(collection_name, since, until)
+                notices = aggregates[key]
+
+                delivered = True
+                if notices:
+                    scraper_type = ScraperType.from_str(collection_name)
+                    mode = DeliveryMode.from_key(setting["mode"])
+                    embeds = build_digest_embeds(scraper_type, mode, notices)
+                    sent_pages = 0
+                    for message in pack_embeds(embeds):
+                        delivered = await deliver(
+                            subscription,
+                            message,
+                            f"{scraper_type.get_korean_name()} 요약 {len(notices)}건",
+                        )
+                        if not delivered:
+                            break
+                        sent_pages += len(message)
+                        # 메시지마다 진행 상황을 기록해, 실패 후 다시 전송할 때
+                        # 이미 보낸 공지사항은 건너뛰고 남은 공지사항부터 전송
+                        sent_count = sent_pages * NOTICES_PER_PAGE
+                        if sent_count < len(notices):
+                            client.scraper_config.mark_digest_sent(
+                                channel_id,
+                                collection_name,
+                                _as_utc(notices[sent_count]["created_at"]),
+                            )
+
+                # 전송에 실패하면 남은 범위를 그대로 두어 다음 확인 때 다시 전송
+                if not delivered:
+                    continue
+
+                # 공지사항이 없어도 다음 범위로 넘어가도록 전송 시각 기록
+                client.scraper_config.mark_digest_sent(channel_id, collection_name, until)
+
+            except Exception as e:
+                logger.error(
+                    f"요약 전송 중 오류 발생 (채널: {channel_id}, 게시판: {collection_name}): {e}"
+                )
@@ -1,9 +1,15 @@
+import asyncio
+from typing import List, Optional
 import discord
 from discord import app_commands
 from discord_bot.scraper_config import ScraperConfig
+from discord_bot.permission_cache import ChannelPermissionCache
 from utils.scraper_type import ScraperType
 from template.notice_data import NoticeData
-from config.logger_config import setup_logger
+from config.logger_config import set_task_activity, setup_logger
+from utils.http_session import get_session
+from utils.latency_tracker import latency_tracker
+from utils.metrics import DISCORD_SENDS
 from config.env_loader import (
     ENV,
 )  # db_config에서 가져오는 대신 직접 env_loader에서 가져옴
@@ -15,13 +21,33 @@ intents = discord.Intents.default()
 intents.guilds = True  # 서버 목록 확인용
 intents.dm_messages = True  # DM 메시지 허용
 
+# 한 공지사항을 동시에 전송할 최대 채널 수
+# (Python 3.9 이하의 Semaphore는 만들 때의 이벤트 루프에 묶이므로 처음 전송할 때 생성)
+_delivery_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_delivery_semaphore() -> asyncio.Semaphore:
+    global _delivery_semaphore
+    if _delivery_semaphore is None:
+        _delivery_semaphore = asyncio.Semaphore(ENV["DELIVERY_CONCURRENCY"])
+    return _delivery_semaphore
+
+
+class NoticeCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """명령어를 실행하는 태스크에 명령어 이름을 기록합니다 (루프 감시가 멈춘 원인으로 사용)."""
+        if interaction.command is not None:
+            set_task_activity(f"/{interaction.command.name}")
+        return True
+
 
 class NoticeBot(discord.Client):  # discord.Client 클래스를 상속받음
     def __init__(self):
         # intents 봇이 어떤 이벤트를 받을 수 있는지 지정
         super().__init__(intents=intents)
-        self.tree = app_commands.CommandTree(self)
+        self.tree = NoticeCommandTree(self)
         self.scraper_config = ScraperConfig()
+        self.permission_cache = ChannelPermissionCache()
 
     async def setup_hook(self):
         """봇 시작시 실행되는 설정"""
@@ -30,10 +56,11 @@ class NoticeBot(discord.Client):  # discord.Client 클래스를 상속받음
 
     async def load_commands(self):
         """commands 폴더의 모든 명령어를 로드합니다."""
-        from discord_bot.commands import register, test
+        from discord_bot.commands import register, stats, test
 
         # 각 명령어 모듈 등록
         await register.setup(self)
+        await stats.setup(self)
 
         if not ENV["IS_PROD"]:  # IS_PROD 대신 ENV["IS_PROD"] 사용
             await test.setup(self)
@@ -68,61 +95,233 @@ async def on_guild_join(guild):
         logger.error(f"서버 [{guild.name}]에 슬래시 커맨드 등록 실패: {e}")
 
 
-async def send_notice(notice: NoticeData, scraper_type: ScraperType):
-    """특정 스크래퍼의 공지사항을 해당하는 모든 채널에 전송합니다."""
+@client.event
+async def on_guild_remove(guild):
+    """봇이 서버에서 나가면 해당 서버 채널들의 구독을 비활성화합니다."""
+    logger.info(f"서버 [{guild.name}]에서 나갔습니다.")
+    client.permission_cache.invalidate_guild(guild)
     try:
-        await client.wait_until_ready()
+        channel_ids = [str(channel.id) for channel in guild.channels]
+        disabled = client.scraper_config.disable_channels(channel_ids, "guild_removed")
+        if disabled:
+            await report_to_admin(
+                f"서버 [{guild.name}]에서 나가 {disabled}개 채널의 구독을 비활성화했습니다."
+            )
+    except Exception as e:
+        logger.error(f"서버 [{guild.name}] 구독 정리 중 오류: {e}")
+
+
+@client.event
+async def on_guild_channel_update(before, after):
+    """채널 설정(권한 덮어쓰기 등)이 바뀌면 해당 채널의 권한 캐시를 무효화합니다."""
+    client.permission_cache.invalidate_channel(after.id)
+
+
+@client.event
+async def on_guild_role_update(before, after):
+    """역할 권한이 바뀌면 해당 서버 채널들의 권한 캐시를 무효화합니다."""
+    client.permission_cache.invalidate_guild(after.guild)
+
+
+@client.event
+async def on_member_update(before, after):
+    """봇의 역할이 바뀌면 해당 서버 채널들의 권한 캐시를 무효화합니다.
+
+    members 인텐트가 활성화된 경우에만 수신됩니다.
+    """
+    if after.id == client.user.id:
+        client.permission_cache.invalidate_guild(after.guild)
+
+
+async def report_to_admin(message: str):
+    """관리자 채널(ADMIN_CHANNEL_ID)과 로그에 운영 보고를 남깁니다."""
+    logger.warning(f"[관리자 보고] {message}")
+    if not ENV["ADMIN_CHANNEL_ID"]:
+        return
+    try:
+        channel = client.get_channel(int(ENV["ADMIN_CHANNEL_ID"]))
+        if channel:
+            await channel.send(f"📋 {message}")
+    except Exception as e:
+        logger.error(f"관리자 보고 전송 중 오류: {e}")
+
+
+async def handle_delivery_failure(channel_id: str, reason: str):
+    """NotFound/Forbidden(권한 없음 포함) 실패를 기록하고, 구독이 비활성화되면 관리자에게 보고합니다."""
+    if client.scraper_config.record_delivery_failure(channel_id, reason):
+        await report_to_admin(
+            f"채널/사용자 ID {channel_id}의 구독을 비활성화했습니다. "
+            f"(연속 {ENV['SUBSCRIPTION_FAILURE_LIMIT']}회 실패, 사유: {reason})"
+        )
+
+
+def build_notice_embed(notice: NoticeData, scraper_type: ScraperType) -> discord.Embed:
+    """공지사항 알림 임베드를 생성합니다."""
+    embed = discord.Embed(
+        title=notice.title, url=notice.link, color=discord.Color.blue()
+    )
 
-        channels = client.scraper_config.get_channels_for_scraper(scraper_type)
-        for channel_id in channels:
+    # 공지사항 종류 표시
+    embed.add_field(name="구분", value=scraper_type.get_korean_name(), inline=True)
+
+    if notice.published.year > 1970:
+        embed.add_field(
+            name="작성일",
+            value=notice.published.strftime("%Y-%m-%d"),
+            inline=True,
+        )
+    return embed
+
+
+async def send_via_webhook(
+    channel_id: str, webhook_url: str, embeds: List[discord.Embed], summary: str
+) -> bool:
+    """웹훅으로 임베드 메시지를 전송합니다.
+
+    웹훅은 봇의 전역 전송 제한과 별개로 웹훅마다 rate limit 버킷을 가지므로
+    공유 HTTP 세션 위에서 채널 수만큼 병렬로 전송할 수 있습니다.
+
+    Returns:
+        bool: 전송에 성공했으면 True, 웹훅이 삭제되어 봇 전송으로 대체해야 하면 False
+    """
+    try:
+        webhook = discord.Webhook.from_url(webhook_url, session=await get_session())
+        await webhook.send(
+            embeds=embeds,
+            username=client.user.name,
+            avatar_url=client.user.display_avatar.url,
+        )
+        client.scraper_config.record_delivery_success(channel_id)
+        logger.info(f"웹훅 [{channel_id}]으로 전송했습니다: {summary}")
+        DISCORD_SENDS.inc(method="webhook", result="success")
+        return True
+    except (discord.NotFound, discord.Forbidden):
+        # 웹훅이 삭제되었거나 토큰이 무효화된 경우 봇 전송으로 되돌림
+        DISCORD_SENDS.inc(method="webhook", result="failure", reason="webhook_gone")
+        logger.warning(f"채널 [{channel_id}]의 웹훅이 삭제되어 봇 전송으로 전환합니다.")
+        client.scraper_config.clear_webhook(channel_id)
+        return False
+
+
+def _count_bot_failure(reason: str):
+    DISCORD_SENDS.inc(method="bot", result="failure", reason=reason)
+
+
+async def send_via_bot(
+    channel_id: str, embeds: List[discord.Embed], summary: str
+) -> bool:
+    """봇 계정으로 채널 또는 DM에 임베드 메시지를 전송합니다.
+
+    Returns:
+        bool: 전송에 성공했으면 True
+    """
+    channel = None
+    try:
+        # 전송 불가로 캐싱된 채널은 조회 없이 건너뜀 (연속 실패로는 계속 집계해 구독 비활성화 기준에 반영)
+        if client.permission_cache.is_known_unusable(int(channel_id)):
+            _count_bot_failure("unusable_cached")
+            await handle_delivery_failure(channel_id, "forbidden")
+            return False
+
+        channel = client.get_channel(int(channel_id))
+        if not channel:
             try:
-                channel = client.get_channel(int(channel_id))
+                user = await client.fetch_user(int(channel_id))
+                channel = user.dm_channel
                 if not channel:
-                    try:
-                        user = await client.fetch_user(int(channel_id))
-                        channel = user.dm_channel
-                        if not channel:
-                            channel = await user.create_dm()
-                    except:
-                        logger.warning(f"사용자 ID {channel_id}를 찾을 수 없습니다.")
-                        continue
-
-                if not isinstance(channel, discord.DMChannel):
-                    permissions = channel.permissions_for(channel.guild.me)
-                    if not permissions.send_messages or not permissions.embed_links:
-                        logger.warning(
-                            f"채널 [{channel.name}]에 메시지를 보낼 권한이 없습니다."
-                        )
-                        continue
-
-                embed = discord.Embed(
-                    title=notice.title, url=notice.link, color=discord.Color.blue()
-                )
-
-                # 공지사항 종류 표시
-                embed.add_field(
-                    name="구분", value=scraper_type.get_korean_name(), inline=True
-                )
-
-                if notice.published.year > 1970:
-                    embed.add_field(
-                        name="작성일",
-                        value=notice.published.strftime("%Y-%m-%d"),
-                        inline=True,
-                    )
-
-                await channel.send(embed=embed)
-                logger.info(
-                    f'채널 [{getattr(channel, "name", "DM")}]에 공지사항을 전송했습니다: {notice.title}'
-                )
-
-            except discord.Forbidden:
-                logger.warning(
-                    f'채널 [{getattr(channel, "name", "DM")}]에 메시지를 보낼 권한이 없습니다.'
-                )
+                    channel = await user.create_dm()
             except discord.NotFound:
-                logger.warning(f"채널 ID {channel_id}가 존재하지 않습니다.")
-            except Exception as e:
-                logger.error(f"채널 [{channel_id}] 메시지 전송 중 오류: {str(e)}")
+                # 삭제된 채널이거나 존재하지 않는 사용자
+                logger.warning(f"사용자 ID {channel_id}를 찾을 수 없습니다.")
+                _count_bot_failure("user_not_found")
+                await handle_delivery_failure(channel_id, "not_found")
+                return False
+            except Exception:
+                logger.warning(f"사용자 ID {channel_id}를 찾을 수 없습니다.")
+                _count_bot_failure("lookup_error")
+                return False
+
+        if not isinstance(
+            channel, discord.DMChannel
+        ) and not client.permission_cache.is_usable(channel):
+            _count_bot_failure("no_permission")
+            await handle_delivery_failure(channel_id, "forbidden")
+            return False
+
+        await channel.send(embeds=embeds)
+        client.scraper_config.record_delivery_success(channel_id)
+        logger.info(
+            f'채널 [{getattr(channel, "name", "DM")}]에 전송했습니다: {summary}'
+        )
+        DISCORD_SENDS.inc(method="bot", result="success")
+        return True
+
+    except discord.Forbidden:
+        # 캐시와 실제 권한이 어긋난 경우 다음 이벤트 전까지 전송 불가로 기록
+        if channel and not isinstance(channel, discord.DMChannel):
+            client.permission_cache.mark_unusable(channel.id)
+        logger.warning(
+            f'채널 [{getattr(channel, "name", "DM")}]에 메시지를 보낼 권한이 없습니다.'
+        )
+        _count_bot_failure("forbidden")
+        await handle_delivery_failure(channel_id, "forbidden")
+    except discord.NotFound:
+        logger.warning(f"채널 ID {channel_id}가 존재하지 않습니다.")
+        _count_bot_failure("not_found")
+        await handle_delivery_failure(channel_id, "not_found")
+    return False
+
+
+async def deliver(
+    subscription: dict,
+    embeds: List[discord.Embed],
+    summary: str,
+    notice: Optional[NoticeData] = None,
+) -> bool:
+    """구독 하나에 임베드 메시지를 전송합니다. 웹훅이 설정되어 있으면 웹훅을 우선 사용합니다.
+
+    notice가 주어지면 전송 완료 시각을 지연 시간 통계에 기록합니다.
+
+    Returns:
+        bool: 전송에 성공했으면 True
+    """
+    channel_id = subscription["_id"]
+    async with _get_delivery_semaphore():
+        try:
+            webhook_url = subscription.get("webhook_url")
+            delivered = bool(webhook_url) and await send_via_webhook(
+                channel_id, webhook_url, embeds, summary
+            )
+            if not delivered:
+                delivered = await send_via_bot(channel_id, embeds, summary)
+        except Exception as e:
+            logger.error(f"채널 [{channel_id}] 메시지 전송 중 오류: {str(e)}")
+            DISCORD_SENDS.inc(
+                method="webhook" if subscription.get("webhook_url") else "bot",
+                result="failure",
+                reason="error",
+            )
+            return False
+
+    if delivered and notice is not None:
+        latency_tracker.mark_delivered(notice, channel_id)
+    return delivered
+
+
+async def send_notice(notice: NoticeData, scraper_type: ScraperType):
+    """특정 스크래퍼의 공지사항을 해당하는 모든 채널에 병렬로 전송합니다."""
+    try:
+        await client.wait_until_ready()
+
+        subscriptions = client.scraper_config.get_subscriptions_for_scraper(
+            scraper_type
+        )
+        embed = build_notice_embed(notice, scraper_type)
+        await asyncio.gather(
+            *(
+                deliver(subscription, [embed], notice.title, notice)
+                for subscription in subscriptions
+            )
+        )
     except Exception as e:
         logger.error(f"디스코드 메시지 전송 중 오류 발생: {e}")
@@ -0,0 +1,53 @@
+from typing import Dict
+import discord
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ChannelPermissionCache:
+    """서버 채널별 전송 가능 여부를 캐싱하는 클래스
+
+    채널마다 `permissions_for` 계산 결과(메시지 전송 + 임베드 링크 권한)를 저장해두고,
+    권한에 영향을 주는 게이트웨이 이벤트가 들어올 때만 무효화합니다.
+    전송 불가로 판정된 채널은 무효화 전까지 공지마다 다시 계산하거나 로그를 남기지 않습니다.
+    """
+
+    def __init__(self):
+        self._usable: Dict[int, bool] = {}
+
+    def is_known_unusable(self, channel_id: int) -> bool:
+        """전송 불가로 캐싱된 채널인지 반환합니다."""
+        return self._usable.get(channel_id) is False
+
+    def is_usable(self, channel: discord.abc.GuildChannel) -> bool:
+        """채널에 공지를 보낼 수 있는지 반환합니다. 캐시가 없으면 계산 후 저장합니다."""
+        cached = self._usable.get(channel.id)
+        if cached is not None:
+            return cached
+
+        permissions = channel.permissions_for(channel.guild.me)
+        usable = permissions.send_messages and permissions.embed_links
+        self._usable[channel.id] = usable
+
+        if not usable:
+            # 전송 불가 판정은 캐시가 무효화될 때까지 한 번만 기록
+            logger.warning(f"채널 [{channel.name}]에 메시지를 보낼 권한이 없습니다.")
+        return usable
+
+    def mark_unusable(self, channel_id: int):
+        """실제 전송에서 권한 오류가 난 채널을 전송 불가로 기록합니다."""
+        self._usable[channel_id] = False
+
+    def invalidate_channel(self, channel_id: int):
+        """특정 채널의 캐시를 무효화합니다."""
+        self._usable.pop(channel_id, None)
+
+    def invalidate_guild(self, guild: discord.Guild):
+        """서버에 속한 모든 채널의 캐시를 무효화합니다."""
+        for channel in guild.channels:
+            self._usable.pop(channel.id, None)
+
+    def clear(self):
+        """전체 캐시를 비웁니다."""
+        self._usable.clear()
@@ -1,7 +1,10 @@
-from typing import List
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 from config.db_config import get_database
+from config.env_loader import ENV
 from config.logger_config import setup_logger
 from utils.scraper_type import ScraperType
+from utils.delivery_mode import DeliveryMode
 
 logger = setup_logger(__name__)
 
@@ -13,26 +16,100 @@ class ScraperConfig:
         self.db = get_database(db_name="notification-recipient")
         self.dm_collection = self.db["direct-messages"]
         self.server_channel_collection = self.db["server-channels"]
+        # 채널별 연속 전송 실패 횟수 (성공하면 초기화)
+        self.failure_counts: Dict[str, int] = {}
 
-    def get_channels_for_scraper(self, scraper_type: ScraperType) -> list:
-        """특정 스크래퍼에 등록된 채널 목록을 반환합니다."""
-        channels = []
+    def get_subscriptions_for_scraper(self, scraper_type: ScraperType) -> List[dict]:
+        """특정 스크래퍼의 실시간 구독 문서(_id, webhook_url) 목록을 반환합니다.
+
+        비활성화된 구독과 요약 전송으로 설정된 구독은 제외합니다.
+        """
+        collection_name = scraper_type.get_collection_name()
+        query = {
+            "scrapers": collection_name,
+            "disabled": {"$ne": True},
+            # 요약(digest) 전송으로 설정된 구독은 실시간 전송에서 제외
+            f"delivery_modes.{collection_name}": {"$exists": False},
+        }
 
         # DM 채널 검색
-        dm_cursor = self.db["direct-messages"].find(
-            {"scrapers": scraper_type.get_collection_name()}
-        )
-        for doc in dm_cursor:
-            channels.append(doc["_id"])
+        subscriptions = list(self.dm_collection.find(query, {"_id": 1}))
 
         # 서버 채널 검색
-        server_cursor = self.db["server-channels"].find(
-            {"scrapers": scraper_type.get_collection_name()}
+        subscriptions.extend(
+            self.server_channel_collection.find(query, {"_id": 1, "webhook_url": 1})
         )
-        for doc in server_cursor:
-            channels.append(doc["_id"])
+        return subscriptions
+
+    def get_channels_for_scraper(self, scraper_type: ScraperType) -> list:
+        """특정 스크래퍼의 실시간 구독 채널 목록을 반환합니다."""
+        return [doc["_id"] for doc in self.get_subscriptions_for_scraper(scraper_type)]
+
+    def set_delivery_mode(
+        self,
+        channel_id: str,
+        scraper_type: ScraperType,
+        mode: DeliveryMode,
+        send_time: str = None,
+    ) -> bool:
+        """채널에 등록된 스크래퍼의 전송 방식을 설정합니다.
+
+        Args:
+            send_time (str, optional): 매일 요약의 전송 시각 (KST, "HH:MM")
+        """
+        field = f"delivery_modes.{scraper_type.get_collection_name()}"
+        if mode == DeliveryMode.REALTIME:
+            update = {"$unset": {field: ""}}
+        else:
+            setting = {"mode": mode.get_key()}
+            if mode == DeliveryMode.DAILY:
+                setting["time"] = send_time
+            update = {"$set": {field: setting}}
+
+        query = {"_id": channel_id, "scrapers": scraper_type.get_collection_name()}
+        for collection in (self.dm_collection, self.server_channel_collection):
+            if collection.update_one(query, update).matched_count:
+                return True
+        return False
 
-        return channels
+    def get_digest_subscriptions(self) -> List[dict]:
+        """요약 전송으로 설정된 구독이 있는 채널 문서 목록을 반환합니다."""
+        query = {
+            "delivery_modes": {"$exists": True, "$ne": {}},
+            "disabled": {"$ne": True},
+        }
+        projection = {"_id": 1, "delivery_modes": 1, "webhook_url": 1}
+        subscriptions = list(self.dm_collection.find(query, projection))
+        subscriptions.extend(self.server_channel_collection.find(query, projection))
+        return subscriptions
+
+    def mark_digest_sent(self, channel_id: str, collection_name: str, sent_at):
+        """요약 전송 완료 시각을 기록합니다."""
+        update = {"$set": {f"delivery_modes.{collection_name}.last_sent": sent_at}}
+        for collection in (self.dm_collection, self.server_channel_collection):
+            if collection.update_one({"_id": channel_id}, update).matched_count:
+                return
+
+    def set_webhook(self, channel_id: str, webhook_url: str) -> bool:
+        """서버 채널에 웹훅 전송을 설정합니다."""
+        result = self.server_channel_collection.update_one(
+            {"_id": channel_id}, {"$set": {"webhook_url": webhook_url}}
+        )
+        return result.matched_count > 0
+
+    def get_webhook(self, channel_id: str) -> Optional[str]:
+        """서버 채널에 설정된 웹훅 URL을 반환합니다."""
+        channel = self.server_channel_collection.find_one(
+            {"_id": channel_id}, {"webhook_url": 1}
+        )
+        return channel.get("webhook_url") if channel else None
+
+    def clear_webhook(self, channel_id: str) -> bool:
+        """서버 채널의 웹훅 전송 설정을 해제합니다. (봇 전송으로 되돌림)"""
+        result = self.server_channel_collection.update_one(
+            {"_id": channel_id}, {"$unset": {"webhook_url": ""}}
+        )
+        return result.modified_count > 0
 
     def add_scraper(
         self,
@@ -41,8 +118,9 @@ class ScraperConfig:
         channel_type: str,
         scraper_type: ScraperType,
         guild_name: str = None,
+        guild_id: str = None,
     ) -> bool:
-        """채널에 스크래퍼를 등록합니다."""
+        """채널에 스크래퍼를 등록합니다. 비활성화된 채널이면 다시 활성화합니다."""
         if channel_type == "direct-messages":
             self.collection = self.db["direct-messages"]
         else:
@@ -60,28 +138,37 @@ class ScraperConfig:
                 "channel_type": channel_type,
                 "guild_name": guild_name,
             }
+            if guild_id is not None:
+                update_data["guild_id"] = guild_id
 
         result = self.collection.update_one(
             {"_id": channel_id},
             {
                 "$set": update_data,
                 "$addToSet": {"scrapers": scraper_type.get_collection_name()},
+                "$unset": {"disabled": "", "disabled_reason": "", "disabled_at": ""},
             },
             upsert=True,
         )
+        self.failure_counts.pop(channel_id, None)
         return result.modified_count > 0 or result.upserted_id is not None
 
     def remove_scraper(
         self, channel_id: str, channel_type: str, scraper_type: ScraperType
     ) -> bool:
-        """채널에서 스크래퍼를 제거합니다."""
+        """채널에서 스크래퍼를 제거합니다. (전송 방식 설정도 함께 삭제)"""
         if channel_type == "direct-messages":
             collection = self.dm_collection
         else:
             collection = self.server_channel_collection
         result = collection.update_one(
             {"_id": channel_id},
-            {"$pull": {"scrapers": scraper_type.get_collection_name()}},
+            {
+                "$pull": {"scrapers": scraper_type.get_collection_name()},
+                "$unset": {
+                    f"delivery_modes.{scraper_type.get_collection_name()}": ""
+                },
+            },
         )
         return result.modified_count > 0
 
@@ -92,3 +179,45 @@ class ScraperConfig:
             return channel.get("scrapers", [])
         channel = self.server_channel_collection.find_one({"_id": channel_id})
         return channel.get("scrapers", []) if channel else []
+
+    def record_delivery_success(self, channel_id: str):
+        """전송 성공 시 연속 실패 횟수를 초기화합니다."""
+        self.failure_counts.pop(channel_id, None)
+
+    def record_delivery_failure(self, channel_id: str, reason: str) -> bool:
+        """NotFound/Forbidden 전송 실패를 기록합니다.
+
+        연속 실패 횟수가 SUBSCRIPTION_FAILURE_LIMIT에 도달하면 구독을 비활성화합니다.
+
+        Returns:
+            bool: 이번 실패로 구독이 비활성화되었으면 True
+        """
+        count = self.failure_counts.get(channel_id, 0) + 1
+        self.failure_counts[channel_id] = count
+        if count < ENV["SUBSCRIPTION_FAILURE_LIMIT"]:
+            return False
+
+        self.failure_counts.pop(channel_id, None)
+        return self.disable_channels([channel_id], reason) > 0
+
+    def disable_channels(self, channel_ids: List[str], reason: str) -> int:
+        """채널 구독을 삭제하지 않고 비활성화합니다. (재등록시 다시 활성화)
+
+        Returns:
+            int: 비활성화된 채널 수
+        """
+        if not channel_ids:
+            return 0
+
+        update = {
+            "$set": {
+                "disabled": True,
+                "disabled_reason": reason,
+                "disabled_at": datetime.now(timezone.utc),
+            }
+        }
+        query = {"_id": {"$in": channel_ids}, "disabled": {"$ne": True}}
+        disabled = 0
+        for collection in (self.dm_collection, self.server_channel_collection):
+            disabled += collection.update_many(query, update).modified_count
+        return disabled
@@ -1,94 +1,146 @@
 import asyncio
 import sys
-from datetime import datetime
-import pytz
 from discord_bot.discord_bot import client, send_notice
 from utils.scraper_type import ScraperType
 from discord.ext import tasks
-from config.logger_config import setup_logger
-from config.db_config import get_database, close_database, save_notice
-from utils.scraper_factory import ScraperFactory
+from config.logger_config import log_context, setup_logger
+from config.db_config import (
+    get_database,
+    close_database,
+    save_notice,
+    ensure_notice_indexes,
+)
 from config.env_loader import ENV
 from utils.check_new_scraper import run_check_new_scraper
+from utils.http_session import close_session
+from utils.parse_pool import parse_pool
+from discord_bot.digest import send_due_digests
+from utils.latency_tracker import latency_tracker
+from utils.shared_notice_queue import (
+    ack_notice,
+    claim_notice,
+    count_queued,
+    ensure_queue_indexes,
+)
+from utils.metrics import (
+    NOTICE_QUEUE_DEPTH,
+    TICK_SECONDS,
+    start_metrics_server,
+)
+from utils.loop_watchdog import loop_watchdog
+from utils.scheduler import scheduler
+from utils.tick_budget import TickBudget
+from utils.tick_runner import run_tick
+
+
+# SCRAPE_MODE=shared일 때 공유 대기열 확인 주기 (초)
+SHARED_QUEUE_POLL_SECONDS = 5
+
+# 감지한 공지를 저장/전송 작업자에게 넘기는 대기열 (main에서 생성)
+NOTICE_QUEUE_SIZE = 20
+notice_queue: asyncio.Queue = None
+
+# 1분 주기 확인 틱의 시간 예산
+tick_budget = TickBudget(60, ENV["TICK_BUDGET_SECONDS"])
+
+
+async def process_notice(notice, scraper_type: ScraperType):
+    """새로운 공지사항 하나를 저장하고 전송합니다."""
+    # DB에 저장
+    await save_notice(notice, scraper_type)
+    latency_tracker.mark_saved(notice)
+    # 디스코드로 전송
+    latency_tracker.mark_enqueued(notice)
+    await send_notice(notice, scraper_type)
+
+
+async def delivery_worker():
+    """대기열의 공지사항을 순서대로 저장하고 전송합니다.
+
+    스크래퍼가 다음 요소를 파싱하는 동안 앞서 감지한 공지의 저장/전송이 진행됩니다.
+    """
+    while True:
+        notice = await notice_queue.get()
+        try:
+            with log_context(scraper_type=notice.scraper_type):
+                await process_notice(notice, notice.scraper_type)
+        except Exception as e:
+            logger.error(f"공지사항 처리 중 오류 발생 ({notice.title}): {e}")
+        finally:
+            notice_queue.task_done()
+
+
+@tasks.loop(minutes=1)
+async def check_all_notices():
+    """확인 주기가 된 스크래퍼를 실행하고 새로운 공지사항을 처리합니다."""
+    try:
+        # 새 공지는 파싱되는 즉시 대기열로 넘겨 저장/전송
+        if not await run_tick(
+            tick_budget, ScraperType.get_active_scrapers(), notice_queue.put
+        ):
+            return
 
+        # 다음 틱에서 같은 공지를 다시 감지하지 않도록 이번 틱의 저장이 끝날 때까지 대기
+        await notice_queue.join()
+        TICK_SECONDS.observe(tick_budget.finish(scheduler))
+        latency_tracker.log_summary(logger)
 
-if ENV["IS_PROD"]:
-    INTERVAL = 10
-else:
-    INTERVAL = 2
-
-print(f"INTERVAL: {INTERVAL}")
+    except Exception as e:
+        logger.error(f"스크래핑 작업 중 오류 발생: {e}")
 
 
-async def process_new_notices(notices, scraper_type: ScraperType):
-    """새로운 공지사항을 처리합니다."""
-    for notice in notices:
-        # DB에 저장
-        await save_notice(notice, scraper_type)
-        # 디스코드로 전송
-        await send_notice(notice, scraper_type)
+@check_all_notices.before_loop
+async def before_check():
+    """크롤링 시작 전 봇이 준비될 때까지 대기"""
+    await client.wait_until_ready()
 
 
-def is_working_hour():
-    """현재 시간이 작동 시간(월~토 8시~20시)인지 확인합니다."""
-    if not ENV["IS_PROD"]:
-        return True
+@tasks.loop(seconds=SHARED_QUEUE_POLL_SECONDS)
+async def consume_shared_queue():
+    """스크랩 워커(scrape_worker.py)가 대기열에 넣은 공지사항을 전송합니다."""
+    try:
+        while True:
+            claimed = claim_notice()
+            if claimed is None:
+                break
+            document_id, notice = claimed
+            latency_tracker.mark_enqueued(notice)
+            await send_notice(notice, notice.scraper_type)
+            ack_notice(document_id)
 
-    now = datetime.now(pytz.timezone("Asia/Seoul"))
+        latency_tracker.log_summary(logger)
 
-    # 일요일(6) 체크
-    if now.weekday() == 6:
-        return False
+    except Exception as e:
+        logger.error(f"공유 대기열 처리 중 오류 발생: {e}")
 
-    # 시간 체크 (8시~20시)
-    if now.hour < 8 or now.hour >= 21:
-        return False
 
-    return True
+@consume_shared_queue.before_loop
+async def before_consume():
+    """공유 대기열 처리 전 봇이 준비될 때까지 대기"""
+    await client.wait_until_ready()
 
 
-@tasks.loop(minutes=INTERVAL)
-async def check_all_notices():
-    """모든 스크래퍼를 실행하고 새로운 공지사항을 처리합니다."""
+@tasks.loop(minutes=1)
+async def send_digests():
+    """전송 시점이 된 요약(매시간/매일) 구독을 처리합니다."""
     try:
-        # 작동 시간이 아니면 스킵
-        if not is_working_hour():
-            current_time = datetime.now(pytz.timezone("Asia/Seoul")).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-            logger.info(f"작동 시간이 아닙니다. (현재 시각: {current_time})")
-            return
-        # 활성화된 모든 스크래퍼 실행
-        for scraper_type in ScraperType.get_active_scrapers():
-            try:
-                # 스크래퍼 생성
-                scraper = ScraperFactory().create_scraper(scraper_type)
-                if not scraper:
-                    logger.error(f"지원하지 않는 스크래퍼 타입: {scraper_type.name}")
-                    continue
-
-                # 공지사항 확인 및 처리
-                notices = await scraper.check_updates()
-                await process_new_notices(notices, scraper_type)
-
-            except Exception as e:
-                logger.error(
-                    f"{scraper_type.get_korean_name()} 스크래핑 중 오류 발생: {e}"
-                )
-                continue
-
+        await send_due_digests()
     except Exception as e:
-        logger.error(f"스크래핑 작업 중 오류 발생: {e}")
+        logger.error(f"요약 전송 작업 중 오류 발생: {e}")
 
 
-@check_all_notices.before_loop
-async def before_check():
-    """크롤링 시작 전 봇이 준비될 때까지 대기"""
+@send_digests.before_loop
+async def before_digests():
+    """요약 전송 시작 전 봇이 준비될 때까지 대기"""
     await client.wait_until_ready()
 
 
 async def main():
+    global notice_queue
     logger.info("국민대학교 공지사항 알리미 봇을 시작합니다...")
+    worker = None
+    metrics_runner = None
+    lag_monitor = None
 
     try:
         # 환경 변수 검증
@@ -101,14 +153,35 @@ async def main():
         # MongoDB 연결 초기화
         db = get_database()
         logger.info("MongoDB 연결이 성공적으로 설정되었습니다.")
+        ensure_notice_indexes()
 
         # 새로운 스크롤러 확인 실행
         await run_check_new_scraper()
 
-        # 크롤링 태스크 시작
-        check_all_notices.start()
+        if ENV["SCRAPE_MODE"] == "shared":
+            # 스크래핑은 scrape_worker.py 프로세스들이 맡고 여기서는 전송만 함
+            ensure_queue_indexes()
+            NOTICE_QUEUE_DEPTH.set_function(count_queued)
+            consume_shared_queue.start()
+            logger.info("공유 대기열 전송 모드로 시작합니다.")
+        else:
+            # 저장/전송 작업자와 크롤링 태스크 시작
+            notice_queue = asyncio.Queue(maxsize=NOTICE_QUEUE_SIZE)
+            NOTICE_QUEUE_DEPTH.set_function(notice_queue.qsize)
+            worker = asyncio.create_task(delivery_worker())
+            check_all_notices.start()
+        send_digests.start()
         logger.info("크롤링 작업이 시작되었습니다.")
 
+        if ENV["METRICS_PORT"]:
+            metrics_runner = await start_metrics_server(
+                ENV["METRICS_HOST"], ENV["METRICS_PORT"]
+            )
+
+        # 이벤트 루프를 멈추는 호출을 찾기 위해 루프 지연을 계속 측정
+        if ENV["LOOP_WATCHDOG_THRESHOLD"] > 0:
+            lag_monitor = loop_watchdog.start()
+
         logger.info("디스코드 봇을 시작합니다...")
         await client.start(discord_token)
 
@@ -121,7 +194,17 @@ async def main():
         logger.error(f"오류 발생: {e}")
     finally:
         check_all_notices.cancel()
+        consume_shared_queue.cancel()
+        send_digests.cancel()
+        if worker:
+            worker.cancel()
+        if lag_monitor:
+            lag_monitor.cancel()
+        if metrics_runner:
+            await metrics_runner.cleanup()
         await client.close()
+        await close_session()
+        parse_pool.shutdown()
         close_database()
         await asyncio.get_event_loop().shutdown_asyncgens()
 
@@ -0,0 +1,125 @@
+"""스크랩 워커
+
+게시판(ScraperType)을 MongoDB 임대로 다른 워커들과 나눠 맡아 스크래핑하고,
+새 공지사항을 DB에 저장한 뒤 공유 대기열(notice-queue)에 넣습니다.
+디스코드 전송은 SCRAPE_MODE=shared로 실행한 main.py 하나가 맡습니다.
+
+사용법:
+    python scrape_worker.py
+    python scrape_worker.py --worker-id worker-a
+    python scrape_worker.py --worker-id worker-a --metrics-port 9101
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+from config.db_config import close_database, ensure_notice_indexes, save_notice
+from utils.scheduler import scheduler
+from utils.scraper_type import ScraperType
+from utils.scraper_factory import ScraperFactory
+from utils.lease_manager import LeaseManager, default_worker_id
+from utils.shared_notice_queue import enqueue_notice, ensure_queue_indexes
+from utils.latency_tracker import latency_tracker
+from utils.parse_pool import parse_pool
+from utils.metrics import TICK_SECONDS, start_metrics_server
+from utils.loop_watchdog import loop_watchdog
+from utils.tick_budget import TickBudget
+from utils.tick_runner import run_tick
+
+logger = setup_logger("scrape_worker")
+
+# 1분 주기 확인 틱의 시간 예산
+tick_budget = TickBudget(60, ENV["TICK_BUDGET_SECONDS"])
+
+
+async def lease_loop(lease_manager: LeaseManager):
+    """임대 유지 시간의 1/3마다 하트비트를 남기고 맡은 게시판을 재조정합니다."""
+    while True:
+        await asyncio.sleep(lease_manager.lease_seconds / 3)
+        try:
+            previous = set(lease_manager.owned)
+            owned = lease_manager.rebalance(ScraperType.get_active_scrapers())
+            logger.debug("맡은 게시판 %d개", len(owned))
+            # 새로 맡은 게시판은 다른 워커가 저장한 공지가 있으므로 등록 목록을 DB에서 다시 읽음
+            for scraper_type in set(owned) - previous:
+                ScraperFactory().forget_seen(scraper_type)
+            # 다른 워커에게 넘어간 게시판은 이 워커의 밀린 게시판에서 뺌
+            for scraper_type in previous - set(owned):
+                scheduler.deferred.pop(scraper_type, None)
+        except Exception as e:
+            logger.error(f"임대 갱신 중 오류 발생: {e}")
+
+
+async def scrape_owned(lease_manager: LeaseManager):
+    """맡은 게시판 중 확인 주기가 된 게시판을 스크래핑해 새 공지를 저장하고 공유 대기열에 넣습니다."""
+
+    async def save_and_enqueue(notice):
+        # 다른 워커가 먼저 저장한 공지는 대기열에 넣지 않음 (링크 고유 인덱스)
+        if not await save_notice(notice, notice.scraper_type):
+            return
+        latency_tracker.mark_saved(notice)
+        enqueue_notice(notice)
+
+    # 틱 도중 임대를 반납했거나 잃은 게시판은 새 주인이 같은 공지를 넣으므로 여기서 멈춤
+    if not await run_tick(
+        tick_budget,
+        list(lease_manager.owned),
+        save_and_enqueue,
+        owns=lambda scraper_type: scraper_type in lease_manager.owned,
+    ):
+        return
+
+    TICK_SECONDS.observe(tick_budget.finish(scheduler))
+
+
+async def main(worker_id: str, metrics_port: Optional[int] = None):
+    lease_manager = LeaseManager(worker_id, ENV["LEASE_SECONDS"])
+    logger.info(f"스크랩 워커를 시작합니다: {worker_id}")
+
+    # 워커마다 다른 포트로 지표를 내보냄 (메인 봇과 같은 포트를 쓰지 않도록 인자로 받음)
+    metrics_runner = None
+    lag_monitor = None
+    if metrics_port:
+        metrics_runner = await start_metrics_server(ENV["METRICS_HOST"], metrics_port)
+    # 이벤트 루프를 멈추는 호출을 찾기 위해 루프 지연을 계속 측정
+    if ENV["LOOP_WATCHDOG_THRESHOLD"] > 0:
+        lag_monitor = loop_watchdog.start()
+
+    ensure_notice_indexes()
+    ensure_queue_indexes()
+    # 첫 틱 전에 맡을 게시판을 정함
+    lease_manager.rebalance(ScraperType.get_active_scrapers())
+    leases = asyncio.create_task(lease_loop(lease_manager))
+
+    try:
+        # 1분마다 확인 주기가 된 게시판을 찾음 (틱 소요 시간만큼 덜 기다려 주기를 유지)
+        loop = asyncio.get_event_loop()
+        while True:
+            started = loop.time()
+            await scrape_owned(lease_manager)
+            await asyncio.sleep(max(60 - (loop.time() - started), 0))
+    finally:
+        leases.cancel()
+        if lag_monitor:
+            lag_monitor.cancel()
+            # 워커에는 보고 명령어가 없으므로 종료할 때 멈춤 원인 순위를 남김
+            logger.info(loop_watchdog.report())
+        if metrics_runner:
+            await metrics_runner.cleanup()
+        lease_manager.release_all()
+        parse_pool.shutdown()
+        close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스크랩 워커")
+    parser.add_argument("--worker-id", default=default_worker_id())
+    parser.add_argument("--metrics-port", type=int, help="/metrics 지표 서버 포트")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.worker_id, args.metrics_port))
+    except KeyboardInterrupt:
+        logger.info("스크랩 워커를 종료합니다.")
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 from utils.scraper_type import ScraperType
 
 
@@ -11,6 +12,10 @@ class NoticeData:
     link: str
     published: datetime
     scraper_type: ScraperType
+    # 지연 시간 측정용 단계별 시각 (epoch 초), 비교/출력에서는 제외
+    detected_at: Optional[float] = field(default=None, compare=False, repr=False)
+    saved_at: Optional[float] = field(default=None, compare=False, repr=False)
+    enqueued_at: Optional[float] = field(default=None, compare=False, repr=False)
 
     def __str__(self):
         return (
@@ -0,0 +1,176 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from template.notice_data import NoticeData
+from utils.scraper_type import ScraperType
+from utils.html_parser import Selector
+from utils.date_parser import KST, date_parser
+
+# 제목 추출 방식
+TITLE_ATTR = "attr"  # a 태그의 title 속성 (" 자세히 보기" 제거), 없으면 텍스트
+TITLE_TEXT = "text"  # a 태그의 텍스트 (텍스트 조각마다 앞뒤 공백 제거 후 이어 붙임)
+TITLE_TEXT_RAW = "text_raw"  # a 태그의 텍스트 그대로 (앞뒤 공백만 제거, 안쪽 줄바꿈 유지)
+TITLE_TEXT_CLEAN = "text_clean"  # 텍스트 공백 정리, 잘린 제목은 title 속성으로 복구
+
+TITLE_SUFFIX = " 자세히 보기"
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TITLE_SUFFIX_PATTERN = re.compile(r" 자세히 보기$")
+
+
+@dataclass(frozen=True)
+class BoardTemplate:
+    """board-table / b-title-box 계열 게시판의 선언적 템플릿
+
+    Attributes:
+        list_selector (str): 게시글 행 목록 선택자
+        title_selector (str): 행 안의 제목 링크(a 태그) 선택자
+        date_selector (str): 행 안의 작성일 요소 선택자
+        date_fallback_selectors (Tuple[str, ...]): 작성일 요소가 없을 때 순서대로 시도할 선택자
+        title_mode (str): 제목 추출 방식 (TITLE_ATTR, TITLE_TEXT, TITLE_TEXT_RAW, TITLE_TEXT_CLEAN)
+        pinned_row_class (str, optional): 상단 고정 행에 붙는 클래스 (예: "b-top-box")
+        pinned_selector (str, optional): 행 안에 있으면 상단 고정으로 보는 요소 선택자
+        pinned_text (str, optional): pinned_selector 요소에 포함되어야 하는 텍스트
+        mark_pinned (bool): 상단 고정 공지 제목 앞에 "[공지]"를 붙일지 여부
+        link_base (str, optional): "?"로 시작하는 링크 앞에 붙일 주소 (미지정시 게시판 URL)
+        base_url (str, optional): 그 외 상대 링크 앞에 붙일 주소 (미지정시 href 그대로 사용)
+        article_param (str, optional): 지정시 href에서 게시글 번호를 뽑아
+            "{url}?mode=view&{article_param}={번호}" 형태로 링크를 만듭니다
+        list_region (Tuple[str, Dict[str, str]], optional): 목록을 감싸는 영역
+            (태그 이름, 속성), 지정하면 이 영역만 파싱합니다
+        ordered_board (bool): 고정 공지 아래가 최신순 정렬인지 여부 (첫 등록 공지에서 읽기를 멈춤).
+            고정 공지를 구분하는 규칙(pinned_row_class/pinned_selector)이 있는 게시판만 True로 지정합니다
+    """
+
+    list_selector: str
+    title_selector: str
+    date_selector: str
+    date_fallback_selectors: Tuple[str, ...] = ()
+    title_mode: str = TITLE_TEXT
+    pinned_row_class: Optional[str] = None
+    pinned_selector: Optional[str] = None
+    pinned_text: Optional[str] = None
+    mark_pinned: bool = True
+    link_base: Optional[str] = None
+    base_url: Optional[str] = None
+    article_param: Optional[str] = None
+    list_region: Optional[Tuple[Optional[str], Dict[str, str]]] = None
+    ordered_board: bool = False
+
+    def compile(self) -> "CompiledBoardTemplate":
+        """선택자를 미리 컴파일한 추출기를 반환합니다."""
+        return CompiledBoardTemplate(self)
+
+
+class CompiledBoardTemplate:
+    """BoardTemplate의 선택자를 한 번만 컴파일해두고 재사용하는 추출기"""
+
+    def __init__(self, template: BoardTemplate):
+        self.template = template
+        self.list_selector = Selector(template.list_selector)
+        self.title_selector = Selector(template.title_selector)
+        self.date_selectors = tuple(
+            Selector(selector)
+            for selector in (template.date_selector, *template.date_fallback_selectors)
+        )
+        self.pinned_selector = (
+            Selector(template.pinned_selector)
+            if template.pinned_selector
+            else None
+        )
+
+    def get_list_elements(self, soup) -> list:
+        """게시글 행 목록을 반환합니다."""
+        return self.list_selector.select(soup)
+
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        template = self.template
+        if template.pinned_row_class and template.pinned_row_class in element.get(
+            "class", []
+        ):
+            return True
+        if self.pinned_selector is None:
+            return False
+        pinned = self.pinned_selector.select_one(element)
+        if pinned is None:
+            return False
+        return template.pinned_text is None or template.pinned_text in pinned.text
+
+    def extract_title(self, a_tag) -> str:
+        """제목 링크에서 제목을 추출합니다."""
+        mode = self.template.title_mode
+        if mode == TITLE_ATTR:
+            title_attr = a_tag.get("title", "")
+            if title_attr:
+                return title_attr.replace(TITLE_SUFFIX, "").strip()
+            return a_tag.text.strip()
+
+        if mode == TITLE_TEXT_CLEAN:
+            title = WHITESPACE_PATTERN.sub(" ", a_tag.get_text(strip=True)).strip()
+            title = TITLE_SUFFIX_PATTERN.sub("", title)
+            # 잘린 제목 복구
+            if title.endswith("..."):
+                full_title = a_tag.get("title", "")
+                if full_title and "자세히 보기" in full_title:
+                    title = TITLE_SUFFIX_PATTERN.sub("", full_title)
+            return title
+
+        if mode == TITLE_TEXT_RAW:
+            return a_tag.text.strip()
+
+        return a_tag.get_text(strip=True)
+
+    def resolve_link(self, href: str, url: str) -> str:
+        """상대 링크를 절대 링크로 변환합니다."""
+        template = self.template
+        if template.article_param:
+            marker = f"{template.article_param}="
+            article_no = href.split(marker)[1].split("&")[0] if marker in href else ""
+            return f"{url}?mode=view&{marker}{article_no}"
+
+        if href.startswith("?"):
+            return f"{template.link_base or url.split('?')[0]}{href}"
+        if template.base_url is None:
+            return href
+        if href.startswith("/"):
+            return f"{template.base_url}{href}"
+        return f"{template.base_url}/{href}"
+
+    def extract_date_text(self, element) -> Optional[str]:
+        """작성일 텍스트를 찾습니다. 없으면 None을 반환합니다."""
+        for selector in self.date_selectors:
+            date_element = selector.select_one(element)
+            if date_element is not None:
+                date_text = date_element.text.strip()
+                if date_text:
+                    return date_text
+        return None
+
+    def parse(self, element, url: str, scraper_type: ScraperType, logger) -> Optional[NoticeData]:
+        """행 요소에서 공지사항을 추출합니다. 제목 링크가 없으면 None을 반환합니다."""
+        a_tag = self.title_selector.select_one(element)
+        if a_tag is None:
+            return None
+
+        title = self.extract_title(a_tag)
+        if self.template.mark_pinned and self.is_pinned(element):
+            if not title.startswith("[공지]"):
+                title = f"[공지] {title}"
+
+        link = self.resolve_link(a_tag.get("href", ""), url)
+
+        date_text = self.extract_date_text(element)
+        if date_text:
+            published = date_parser.parse_or_now(date_text, scraper_type, logger)
+        else:
+            logger.warning("날짜 요소를 찾을 수 없음")
+            published = datetime.now(KST)
+
+        return NoticeData(
+            title=title,
+            link=link,
+            published=published,
+            scraper_type=scraper_type,
+        )
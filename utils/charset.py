@@ -0,0 +1,142 @@
+import codecs
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Content-Type 헤더의 charset (예: "text/html; charset=UTF-8")
+HEADER_CHARSET_PATTERN = re.compile(r"charset=[\"']?\s*([\w.:\-]+)", re.I)
+# <meta charset="..."> 또는 <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_PATTERN = re.compile(rb"<meta[^>]+charset=[\"']?\s*([\w.:\-]+)", re.I)
+# meta 태그는 문서 앞부분에 있으므로 앞쪽만 검사
+META_SCAN_BYTES = 4096
+
+# 인코딩을 알 수 없을 때 시도할 순서
+FALLBACK_ENCODINGS = ("utf-8", "cp949")
+
+# 판정 출처
+SOURCE_HEADER = "header"
+SOURCE_META = "meta"
+SOURCE_HOST = "host"
+SOURCE_FALLBACK = "fallback"
+
+
+def normalize_encoding(name: Optional[str]) -> Optional[str]:
+    """인코딩 이름을 파이썬 코덱 이름으로 정규화합니다. 알 수 없으면 None을 반환합니다.
+
+    EUC-KR로 선언된 페이지도 확장 완성형 글자를 쓰는 경우가 많아 CP949로 읽습니다.
+    """
+    if not name:
+        return None
+    try:
+        codec = codecs.lookup(name.strip().lower()).name
+    except LookupError:
+        return None
+    if codec in ("euc_kr", "ks_c_5601-1987"):
+        return "cp949"
+    return codec
+
+
+class CharsetResolver:
+    """응답 본문의 문자 인코딩을 판정해 한 번만 디코딩하는 클래스
+
+    Content-Type 헤더 → <meta charset> → 호스트별로 기억한 인코딩 순서로 판정하고,
+    어느 것도 없을 때만 UTF-8, CP949 순으로 시도합니다.
+    """
+
+    def __init__(self):
+        # 호스트별 마지막으로 성공한 인코딩
+        self.host_encodings: Dict[str, str] = {}
+        # 판정 출처별 횟수
+        self.sources: Counter = Counter()
+        # 호스트별 (판정 출처, 인코딩) 횟수
+        self.by_host: Dict[str, Counter] = {}
+        # 선언된 인코딩으로 디코딩에 실패한 횟수 (호스트, 선언 인코딩)
+        self.mismatches: Counter = Counter()
+
+    def _detect(
+        self, body: bytes, content_type: Optional[str], host: str
+    ) -> Tuple[Optional[str], str]:
+        """(인코딩, 판정 출처)를 반환합니다."""
+        if content_type:
+            match = HEADER_CHARSET_PATTERN.search(content_type)
+            encoding = normalize_encoding(match.group(1)) if match else None
+            if encoding:
+                return encoding, SOURCE_HEADER
+
+        match = META_CHARSET_PATTERN.search(body[:META_SCAN_BYTES])
+        if match:
+            encoding = normalize_encoding(match.group(1).decode("ascii", "ignore"))
+            if encoding:
+                return encoding, SOURCE_META
+
+        encoding = self.host_encodings.get(host)
+        if encoding:
+            return encoding, SOURCE_HOST
+
+        return None, SOURCE_FALLBACK
+
+    def decode(
+        self, body: bytes, content_type: Optional[str] = None, url: str = ""
+    ) -> str:
+        """응답 본문을 문자열로 디코딩합니다."""
+        host = urlsplit(url).netloc
+        encoding, source = self._detect(body, content_type, host)
+
+        text = None
+        if encoding:
+            try:
+                text = body.decode(encoding)
+            except UnicodeDecodeError:
+                self.mismatches[(host, encoding)] += 1
+                source = SOURCE_FALLBACK
+
+        if text is None:
+            for encoding in FALLBACK_ENCODINGS:
+                try:
+                    text = body.decode(encoding)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                encoding = FALLBACK_ENCODINGS[-1]
+                text = body.decode(encoding, errors="replace")
+
+        if host:
+            self.host_encodings[host] = encoding
+            self.by_host.setdefault(host, Counter())[(source, encoding)] += 1
+        self.sources[source] += 1
+        return text
+
+    def get_summary_lines(self) -> List[str]:
+        """판정 출처별/호스트별 디코딩 통계를 반환합니다."""
+        total = sum(self.sources.values())
+        if not total:
+            return []
+
+        lines = [
+            "판정 출처: "
+            + ", ".join(
+                f"{source} {self.sources[source]}"
+                for source in (SOURCE_HEADER, SOURCE_META, SOURCE_HOST, SOURCE_FALLBACK)
+            )
+        ]
+        if self.mismatches:
+            lines.append("**선언과 다른 인코딩 (호스트, 선언 인코딩: 횟수)**")
+            lines += [
+                f"{host} {encoding}: {count}"
+                for (host, encoding), count in self.mismatches.most_common()
+            ]
+        lines.append("**호스트별 (출처/인코딩: 횟수)**")
+        for host, counter in sorted(self.by_host.items()):
+            lines.append(
+                f"{host}: "
+                + ", ".join(
+                    f"{source}/{encoding} {count}"
+                    for (source, encoding), count in counter.most_common()
+                )
+            )
+        return lines
+
+
+charset_resolver = CharsetResolver()
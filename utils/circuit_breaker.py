@@ -0,0 +1,139 @@
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# 회로 상태
+STATE_CLOSED = "closed"  # 정상, 모든 요청 허용
+STATE_OPEN = "open"  # 실패가 이어져 대기 시간 동안 요청 차단
+STATE_HALF_OPEN = "half_open"  # 대기 시간이 지나 시험 요청 하나만 허용
+
+# 반쯤 열린 상태에서 시험 요청이 결과를 남기지 못했을 때 다음 시험까지의 시간 (초)
+PROBE_TIMEOUT = 120
+
+
+class HostCircuit:
+    """호스트 하나의 회로 상태"""
+
+    def __init__(self, host: str, base_backoff: float):
+        self.host = host
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.backoff = base_backoff
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self.trips = 0
+        self.skipped = 0
+        self.last_error: Optional[str] = None
+
+    def retry_in(self) -> float:
+        """다시 시험 요청을 보낼 때까지 남은 시간(초)을 반환합니다."""
+        return max(self.opened_at + self.backoff - time.monotonic(), 0.0)
+
+
+class CircuitBreaker:
+    """호스트별 회로 차단기
+
+    같은 호스트에 연속으로 failure_threshold번 실패(시간 초과, 연결 오류, 5xx)하면 회로를 열고 backoff 동안
+    요청을 보내지 않습니다. 대기 시간이 지나면 시험 요청 하나를 허용하고, 성공하면
+    회로를 닫고 실패하면 대기 시간을 두 배(최대 max_backoff)로 늘려 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int, base_backoff: float, max_backoff: float):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.circuits: Dict[str, HostCircuit] = {}
+
+    def _get(self, url: str) -> HostCircuit:
+        host = urlsplit(url).netloc
+        circuit = self.circuits.get(host)
+        if circuit is None:
+            circuit = self.circuits[host] = HostCircuit(host, self.base_backoff)
+        return circuit
+
+    def allow(self, url: str) -> bool:
+        """요청을 보내도 되는지 확인합니다."""
+        circuit = self._get(url)
+        now = time.monotonic()
+
+        if circuit.state == STATE_OPEN and circuit.retry_in() <= 0:
+            circuit.state = STATE_HALF_OPEN
+            circuit.probe_started_at = now
+            logger.info(f"[회로] {circuit.host} 시험 요청")
+            return True
+
+        if circuit.state == STATE_HALF_OPEN:
+            # 시험 요청이 진행 중이면 차단, 결과 없이 오래 지났으면 다시 시험
+            if now - circuit.probe_started_at >= PROBE_TIMEOUT:
+                circuit.probe_started_at = now
+                return True
+            circuit.skipped += 1
+            return False
+
+        if circuit.state == STATE_OPEN:
+            circuit.skipped += 1
+            return False
+
+        return True
+
+    def record_success(self, url: str):
+        circuit = self._get(url)
+        if circuit.state != STATE_CLOSED:
+            logger.info(f"[회로] {circuit.host} 복구됨, 회로를 닫습니다")
+        circuit.state = STATE_CLOSED
+        circuit.failures = 0
+        circuit.backoff = self.base_backoff
+
+    def record_failure(self, url: str, reason: str):
+        circuit = self._get(url)
+        circuit.failures += 1
+        circuit.last_error = reason
+
+        if circuit.state == STATE_HALF_OPEN:
+            circuit.backoff = min(circuit.backoff * 2, self.max_backoff)
+            self._open(circuit)
+        elif (
+            circuit.state == STATE_CLOSED
+            and circuit.failures >= self.failure_threshold
+        ):
+            self._open(circuit)
+
+    def _open(self, circuit: HostCircuit):
+        circuit.state = STATE_OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.trips += 1
+        logger.warning(
+            f"[회로] {circuit.host} 연속 {circuit.failures}회 실패, "
+            f"{circuit.backoff / 60:.0f}분 동안 요청하지 않습니다 ({circuit.last_error})"
+        )
+
+    def get_summary_lines(self) -> List[str]:
+        """닫히지 않은 회로를 먼저, 그다음 실패 이력이 있는 호스트를 보여줍니다."""
+        rows = sorted(
+            (c for c in self.circuits.values() if c.state != STATE_CLOSED or c.trips),
+            key=lambda c: (c.state == STATE_CLOSED, -c.failures),
+        )
+        lines = []
+        for circuit in rows:
+            line = f"{circuit.host}: {circuit.state} 연속 실패 {circuit.failures}회"
+            if circuit.state != STATE_CLOSED:
+                line += (
+                    f", 다음 시험까지 {circuit.retry_in() / 60:.0f}분"
+                    f", 건너뜀 {circuit.skipped}회"
+                )
+            line += f", 차단 {circuit.trips}회"
+            if circuit.last_error:
+                line += f" ({circuit.last_error})"
+            lines.append(line)
+        return lines
+
+
+circuit_breaker = CircuitBreaker(
+    ENV["CIRCUIT_FAILURE_THRESHOLD"],
+    ENV["CIRCUIT_BASE_BACKOFF"],
+    ENV["CIRCUIT_MAX_BACKOFF"],
+)
@@ -0,0 +1,190 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+import pytz
+from utils.scraper_type import ScraperType
+
+KST = pytz.timezone("Asia/Seoul")
+# 1988년 이후로 한국은 서머타임이 없어 localize 결과의 tzinfo(+09:00)를 그대로 재사용합니다.
+# KST.localize는 호출마다 전환 시각표를 찾느라 파싱 시간의 대부분을 차지합니다.
+_KST_STANDARD = KST.localize(datetime(2000, 1, 1)).tzinfo
+_KST_STANDARD_SINCE = 1989
+
+
+def _time_parts(match) -> Tuple[int, int, int]:
+    """선택적인 시:분(:초) 그룹을 읽습니다."""
+    hour, minute, second = match.group("H"), match.group("M"), match.group("S")
+    return int(hour or 0), int(minute or 0), int(second or 0)
+
+
+def _kst(year: int, month: int, day: int, hour: int, minute: int, second: int) -> datetime:
+    """KST 시각을 만듭니다."""
+    if year >= _KST_STANDARD_SINCE:
+        return datetime(year, month, day, hour, minute, second, tzinfo=_KST_STANDARD)
+    return KST.localize(datetime(year, month, day, hour, minute, second))
+
+
+def _build_full_date(match) -> datetime:
+    return _kst(
+        int(match.group("y")),
+        int(match.group("m")),
+        int(match.group("d")),
+        *_time_parts(match),
+    )
+
+
+def _build_short_date(match) -> datetime:
+    return _kst(
+        2000 + int(match.group("y")),
+        int(match.group("m")),
+        int(match.group("d")),
+        *_time_parts(match),
+    )
+
+
+def _build_iso(match) -> datetime:
+    offset = match.group("tz")
+    if offset in ("Z", "z"):
+        tzinfo = timezone.utc
+    else:
+        sign = -1 if offset[0] == "-" else 1
+        digits = offset[1:].replace(":", "")
+        tzinfo = timezone(
+            sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        )
+    naive = datetime(
+        int(match.group("y")),
+        int(match.group("m")),
+        int(match.group("d")),
+        *_time_parts(match),
+    )
+    return naive.replace(tzinfo=tzinfo).astimezone(KST)
+
+
+def _build_rfc822(match) -> datetime:
+    return parsedate_to_datetime(match.group(0)).astimezone(KST)
+
+
+def _build_time_only(match) -> datetime:
+    # 오늘 올라온 글은 날짜 대신 시각만 표시하는 게시판이 있음
+    today = datetime.now(KST)
+    return _kst(today.year, today.month, today.day, *_time_parts(match))
+
+
+_TIME = r"(?:\s+(?P<H>\d{1,2}):(?P<M>\d{2})(?::(?P<S>\d{2}))?)?"
+
+# (형식 이름, 미리 컴파일한 패턴, datetime 생성 함수)
+# 앞쪽일수록 구체적인 형식이어야 합니다 (ISO 문자열에 날짜 패턴이 먼저 걸리지 않도록).
+# 앞의 SPECIFIC_FORMATS개 형식은 기억한 형식과 상관없이 항상 먼저 시도합니다.
+DATE_FORMATS: List[Tuple[str, "re.Pattern", Callable]] = [
+    (
+        "iso8601",
+        re.compile(
+            r"(?P<y>\d{4})-(?P<m>\d{2})-(?P<d>\d{2})T(?P<H>\d{2}):(?P<M>\d{2})"
+            r"(?::(?P<S>\d{2}))?(?:\.\d+)?(?P<tz>Z|z|[+-]\d{2}:?\d{2})"
+        ),
+        _build_iso,
+    ),
+    (
+        "rfc822",
+        re.compile(
+            r"[A-Z][a-z]{2}, \d{1,2} [A-Z][a-z]{2} \d{4} \d{2}:\d{2}(?::\d{2})? "
+            r"(?:[+-]\d{4}|[A-Z]{1,4})"
+        ),
+        _build_rfc822,
+    ),
+    # 이 아래 형식은 위 형식 문자열의 일부에도 걸리므로 위 형식보다 먼저 시도하면 안 됩니다
+    (
+        "yyyy.mm.dd",
+        re.compile(
+            r"(?<!\d)(?P<y>\d{4})\s*[.\-/]\s*(?P<m>\d{1,2})\s*[.\-/]\s*(?P<d>\d{1,2})(?!\d)"
+            + _TIME
+        ),
+        _build_full_date,
+    ),
+    (
+        "yy.mm.dd",
+        re.compile(
+            r"(?<!\d)(?P<y>\d{2})[.\-/](?P<m>\d{1,2})[.\-/](?P<d>\d{1,2})(?!\d)" + _TIME
+        ),
+        _build_short_date,
+    ),
+    (
+        "hh:mm",
+        re.compile(r"^\s*(?P<H>\d{1,2}):(?P<M>\d{2})(?::(?P<S>\d{2}))?\s*$"),
+        _build_time_only,
+    ),
+]
+SPECIFIC_FORMATS = 2
+
+# 기억한 형식별 시도 순서 (구체적인 형식 → 기억한 형식 → 나머지)
+_ALL_CANDIDATES = tuple(range(len(DATE_FORMATS)))
+_CANDIDATES_BY_PREFERRED = {
+    preferred: tuple(range(SPECIFIC_FORMATS))
+    + (preferred,)
+    + tuple(i for i in range(SPECIFIC_FORMATS, len(DATE_FORMATS)) if i != preferred)
+    for preferred in range(SPECIFIC_FORMATS, len(DATE_FORMATS))
+}
+
+
+class DateParser:
+    """모든 스크래퍼가 공유하는 작성일 파서
+
+    예외 기반의 strptime 연쇄 대신 미리 컴파일한 패턴으로 날짜를 찾고,
+    스크래퍼 타입별로 마지막에 성공한 형식을 기억해 일반 날짜 형식 중 먼저 시도합니다.
+    ISO 8601과 RFC 822 형식은 날짜 패턴에도 일부가 걸리므로 기억한 형식보다 항상 먼저 시도합니다.
+    반환값은 항상 KST 시간대 정보를 가진 datetime입니다.
+    """
+
+    def __init__(self):
+        # 스크래퍼 타입별로 마지막에 성공한 형식의 인덱스
+        self.preferred: Dict[Optional[ScraperType], int] = {}
+
+    def _candidates(self, scraper_type: Optional[ScraperType]) -> Tuple[int, ...]:
+        return _CANDIDATES_BY_PREFERRED.get(
+            self.preferred.get(scraper_type), _ALL_CANDIDATES
+        )
+
+    def parse(
+        self, text: str, scraper_type: Optional[ScraperType] = None
+    ) -> Optional[datetime]:
+        """문자열에서 날짜를 찾아 KST datetime으로 반환합니다. 실패하면 None을 반환합니다.
+
+        Args:
+            text (str): 날짜가 포함된 문자열 (예: "2025-03-07", "작성일 25.03.07")
+            scraper_type (ScraperType, optional): 성공한 형식을 기억할 스크래퍼 타입
+        """
+        if not text:
+            return None
+        for index in self._candidates(scraper_type):
+            _, pattern, build = DATE_FORMATS[index]
+            match = pattern.search(text)
+            if not match:
+                continue
+            try:
+                published = build(match)
+            except (ValueError, TypeError, OverflowError):
+                continue
+            self.preferred[scraper_type] = index
+            return published
+        return None
+
+    def parse_or_now(
+        self, text: str, scraper_type: Optional[ScraperType] = None, logger=None
+    ) -> datetime:
+        """parse와 같지만 실패하면 오류를 기록하고 현재 시각(KST)을 반환합니다."""
+        published = self.parse(text, scraper_type)
+        if published is None:
+            if logger:
+                logger.error(f"날짜 파싱 오류: {text}")
+            return datetime.now(KST)
+        return published
+
+    def get_format_name(self, scraper_type: Optional[ScraperType]) -> Optional[str]:
+        """스크래퍼 타입에서 마지막으로 성공한 형식 이름을 반환합니다."""
+        index = self.preferred.get(scraper_type)
+        return DATE_FORMATS[index][0] if index is not None else None
+
+
+date_parser = DateParser()
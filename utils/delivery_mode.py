@@ -0,0 +1,40 @@
+from enum import Enum
+from typing import Optional
+from discord import app_commands
+
+
+class DeliveryMode(Enum):
+    """구독별 알림 전송 방식을 정의하는 열거형 클래스
+
+    각 전송 방식은 (저장용 식별자, 한글 이름) 튜플을 값으로 가집니다.
+    실시간 구독은 별도 설정을 저장하지 않으며, 요약 구독만
+    채널 문서의 `delivery_modes.<collection_name>`에 저장됩니다.
+    """
+
+    REALTIME = ("realtime", "실시간")
+    HOURLY = ("hourly", "매시간 요약")
+    DAILY = ("daily", "매일 요약")
+
+    def get_key(self) -> str:
+        """DB에 저장되는 식별자를 반환합니다."""
+        return self.value[0]
+
+    def get_korean_name(self) -> str:
+        """전송 방식의 한글 이름을 반환합니다."""
+        return self.value[1]
+
+    @classmethod
+    def from_key(cls, key: str) -> Optional["DeliveryMode"]:
+        """저장된 식별자로부터 DeliveryMode를 반환합니다."""
+        for mode in cls:
+            if mode.get_key() == key:
+                return mode
+        return None
+
+    @classmethod
+    def get_choices(cls) -> list:
+        """디스코드 명령어용 선택지 목록을 반환합니다."""
+        return [
+            app_commands.Choice(name=mode.get_korean_name(), value=mode.get_key())
+            for mode in cls
+        ]
@@ -0,0 +1,172 @@
+from typing import Dict, Optional, Set, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+from utils.scraper_type import ScraperType
+
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = setup_logger(__name__)
+
+# 파서 백엔드 이름
+BACKEND_HTML_PARSER = "html.parser"  # BeautifulSoup + 파이썬 내장 파서
+BACKEND_LXML = "lxml"  # BeautifulSoup + lxml
+BACKEND_SELECTOLAX = "selectolax"  # selectolax(lexbor), 선택자 어댑터로 감쌈
+BACKENDS = (BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX)
+
+# 목록 영역 (태그 이름, 속성) - 예: ("table", {"class": "board-table"})
+ListRegion = Tuple[Optional[str], Dict[str, str]]
+
+# 경고를 이미 남긴 백엔드 (설치되지 않은 백엔드 경고는 한 번만)
+_warned: Set[str] = set()
+
+
+class SelectolaxNode:
+    """selectolax 노드를 스크래퍼가 쓰는 BeautifulSoup API 일부로 감싼 어댑터
+
+    select, select_one, get, [], text, get_text만 지원합니다.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector) -> list:
+        return [SelectolaxNode(node) for node in self.node.css(_css(selector))]
+
+    def select_one(self, selector) -> Optional["SelectolaxNode"]:
+        node = self.node.css_first(_css(selector))
+        return SelectolaxNode(node) if node is not None else None
+
+    def get(self, key: str, default=None):
+        value = self.node.attributes.get(key)
+        if value is None:
+            return default if key not in self.node.attributes else ""
+        # BeautifulSoup과 같이 class는 리스트로 반환
+        if key == "class":
+            return value.split()
+        return value
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    @property
+    def text(self) -> str:
+        return self.node.text(deep=True)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+
+class Selector:
+    """파서 백엔드에 상관없이 재사용할 수 있도록 미리 컴파일한 CSS 선택자"""
+
+    __slots__ = ("css", "compiled")
+
+    def __init__(self, css: str):
+        self.css = css
+        self.compiled = soupsieve.compile(css)
+
+    def select(self, node) -> list:
+        if isinstance(node, SelectolaxNode):
+            return node.select(self.css)
+        return self.compiled.select(node)
+
+    def select_one(self, node):
+        if isinstance(node, SelectolaxNode):
+            return node.select_one(self.css)
+        return self.compiled.select_one(node)
+
+
+def _css(selector) -> str:
+    """문자열 또는 Selector에서 CSS 문자열을 꺼냅니다."""
+    return selector.css if isinstance(selector, Selector) else selector
+
+
+def resolve_backend(backend: str) -> str:
+    """설치 여부를 확인해 실제로 사용할 수 있는 백엔드를 반환합니다."""
+    if backend == BACKEND_SELECTOLAX and LexborHTMLParser is None:
+        _warn_once(backend, "selectolax가 설치되어 있지 않아 lxml로 대체합니다.")
+        backend = BACKEND_LXML
+    if backend == BACKEND_LXML and not HAS_LXML:
+        _warn_once(backend, "lxml이 설치되어 있지 않아 html.parser로 대체합니다.")
+        backend = BACKEND_HTML_PARSER
+    if backend not in BACKENDS:
+        _warn_once(backend, f"알 수 없는 파서 백엔드({backend}), html.parser를 사용합니다.")
+        backend = BACKEND_HTML_PARSER
+    return backend
+
+
+def _warn_once(key: str, message: str):
+    if key not in _warned:
+        _warned.add(key)
+        logger.warning(message)
+
+
+def _parse_overrides(value: Optional[str]) -> Dict[ScraperType, str]:
+    """"SCRAPER_TYPE=backend,..." 형식의 설정을 읽습니다."""
+    overrides = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        name, backend = (part.strip() for part in item.split("=", 1))
+        try:
+            overrides[ScraperType.from_str(name)] = backend
+        except KeyError:
+            logger.warning(f"HTML_PARSER_OVERRIDES의 알 수 없는 스크래퍼 타입: {name}")
+    return overrides
+
+
+PARSER_BACKEND_OVERRIDES = _parse_overrides(ENV["HTML_PARSER_OVERRIDES"])
+
+
+def get_parser_backend(scraper_type: ScraperType) -> str:
+    """스크래퍼 타입에 사용할 파서 백엔드를 반환합니다."""
+    backend = PARSER_BACKEND_OVERRIDES.get(scraper_type, ENV["HTML_PARSER"])
+    return resolve_backend(backend)
+
+
+def parse_html(
+    html_text: str,
+    backend: str = BACKEND_HTML_PARSER,
+    region: Optional[ListRegion] = None,
+):
+    """HTML 문자열을 지정한 백엔드로 파싱합니다.
+
+    region이 지정되면 BeautifulSoup 백엔드는 SoupStrainer로 해당 영역의 하위
+    트리만 만듭니다. 영역을 찾지 못하면 전체 페이지를 다시 파싱합니다.
+    selectolax는 전체 파싱 비용이 작아 region을 적용하지 않습니다.
+
+    Returns:
+        BeautifulSoup 백엔드는 BeautifulSoup 객체,
+        selectolax 백엔드는 SelectolaxNode 객체를 반환합니다.
+    """
+    backend = resolve_backend(backend)
+    if backend == BACKEND_SELECTOLAX:
+        return SelectolaxNode(LexborHTMLParser(html_text))
+
+    if region:
+        name, attrs = region
+        soup = BeautifulSoup(
+            html_text, backend, parse_only=SoupStrainer(name, attrs or {})
+        )
+        if soup.contents:
+            return soup
+        logger.debug("목록 영역을 찾지 못해 전체 페이지를 파싱합니다: %s", region)
+
+    return BeautifulSoup(html_text, backend)
@@ -0,0 +1,23 @@
+from typing import Optional
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """프로세스 전체에서 공유하는 aiohttp 세션을 반환합니다.
+
+    요청마다 세션을 새로 만들지 않고 커넥션 풀을 재사용합니다.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+    return _session
+
+
+async def close_session():
+    """공유 세션을 종료합니다."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
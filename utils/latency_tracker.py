@@ -0,0 +1,153 @@
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+from template.notice_data import NoticeData
+from utils.scraper_type import ScraperType
+
+# 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, 21600)
+
+# 단계 이름 (감지 → 저장 → 전송 대기 → 전송 완료)
+STAGE_SAVE = "감지→저장"
+STAGE_ENQUEUE = "저장→전송대기"
+STAGE_DELIVER = "전송대기→전송"
+STAGE_TOTAL = "감지→전송"
+STAGES = (STAGE_SAVE, STAGE_ENQUEUE, STAGE_DELIVER, STAGE_TOTAL)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # 마지막 칸은 가장 큰 버킷을 넘는 값
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        """지연 시간(초)을 기록합니다."""
+        value = max(value, 0.0)
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준의 근사 백분위수(초)를 반환합니다."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> str:
+        """히스토그램 요약 문자열을 반환합니다."""
+        if not self.count:
+            return "n=0"
+        return (
+            f"n={self.count} 평균={self.total / self.count:.1f}s "
+            f"p50≤{self.percentile(0.5):g}s p95≤{self.percentile(0.95):g}s "
+            f"최대={self.max:.1f}s"
+        )
+
+
+class LatencyTracker:
+    """공지사항 감지부터 채널 전송까지의 단계별 지연 시간을 집계하는 클래스
+
+    NoticeData에 기록된 단계별 시각(detected_at, saved_at, enqueued_at)을 이용해
+    스크래퍼 타입별 단계 히스토그램과 채널별 전체 지연 히스토그램을 유지합니다.
+    """
+
+    def __init__(self):
+        self.by_scraper: Dict[ScraperType, Dict[str, LatencyHistogram]] = {}
+        self.by_channel: Dict[str, LatencyHistogram] = {}
+        # 마지막 로그 요약 이후 갱신된 스크래퍼 타입
+        self._dirty: Set[ScraperType] = set()
+
+    def _observe(self, scraper_type: ScraperType, stage: str, value: float):
+        stages = self.by_scraper.setdefault(
+            scraper_type, {name: LatencyHistogram() for name in STAGES}
+        )
+        stages[stage].observe(value)
+        self._dirty.add(scraper_type)
+
+    def mark_detected(self, notice: NoticeData):
+        """check_updates에서 새 공지사항으로 처음 판정된 시각을 기록합니다."""
+        notice.detected_at = time.time()
+
+    def mark_saved(self, notice: NoticeData):
+        """DB 저장 완료 시각을 기록합니다."""
+        notice.saved_at = time.time()
+        if notice.detected_at is not None:
+            self._observe(
+                notice.scraper_type, STAGE_SAVE, notice.saved_at - notice.detected_at
+            )
+
+    def mark_enqueued(self, notice: NoticeData):
+        """전송 대기열에 들어간 시각을 기록합니다."""
+        notice.enqueued_at = time.time()
+        if notice.saved_at is not None:
+            self._observe(
+                notice.scraper_type,
+                STAGE_ENQUEUE,
+                notice.enqueued_at - notice.saved_at,
+            )
+
+    def mark_delivered(self, notice: NoticeData, channel_id: str):
+        """채널 하나에 전송이 완료된 시각을 기록합니다."""
+        now = time.time()
+        if notice.enqueued_at is not None:
+            self._observe(notice.scraper_type, STAGE_DELIVER, now - notice.enqueued_at)
+        if notice.detected_at is not None:
+            total = now - notice.detected_at
+            self._observe(notice.scraper_type, STAGE_TOTAL, total)
+            self.by_channel.setdefault(channel_id, LatencyHistogram()).observe(total)
+
+    def get_scraper_summaries(self) -> List[str]:
+        """스크래퍼 타입별 전체(감지→전송) 지연 요약을 느린 순으로 반환합니다."""
+        rows = sorted(
+            self.by_scraper.items(),
+            key=lambda item: item[1][STAGE_TOTAL].percentile(0.95),
+            reverse=True,
+        )
+        return [
+            f"{scraper_type.get_korean_name()}: {stages[STAGE_TOTAL].summary()}"
+            for scraper_type, stages in rows
+        ]
+
+    def get_stage_summaries(self, scraper_type: ScraperType) -> List[str]:
+        """특정 스크래퍼 타입의 단계별 지연 요약을 반환합니다."""
+        stages = self.by_scraper.get(scraper_type)
+        if not stages:
+            return []
+        return [f"{stage}: {stages[stage].summary()}" for stage in STAGES]
+
+    def get_channel_summaries(self, limit: int = 10) -> List[str]:
+        """채널별 전체 지연 요약을 느린 순으로 최대 limit개 반환합니다."""
+        rows = sorted(
+            self.by_channel.items(),
+            key=lambda item: item[1].percentile(0.95),
+            reverse=True,
+        )[:limit]
+        return [f"{channel_id}: {histogram.summary()}" for channel_id, histogram in rows]
+
+    def log_summary(self, logger, scraper_type: Optional[ScraperType] = None):
+        """마지막 요약 이후 갱신된 스크래퍼 타입의 단계별 지연을 로그로 남깁니다."""
+        targets = [scraper_type] if scraper_type else list(self._dirty)
+        for target in targets:
+            if target not in self._dirty:
+                continue
+            self._dirty.discard(target)
+            logger.info(
+                f"[지연 시간] {target.get_korean_name()} | "
+                + " | ".join(self.get_stage_summaries(target))
+            )
+
+
+latency_tracker = LatencyTracker()
@@ -0,0 +1,128 @@
+import math
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import List
+from pymongo.errors import DuplicateKeyError
+from config.db_config import get_database
+from config.logger_config import setup_logger
+from utils.scraper_type import ScraperType
+
+logger = setup_logger(__name__)
+
+# 스크래퍼 타입별 임대 정보 ({_id: 스크래퍼 타입 이름, owner, expires_at})
+LEASES_COLLECTION = "scraper-leases"
+# 살아있는 워커 목록 ({_id: 워커 ID, hostname, pid, heartbeat_at})
+WORKERS_COLLECTION = "scrape-workers"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class LeaseManager:
+    """여러 스크랩 워커가 게시판(ScraperType)을 나눠 맡도록 임대를 관리하는 클래스
+
+    워커는 주기적으로 rebalance를 호출해 하트비트를 남기고 임대를 갱신합니다.
+    살아있는 워커 수로 나눈 몫만큼만 임대를 가지며, 넘치면 반납하고 모자라면
+    만료된 임대를 가져옵니다. 워커가 죽으면 임대가 만료되어 다른 워커가 이어받습니다.
+    """
+
+    def __init__(self, worker_id: str, lease_seconds: int):
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.owned: List[ScraperType] = []
+
+    def _collections(self):
+        db = get_database()
+        return db[LEASES_COLLECTION], db[WORKERS_COLLECTION]
+
+    def _heartbeat(self, workers, now: datetime):
+        workers.update_one(
+            {"_id": self.worker_id},
+            {
+                "$set": {
+                    "hostname": socket.gethostname(),
+                    "pid": os.getpid(),
+                    "heartbeat_at": now,
+                }
+            },
+            upsert=True,
+        )
+
+    def _live_worker_count(self, workers, now: datetime) -> int:
+        since = now - timedelta(seconds=self.lease_seconds)
+        return max(workers.count_documents({"heartbeat_at": {"$gte": since}}), 1)
+
+    def _try_claim(self, leases, name: str, now: datetime) -> bool:
+        """임대가 없거나 만료되었으면 가져옵니다. 다른 워커가 갖고 있으면 False를 반환합니다."""
+        try:
+            leases.update_one(
+                {
+                    "_id": name,
+                    "$or": [
+                        {"owner": self.worker_id},
+                        {"expires_at": {"$lt": now}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "owner": self.worker_id,
+                        "expires_at": now + timedelta(seconds=self.lease_seconds),
+                    }
+                },
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            # 다른 워커의 유효한 임대가 있어 upsert가 충돌함
+            return False
+
+    def rebalance(self, scraper_types: List[ScraperType]) -> List[ScraperType]:
+        """하트비트를 남기고 임대를 갱신/반납/획득한 뒤 맡은 스크래퍼 타입 목록을 반환합니다."""
+        leases, workers = self._collections()
+        now = datetime.now(timezone.utc)
+        self._heartbeat(workers, now)
+
+        share = math.ceil(len(scraper_types) / self._live_worker_count(workers, now))
+        names = [scraper_type.name for scraper_type in scraper_types]
+
+        # 가진 임대 갱신
+        leases.update_many(
+            {"owner": self.worker_id},
+            {"$set": {"expires_at": now + timedelta(seconds=self.lease_seconds)}},
+        )
+        owned = [
+            lease["_id"]
+            for lease in leases.find({"owner": self.worker_id}, {"_id": 1})
+            if lease["_id"] in names
+        ]
+
+        # 몫보다 많으면 반납 (다른 워커가 만료 없이 바로 가져갈 수 있도록 삭제)
+        for name in owned[share:]:
+            leases.delete_one({"_id": name, "owner": self.worker_id})
+            logger.info(f"임대 반납: {name}")
+        owned = owned[:share]
+
+        # 몫보다 적으면 비어 있거나 만료된 임대를 가져옴
+        for name in names:
+            if len(owned) >= share:
+                break
+            if name in owned:
+                continue
+            if self._try_claim(leases, name, now):
+                owned.append(name)
+                logger.info(f"임대 획득: {name}")
+
+        self.owned = [ScraperType[name] for name in names if name in owned]
+        return self.owned
+
+    def release_all(self):
+        """종료할 때 모든 임대를 반납하고 워커 목록에서 빠집니다."""
+        try:
+            leases, workers = self._collections()
+            leases.delete_many({"owner": self.worker_id})
+            workers.delete_one({"_id": self.worker_id})
+        except Exception as e:
+            logger.error(f"임대 반납 중 오류 발생: {e}")
+        self.owned = []
@@ -0,0 +1,185 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from config.env_loader import ENV
+from config.logger_config import get_task_activity, setup_logger
+from utils.metrics import LOOP_LAG_SECONDS, LOOP_STALLS, LOOP_STALL_SECONDS
+
+logger = setup_logger(__name__)
+
+# 프로젝트 코드 경로 (가상환경/표준 라이브러리 프레임과 구분해 멈춘 위치를 찾는 데 사용)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+# 로그와 보고서에 남길 스택 프레임 수
+STACK_DEPTH = 12
+
+
+@dataclass
+class Offender:
+    """같은 작업·같은 위치에서 이벤트 루프를 멈춘 기록 모음"""
+
+    activity: str
+    location: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    stack: List[str] = field(default_factory=list)
+
+
+class LoopWatchdog:
+    """이벤트 루프 지연을 계속 측정하고, 루프를 멈춘 호출의 스택을 잡아 작업별로 집계합니다.
+
+    루프 안의 heartbeat 코루틴이 interval마다 깨어나 마지막 박동 시각을 남기고, 별도 스레드가
+    박동이 threshold초 넘게 끊기면 루프 스레드의 현재 스택(sys._current_frames)을 잡습니다.
+    그 순간 실행 중이던 태스크의 작업 이름(log_context의 게시판, 명령어)으로 원인을 돌리고,
+    루프가 다시 돌면 실제로 멈춘 시간을 더해 순위를 매깁니다.
+
+    Args:
+        threshold: 멈춤으로 볼 지연 (초)
+    """
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.interval = max(threshold / 5, 0.05)
+        self.offenders: Dict[Tuple[str, str], Offender] = {}
+        self.stalls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        # 감시 스레드가 잡은, 아직 길이가 정해지지 않은 멈춤 (박동 시각, 작업, 위치, 스택)
+        self._pending: Optional[Tuple[float, str, str, List[str]]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> asyncio.Task:
+        """감시 스레드와 heartbeat 태스크를 시작합니다. 이벤트 루프 안에서 호출해야 합니다."""
+        self._loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"이벤트 루프 감시를 시작합니다 (기준 {self.threshold}초)")
+        return asyncio.ensure_future(self._heartbeat())
+
+    def stop(self):
+        self._stop.set()
+
+    async def _heartbeat(self):
+        try:
+            while True:
+                started = time.monotonic()
+                self._last_beat = started
+                await asyncio.sleep(self.interval)
+                lag = max(time.monotonic() - started - self.interval, 0.0)
+                LOOP_LAG_SECONDS.observe(lag)
+                if lag >= self.threshold:
+                    self._record_stall(started, lag)
+        finally:
+            self.stop()
+
+    def _watch(self):
+        """박동이 끊긴 동안 루프 스레드의 스택을 한 번 잡습니다."""
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            if time.monotonic() - beat < self.threshold:
+                continue
+            with self._lock:
+                if self._pending is not None and self._pending[0] == beat:
+                    continue  # 이번 멈춤은 이미 잡음
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            activity = self._current_activity()
+            location, stack = self._describe(frame)
+            with self._lock:
+                self._pending = (beat, activity, location, stack)
+
+    def _current_activity(self) -> str:
+        """멈춘 순간 실행 중인 태스크의 작업 이름을 찾습니다."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        if task is None:
+            # 태스크 밖 (콜백, 스레드 풀 결과 처리 등)
+            return "(콜백)"
+        return get_task_activity(task) or f"태스크:{task.get_name()}"
+
+    def _describe(self, frame) -> Tuple[str, List[str]]:
+        """스택에서 가장 안쪽의 프로젝트 코드 위치와 출력용 스택을 만듭니다."""
+        summary = traceback.extract_stack(frame)
+        location = None
+        for entry in reversed(summary):
+            if entry.filename.startswith(PROJECT_ROOT) and "site-packages" not in entry.filename:
+                relative = entry.filename[len(PROJECT_ROOT) + 1 :]
+                location = f"{relative}:{entry.lineno} {entry.name}"
+                break
+        if location is None:
+            innermost = summary[-1]
+            location = f"{Path(innermost.filename).name}:{innermost.lineno} {innermost.name}"
+        stack = [
+            line.rstrip() for line in traceback.format_list(summary[-STACK_DEPTH:])
+        ]
+        return location, stack
+
+    def _record_stall(self, beat: float, seconds: float):
+        """루프가 다시 돌았을 때 멈춘 시간을 원인에 더합니다."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None and pending[0] == beat:
+            _, activity, location, stack = pending
+        else:
+            # 감시 스레드가 스택을 잡기 전에 루프가 다시 돔
+            activity, location, stack = "(알 수 없음)", "(스택 없음)", []
+
+        self.stalls += 1
+        LOOP_STALLS.inc(activity=activity)
+        LOOP_STALL_SECONDS.inc(seconds, activity=activity)
+
+        offender = self.offenders.get((activity, location))
+        if offender is None:
+            offender = self.offenders[(activity, location)] = Offender(activity, location)
+        offender.count += 1
+        offender.total += seconds
+        offender.max = max(offender.max, seconds)
+        if stack:
+            offender.stack = stack
+
+        logger.warning(
+            "이벤트 루프가 %.2f초 멈췄습니다 (%s, %s)\n%s",
+            seconds,
+            activity,
+            location,
+            "\n".join(stack),
+        )
+
+    def top(self, limit: int = 10) -> List[Offender]:
+        """멈춘 시간 합계가 큰 순서로 원인을 반환합니다."""
+        return sorted(self.offenders.values(), key=lambda o: o.total, reverse=True)[
+            :limit
+        ]
+
+    def report(self, limit: int = 10) -> str:
+        """원인 순위를 문자열로 반환합니다."""
+        offenders = self.top(limit)
+        if not offenders:
+            return f"기준({self.threshold}초)을 넘긴 이벤트 루프 멈춤이 없습니다."
+        lines = [f"이벤트 루프 멈춤 {self.stalls}회 (기준 {self.threshold}초)"]
+        for rank, offender in enumerate(offenders, 1):
+            lines.append(
+                f"{rank}. {offender.activity} — {offender.location}: "
+                f"{offender.count}회, 합계 {offender.total:.2f}s, 최대 {offender.max:.2f}s"
+            )
+        return "\n".join(lines)
+
+
+# 프로세스에 하나인 루프 감시 (main.py/scrape_worker.py에서 시작)
+loop_watchdog = LoopWatchdog(ENV["LOOP_WATCHDOG_THRESHOLD"])
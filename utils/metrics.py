@@ -0,0 +1,258 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from aiohttp import web
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# 히스토그램 기본 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Prometheus 텍스트 형식으로 내보내는 지표의 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.type_name}",
+        ] + self.samples()
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in sorted(self.values.items())
+        ]
+
+
+class Gauge(Metric):
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels):
+        self.values[self._key(labels)] = value
+
+    def set_function(self, function: Callable[[], float]):
+        """내보낼 때마다 function()을 호출해 값을 읽습니다 (라벨 없는 지표 전용)."""
+        self._function = function
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            try:
+                self.values[()] = self._function()
+            except Exception as e:
+                logger.error(f"지표 {self.name} 값 읽기 실패: {e}")
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in sorted(self.values.items())
+        ]
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+        # 라벨별 (버킷별 개수, 합계, 전체 개수)
+        self.values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        entry = self.values.get(key)
+        if entry is None:
+            entry = self.values[key] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            entry[0][index] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.label_names, key, f'le="{_format_value(bound)}"'
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """프로세스 안의 지표 모음"""
+
+    def __init__(self):
+        self.metrics: List[Metric] = []
+
+    def _register(self, metric: Metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, description: str, labels: Sequence[str] = ()):
+        return self._register(Counter(name, description, labels))
+
+    def gauge(self, name: str, description: str, labels: Sequence[str] = ()):
+        return self._register(Gauge(name, description, labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        return self._register(Histogram(name, description, labels, buckets=buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# 스크래핑
+SCRAPER_STAGE_SECONDS = registry.histogram(
+    "kookmin_scraper_stage_seconds",
+    "check_updates 단계별 소요 시간 (db_load, fetch, decode, parse, parse_element, dedup)",
+    ("scraper_type", "stage"),
+)
+FETCH_RESPONSES = registry.counter(
+    "kookmin_fetch_responses_total",
+    "호스트별 페이지 요청 결과 (HTTP 상태 코드, error, circuit_open)",
+    ("host", "status"),
+)
+NEW_NOTICES = registry.counter(
+    "kookmin_new_notices_total", "새로 감지한 공지사항 수", ("scraper_type",)
+)
+DEDUP_HITS = registry.counter(
+    "kookmin_dedup_hits_total", "이미 등록되어 건너뛴 공지사항 수", ("scraper_type",)
+)
+TICK_SECONDS = registry.histogram(
+    "kookmin_tick_seconds",
+    "확인 틱 하나의 소요 시간",
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600),
+)
+TICK_OVERRUNS = registry.counter(
+    "kookmin_tick_overruns_total", "시간 예산(TICK_BUDGET_SECONDS)을 넘긴 틱 수"
+)
+TICK_DEFERRED_BOARDS = registry.counter(
+    "kookmin_tick_deferred_boards_total",
+    "시간 예산이 끝나 다음 틱으로 넘긴 게시판 수",
+    ("scraper_type",),
+)
+TICK_BACKLOG = registry.gauge(
+    "kookmin_tick_backlog_boards", "확인 주기가 지났지만 다음 틱으로 밀린 게시판 수"
+)
+TICK_START_DELAY_SECONDS = registry.histogram(
+    "kookmin_tick_start_delay_seconds",
+    "틱이 예정 시각(이전 틱 시작 + 주기)보다 늦게 시작한 시간",
+    buckets=(0.1, 1, 5, 10, 30, 60, 120, 300),
+)
+
+# DB
+MONGO_SECONDS = registry.histogram(
+    "kookmin_mongo_operation_seconds", "MongoDB 작업 소요 시간", ("operation",)
+)
+
+# 디스코드 전송
+DISCORD_SENDS = registry.counter(
+    "kookmin_discord_sends_total",
+    "디스코드 전송 결과 (method: webhook/bot, result: success/failure, reason: 실패 사유)",
+    ("method", "result", "reason"),
+)
+NOTICE_QUEUE_DEPTH = registry.gauge(
+    "kookmin_notice_queue_depth", "전송을 기다리는 공지사항 수"
+)
+
+# 이벤트 루프
+LOOP_LAG_SECONDS = registry.histogram(
+    "kookmin_event_loop_lag_seconds",
+    "이벤트 루프 지연 (예약한 깨어날 시각보다 늦어진 시간)",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+LOOP_STALLS = registry.counter(
+    "kookmin_event_loop_stalls_total",
+    "LOOP_WATCHDOG_THRESHOLD를 넘긴 이벤트 루프 멈춤 수 (activity: 멈춘 순간의 게시판/명령어)",
+    ("activity",),
+)
+LOOP_STALL_SECONDS = registry.counter(
+    "kookmin_event_loop_stall_seconds_total",
+    "이벤트 루프가 멈춘 시간 합계",
+    ("activity",),
+)
+
+
+async def start_metrics_server(host: str, port: int) -> web.AppRunner:
+    """/metrics 경로로 지표를 내보내는 HTTP 서버를 시작합니다."""
+
+    async def handle_metrics(request):
+        return web.Response(
+            body=registry.render().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"지표 서버를 시작했습니다: http://{host}:{port}/metrics")
+    return runner
@@ -0,0 +1,120 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+from template.notice_data import NoticeData
+from utils.scraper_type import ScraperType
+from utils.date_parser import KST
+
+logger = setup_logger(__name__)
+
+# 워커가 돌려주는 공지 (제목, 링크, 작성일 ISO 문자열)
+NoticeTuple = Tuple[str, str, str]
+
+# 워커 프로세스 안에서만 쓰는 상태
+_worker_scrapers: Dict[str, object] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_worker_scraper(scraper_type_name: str):
+    """워커 프로세스에서 스크래퍼 타입별 인스턴스를 한 번만 생성합니다."""
+    scraper = _worker_scrapers.get(scraper_type_name)
+    if scraper is None:
+        # 워커 프로세스에서 처음 쓸 때 import (메인 프로세스의 순환 import 방지)
+        from utils.scraper_factory import ScraperFactory
+
+        scraper = ScraperFactory().create_scraper(ScraperType[scraper_type_name])
+        _worker_scrapers[scraper_type_name] = scraper
+    return scraper
+
+
+def parse_in_worker(
+    scraper_type_name: str, html_text: str, recent_links: frozenset
+) -> List[NoticeTuple]:
+    """워커 프로세스에서 목록 페이지를 파싱해 공지 튜플 목록을 반환합니다.
+
+    이벤트 루프를 거치지 않는 순수 CPU 작업이므로 parse_notice_from_element가
+    네트워크 요청을 하지 않는 스크래퍼만 사용할 수 있습니다.
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+
+    scraper = _get_worker_scraper(scraper_type_name)
+    soup = scraper.parse_html(html_text)
+    notices = _worker_loop.run_until_complete(
+        scraper.collect_notices(soup, recent_links)
+    )
+    return [
+        (notice.title, notice.link, notice.published.isoformat())
+        for notice in notices
+    ]
+
+
+class ParsePool:
+    """목록 페이지 파싱을 별도 프로세스에서 실행하는 풀
+
+    PARSE_POOL_SIZE가 0이면 사용하지 않고 이벤트 루프에서 그대로 파싱합니다.
+    풀은 처음 사용할 때 생성합니다.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 디스코드 게이트웨이 스레드가 도는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.size,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"파싱 프로세스 풀 시작 (워커 {self.size}개)")
+        return self._executor
+
+    async def parse(
+        self, scraper_type: ScraperType, html_text: str, recent_links: set
+    ) -> List[NoticeData]:
+        """워커 프로세스에서 파싱한 결과를 NoticeData 목록으로 반환합니다."""
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(
+            self._get_executor(),
+            parse_in_worker,
+            scraper_type.name,
+            html_text,
+            frozenset(recent_links),
+        )
+        return [
+            NoticeData(
+                title=title,
+                link=link,
+                published=datetime.fromisoformat(published).astimezone(KST),
+                scraper_type=scraper_type,
+            )
+            for title, link, published in rows
+        ]
+
+    def shutdown(self):
+        """풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def restart(self):
+        """실행 중인 워커를 정리해, 다음 파싱부터 새 워커가 게시판 설정을 다시 읽도록 합니다.
+
+        워커는 만들어 둔 스크래퍼와 board_templates를 재사용하므로 설정을 다시 읽은 뒤 호출해야 합니다.
+        """
+        if self._executor is not None:
+            self.shutdown()
+            logger.info("게시판 설정이 바뀌어 파싱 프로세스 풀을 다시 시작합니다")
+
+
+parse_pool = ParsePool(ENV["PARSE_POOL_SIZE"])
@@ -0,0 +1,175 @@
+import json
+import os
+from datetime import date, datetime
+from typing import Dict, List, Optional
+import pytz
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+from config.scrape_config import INTERVAL
+from utils.scraper_category import ScraperCategory
+from utils.scraper_type import ScraperType
+
+logger = setup_logger(__name__)
+
+KST = pytz.timezone("Asia/Seoul")
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+# 기간/게시판 설정에서 덮어쓸 수 있는 항목
+POLICY_KEYS = ("windows", "interval", "off_hours_interval")
+
+
+def _minutes(text: str) -> int:
+    """HH:MM 형식을 자정 기준 분으로 변환합니다 (24:00 허용)."""
+    hour, minute = text.split(":")
+    return int(hour) * 60 + int(minute)
+
+
+def _in_window(window: dict, now: datetime) -> bool:
+    if DAY_NAMES[now.weekday()] not in window.get("days", DAY_NAMES):
+        return False
+    start, end = _minutes(window["start"]), _minutes(window["end"])
+    current = now.hour * 60 + now.minute
+    if start <= end:
+        return start <= current < end
+    # 자정을 넘는 구간 (예: 22:00 ~ 02:00)
+    return current >= start or current < end
+
+
+class Scheduler:
+    """게시판별 확인 주기를 정하는 일정 엔진
+
+    config/schedule.json의 기본값 → 카테고리 → 게시판 → 해당 날짜의 기간(방학, 수강신청 등)
+    순서로 설정을 덮어써 게시판별 정책을 만듭니다. 작동 구간(windows) 안에서는 interval,
+    밖에서는 off_hours_interval(분, null이면 확인하지 않음)마다 확인하며, 공휴일은 하루 전체를
+    작동 구간 밖으로 봅니다. 설정 파일이 바뀌면 다음 확인 때 다시 읽습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.config: dict = {}
+        self.holidays = set()
+        self._mtime: Optional[float] = None
+        # 게시판별 마지막 확인 시각
+        self.last_run: Dict[ScraperType, datetime] = {}
+        # 틱 시간 예산이 끝나 다음 틱으로 넘긴 게시판과 처음 넘긴 시각
+        self.deferred: Dict[ScraperType, datetime] = {}
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        """설정 파일이 바뀌었으면 다시 읽습니다. 읽기에 실패하면 이전 설정을 유지합니다."""
+        try:
+            mtime = os.path.getmtime(self.path)
+            if mtime == self._mtime:
+                return
+            with open(self.path, encoding="utf-8") as f:
+                config = json.load(f)
+            self.holidays = {
+                date.fromisoformat(holiday) for holiday in config.get("holidays", [])
+            }
+            self.config = config
+            self._mtime = mtime
+            logger.info(f"일정 설정을 읽었습니다: {self.path}")
+        except Exception as e:
+            logger.error(f"일정 설정을 읽는 중 오류 발생: {e}")
+
+    def _period_applies(self, period: dict, scraper_type: ScraperType, today: date):
+        if not (
+            date.fromisoformat(period["start"])
+            <= today
+            <= date.fromisoformat(period["end"])
+        ):
+            return False
+        category = ScraperCategory.find_category_by_scraper(scraper_type)
+        category_name = category.name if category else None
+        if scraper_type.name in period.get("exclude_boards", []):
+            return False
+        if category_name in period.get("exclude_categories", []):
+            return False
+
+        boards = period.get("boards")
+        categories = period.get("categories")
+        if boards is None and categories is None:
+            return True
+        return scraper_type.name in (boards or []) or category_name in (
+            categories or []
+        )
+
+    def get_policy(self, scraper_type: ScraperType, now: datetime) -> dict:
+        """해당 시각에 적용되는 게시판 정책을 반환합니다."""
+        policy = dict(self.config.get("default", {}))
+
+        category = ScraperCategory.find_category_by_scraper(scraper_type)
+        if category:
+            policy.update(self.config.get("categories", {}).get(category.name, {}))
+        policy.update(self.config.get("boards", {}).get(scraper_type.name, {}))
+
+        today = now.date()
+        for period in self.config.get("periods", []):
+            if self._period_applies(period, scraper_type, today):
+                policy.update({k: v for k, v in period.items() if k in POLICY_KEYS})
+                policy["period"] = period.get("name")
+
+        if today in self.holidays:
+            policy["windows"] = []
+            policy["holiday"] = True
+        return policy
+
+    def get_interval(self, scraper_type: ScraperType, now: datetime) -> Optional[float]:
+        """해당 시각의 확인 주기(분)를 반환합니다. None이면 확인하지 않습니다."""
+        # 개발 환경은 일정과 관계없이 모든 게시판을 짧은 주기로 확인
+        if not ENV["IS_PROD"]:
+            return INTERVAL
+
+        policy = self.get_policy(scraper_type, now)
+        if any(_in_window(window, now) for window in policy.get("windows", [])):
+            return policy.get("interval", INTERVAL)
+        return policy.get("off_hours_interval")
+
+    def get_due_scrapers(
+        self, scraper_types: List[ScraperType], now: Optional[datetime] = None
+    ) -> List[ScraperType]:
+        """확인 주기가 지난 게시판 목록을 반환합니다.
+
+        확인한 지 오래된 게시판(처음 확인하는 게시판, 이전 틱에서 넘긴 게시판 포함)부터 정렬하므로
+        틱 시간 예산이 끝나 뒤쪽 게시판을 넘기더라도 다음 틱에는 그 게시판이 먼저 실행됩니다.
+        """
+        self.reload_if_changed()
+        now = now or self.now()
+
+        due = []
+        for scraper_type in scraper_types:
+            interval = self.get_interval(scraper_type, now)
+            if interval is None:
+                continue
+            last_run = self.last_run.get(scraper_type)
+            # 1분 단위 루프의 실행 시각 오차만큼 여유를 둠
+            elapsed = (now - last_run).total_seconds() if last_run else None
+            if elapsed is None or elapsed >= interval * 60 - 5:
+                due.append(scraper_type)
+        # 넘긴 사이 작동 구간이 끝나는 등 더 이상 확인 대상이 아니면 밀린 게시판에서 뺌
+        for scraper_type in scraper_types:
+            if scraper_type not in due:
+                self.deferred.pop(scraper_type, None)
+        # 정렬은 안정 정렬이므로 같은 조건이면 원래 순서를 유지
+        due.sort(key=self._last_run_key)
+        return due
+
+    def _last_run_key(self, scraper_type: ScraperType) -> float:
+        last_run = self.last_run.get(scraper_type)
+        return last_run.timestamp() if last_run else float("-inf")
+
+    def mark_run(self, scraper_type: ScraperType, now: Optional[datetime] = None):
+        self.last_run[scraper_type] = now or self.now()
+        self.deferred.pop(scraper_type, None)
+
+    def defer(self, scraper_types: List[ScraperType], now: Optional[datetime] = None):
+        """이번 틱에 시작하지 못한 게시판을 기록합니다 (확인 시각은 바꾸지 않으므로 다음 틱에도 대상)."""
+        now = now or self.now()
+        for scraper_type in scraper_types:
+            self.deferred.setdefault(scraper_type, now)
+
+    def now(self) -> datetime:
+        """현재 시각 (재생 모드에서는 가상 시계로 바꿔 끼웁니다)."""
+        return datetime.now(KST)
+
+
+scheduler = Scheduler(ENV["SCHEDULE_PATH"])
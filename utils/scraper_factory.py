@@ -1,11 +1,9 @@
-from typing import Optional, Dict, Type
-import os
 import importlib
+from typing import Dict, List, Optional
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
-from web_scraper.rss_notice_scraper import RSSNoticeScraper
-import sys
-from pathlib import Path
+from utils.scraper_registry import load_scraper_class
+from utils.parse_pool import parse_pool
 from config.logger_config import setup_logger
 
 # 로거 설정
@@ -13,84 +11,23 @@ logger = setup_logger(__name__)
 
 
 class ScraperFactory:
-    """스크래퍼 객체를 생성하는 팩토리 클래스"""
+    """스크래퍼 객체를 생성하는 팩토리 클래스
 
-    _instance = None
-    _scraper_classes: Dict[str, Type[WebScraper]] = {}
-
-    @classmethod
-    def _initialize_scraper_classes(cls):
-        """web_scraper 폴더의 모든 스크래퍼 클래스를 동적으로 import하여 초기화합니다."""
-        logger.info("=" * 65)
-        logger.info("▶ 스크래퍼 팩토리 초기화 시작")
-        logger.info("=" * 65)
-
-        # RSS 스크래퍼 추가 (utils 폴더에 있음)
-        cls._scraper_classes["RSSNoticeScraper"] = RSSNoticeScraper
-        logger.info(f"RSSNoticeScraper 클래스가 추가되었습니다.")
-
-        # web_scraper 폴더 경로 설정
-        current_dir = Path(__file__).parent.parent
-        scraper_dir = current_dir / "web_scraper"
-
-        # Python path에 web_scraper 폴더 추가
-        sys.path.append(str(current_dir))
-
-        try:
-            # web_scraper 폴더의 모든 .py 파일을 검사
-            for filename in os.listdir(scraper_dir):
-                if filename.endswith("_scraper.py") and not filename.startswith("__"):
-                    # 파일 이름에서 .py 확장자 제거
-                    module_name = filename[:-3]
-
-                    try:
-                        # 모듈 import
-                        module = importlib.import_module(f"web_scraper.{module_name}")
-
-                        # rss가 포함된 모듈은 이미 처리되었으므로 건너뜀
-                        if "rss" in module_name.lower():
-                            logger.info(
-                                f"RSS 모듈은 별도로 처리되었으므로 건너뜁니다: {module_name}"
-                            )
-                            continue
-
-                        # snake_case를 CamelCase로 변환
-                        class_name = "".join(
-                            word.capitalize() for word in module_name.split("_")
-                        )
-
-                        logger.debug(
-                            f"모듈: {module_name} -> 클래스: {class_name} 변환 시도"
-                        )
-
-                        # 해당 클래스가 모듈에 존재하는지 확인하고 추가
-                        if hasattr(module, class_name):
-                            cls._scraper_classes[class_name] = getattr(
-                                module, class_name
-                            )
-                            logger.info(f"스크래퍼 클래스 로드 성공: {class_name}")
-                        else:
-                            logger.error(
-                                f"Class {class_name} not found in module {module_name}"
-                            )
-
-                    except Exception as e:
-                        logger.error(f"모듈 임포트 오류 ({module_name}): {e}")
+    스크래퍼 클래스는 utils/scraper_registry.py에 등록된 경로에서 처음 사용할 때 import하므로
+    활성화된 게시판의 모듈만 메모리에 올라옵니다.
 
-        except Exception as e:
-            logger.error(f"web_scraper 디렉토리 스캔 중 오류 발생: {e}")
+    주기적인 확인에는 get_scraper로 게시판마다 하나씩 만들어 둔 스크래퍼를 재사용해
+    등록 공지 목록, 조건부 요청 헤더, 실패 대기 같은 상태를 틱 사이에 유지합니다.
+    """
 
-        logger.info(
-            f"총 {len(cls._scraper_classes)}개의 스크래퍼 클래스가 로드되었습니다."
-        )
-        logger.info("=" * 65)
-        logger.info("✅ 스크래퍼 팩토리 초기화 완료")
-        logger.info("=" * 65)
+    _instance = None
+    _scrapers: Dict[ScraperType, WebScraper] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._initialize_scraper_classes()
+            # 지정하면 생성하는 모든 스크래퍼에 page_source_factory(scraper_type)를 붙임 (오프라인 재생용)
+            cls._instance.page_source_factory = None
         return cls._instance
 
     def create_scraper(self, scraper_type: ScraperType) -> Optional[WebScraper]:
@@ -98,17 +35,75 @@ class ScraperFactory:
         url = scraper_type.get_url()
         scraper_class_name = scraper_type.get_scraper_class_name()
 
-        scraper_class = self._scraper_classes.get(scraper_class_name)
+        scraper_class = load_scraper_class(scraper_class_name)
 
         if not scraper_class:
             logger.error(f"스크래퍼 클래스를 찾을 수 없음: {scraper_class_name}")
             return None
 
-        logger.debug(f"스크래퍼 생성: {scraper_class_name} (URL: {url})")
+        logger.debug("스크래퍼 생성: %s (URL: %s)", scraper_class_name, url)
+
+        # RSS 스크래퍼와 게시판 템플릿 스크래퍼는 scraper_type도 전달
+        if (
+            scraper_type.name.endswith("_RSS")
+            or scraper_class_name == "BoardTemplateScraper"
+        ):
+            scraper = scraper_class(url, scraper_type)
+        else:
+            # 일반 스크래퍼인 경우
+            scraper = scraper_class(url)
+
+        if self.page_source_factory is not None:
+            scraper.page_source = self.page_source_factory(scraper_type)
+        return scraper
+
+    def get_scraper(self, scraper_type: ScraperType) -> Optional[WebScraper]:
+        """프로세스가 살아 있는 동안 재사용하는 스크래퍼를 반환합니다. 처음 요청되면 생성합니다."""
+        scraper = self._scrapers.get(scraper_type)
+        if scraper is None:
+            scraper = self.create_scraper(scraper_type)
+            if scraper is not None:
+                self._scrapers[scraper_type] = scraper
+        return scraper
+
+    def get_cached_types(self) -> List[ScraperType]:
+        """재사용 중인 스크래퍼의 타입 목록을 반환합니다."""
+        return list(self._scrapers)
+
+    def forget_seen(self, scraper_type: ScraperType):
+        """재사용 중인 스크래퍼의 등록 공지 목록을 버립니다 (다른 워커에서 넘겨받은 게시판 등)."""
+        scraper = self._scrapers.get(scraper_type)
+        if scraper is not None:
+            scraper.forget_seen()
+
+    def reload(self, scraper_type: Optional[ScraperType] = None) -> int:
+        """게시판 템플릿 설정을 다시 읽고 재사용 중인 스크래퍼에 적용합니다.
+
+        Args:
+            scraper_type: 지정하면 해당 게시판만, 없으면 모든 게시판에 적용
+
+        Returns:
+            int: 설정을 다시 적용한 스크래퍼 수
+        """
+        from config import board_templates
 
-        # RSS 스크래퍼인 경우 scraper_type도 전달
-        if scraper_type.name.endswith("_RSS"):
-            return scraper_class(url, scraper_type)
-
-        # 일반 스크래퍼인 경우
-        return scraper_class(url)
+        try:
+            importlib.reload(board_templates)
+        except Exception as e:
+            # 수정한 설정에 오류가 있으면 이전 설정을 유지
+            logger.error(f"게시판 템플릿 설정을 다시 읽는 중 오류 발생: {e}")
+            return 0
+
+        # 파싱 프로세스 풀의 워커는 이전 설정을 들고 있으므로 새로 띄움
+        parse_pool.restart()
+
+        reloaded = 0
+        for cached_type, scraper in self._scrapers.items():
+            if scraper_type is not None and cached_type != scraper_type:
+                continue
+            try:
+                scraper.reload()
+                reloaded += 1
+            except Exception as e:
+                logger.error(f"{cached_type.get_korean_name()} 설정 적용 중 오류 발생: {e}")
+        return reloaded
@@ -0,0 +1,51 @@
+import importlib
+from functools import lru_cache
+from typing import Dict, Optional, Type
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# 스크래퍼 클래스 이름 → "모듈:클래스" 경로
+# ScraperType의 scraper_class_name이 이 표의 키를 가리킵니다. 새 스크래퍼를 추가하면 여기에도 등록합니다.
+SCRAPER_CLASS_PATHS: Dict[str, str] = {
+    "ArchitectureAcademicScraper": "web_scraper.architecture_academic_scraper:ArchitectureAcademicScraper",
+    "ArtsAcademicScraper": "web_scraper.arts_academic_scraper:ArtsAcademicScraper",
+    "AutomativeengineeringAcademicScraper": "web_scraper.automativeengineering_academic_scraper:AutomativeengineeringAcademicScraper",
+    "BoardTemplateScraper": "web_scraper.board_template_scraper:BoardTemplateScraper",
+    "CreativeengineeringMechanicalAcademicScraper": "web_scraper.creativeengineering_mechanical_academic_scraper:CreativeengineeringMechanicalAcademicScraper",
+    "DesignCeramicsAcademicScraper": "web_scraper.design_ceramics_academic_scraper:DesignCeramicsAcademicScraper",
+    "DesignMetalworkAcademicScraper": "web_scraper.design_metalwork_academic_scraper:DesignMetalworkAcademicScraper",
+    "JoCodingYoutubeScraper": "web_scraper.jo_coding_youtube_scraper:JoCodingYoutubeScraper",
+    "LincAcademicScraper": "web_scraper.linc_academic_scraper:LincAcademicScraper",
+    "RSSNoticeScraper": "web_scraper.rss_notice_scraper:RSSNoticeScraper",
+    "SciencetechnologyChemistryAcademicScraper": "web_scraper.sciencetechnology_chemistry_academic_scraper:SciencetechnologyChemistryAcademicScraper",
+    "UniversityAcademicScraper": "web_scraper.university_academic_scraper:UniversityAcademicScraper",
+    "UniversityBukakpoliticalforumScraper": "web_scraper.university_bukakpoliticalforum_scraper:UniversityBukakpoliticalforumScraper",
+    "UniversityContesteventScraper": "web_scraper.university_contestevent_scraper:UniversityContesteventScraper",
+    "UniversityScholarshipScraper": "web_scraper.university_scholarship_scraper:UniversityScholarshipScraper",
+    "UniversitySpeciallectureScraper": "web_scraper.university_speciallecture_scraper:UniversitySpeciallectureScraper",
+    "UniversityThursdaylectureScraper": "web_scraper.university_thursdaylecture_scraper:UniversityThursdaylectureScraper",
+}
+
+
+@lru_cache(maxsize=None)
+def load_scraper_class(class_name: str) -> Optional[Type]:
+    """스크래퍼 클래스를 처음 요청될 때 import하고, 이후에는 캐시된 클래스를 반환합니다.
+
+    등록되지 않았거나 import에 실패하면 None을 반환합니다 (실패도 캐시되므로 재시작 전까지 다시 시도하지 않음).
+    """
+    path = SCRAPER_CLASS_PATHS.get(class_name)
+    if path is None:
+        logger.error(f"등록되지 않은 스크래퍼 클래스: {class_name}")
+        return None
+
+    module_name, _, attribute = path.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+        scraper_class = getattr(module, attribute)
+    except Exception as e:
+        logger.error(f"스크래퍼 클래스 로드 실패 ({path}): {e}")
+        return None
+
+    logger.debug("스크래퍼 클래스 로드: %s", class_name)
+    return scraper_class
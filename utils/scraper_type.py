@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import Optional
 from discord import app_commands
+from config.env_loader import ENV
 
 
 class ScraperType(Enum):
@@ -52,7 +53,7 @@ class ScraperType(Enum):
         "softwarecentered_academic",
         "SW중심대학사업단 학사공지",
         "https://software.kookmin.ac.kr/software/bulletin/notice.do",
-        "SoftwarecenteredAcademicScraper",
+        "BoardTemplateScraper",
     )
     BUSINESSADMINISTRATION_ACADEMIC_RSS = (
         "businessadministration_academic_rss",
@@ -70,7 +71,7 @@ class ScraperType(Enum):
         "socialscience_publicadministration_academic",
         "행정학과 학사공지",
         "http://cms.kookmin.ac.kr/paap/notice/notice.do",
-        "SocialsciencePublicadministrationAcademicScraper",
+        "BoardTemplateScraper",
     )
     CREATIVEENGINEERING_MECHANICAL_ACADEMIC = (
         "creativeengineering_mechanical_academic",
@@ -82,7 +83,7 @@ class ScraperType(Enum):
         "design_industrial_academic",
         "공업디자인학과 학사공지",
         "https://id.kookmin.ac.kr/id/intro/notice.do",
-        "DesignIndustrialAcademicScraper",
+        "BoardTemplateScraper",
     )
     DESIGN_METALWORK_ACADEMIC = (
         "design_metalwork_academic",
@@ -100,7 +101,7 @@ class ScraperType(Enum):
         "design_visual_academic",
         "시각디자인학과 학사공지",
         "https://vcd.kookmin.ac.kr/vcd/etc-board/vcdnotice.do",
-        "DesignVisualAcademicScraper",
+        "BoardTemplateScraper",
     )
     CREATIVEENGINEERING_ELECTRICAL_ACADEMIC_RSS = (
         "creativeengineering_electrical_academic_rss",
@@ -118,13 +119,13 @@ class ScraperType(Enum):
         "creativeengineering_advancedmaterials_academic",
         "신소재공학부 학사공지",
         "https://cms.kookmin.ac.kr/mse/bbs/notice.do",
-        "CreativeengineeringAdvancedmaterialsAcademicScraper",
+        "BoardTemplateScraper",
     )
     LAW_ACADEMIC = (
         "law_academic",
         "법과대학 학사공지",
         "https://law.kookmin.ac.kr/law/etc-board/notice01.do",
-        "LawAcademicScraper",
+        "BoardTemplateScraper",
     )
     UNIVERSITY_SPECIALLECTURE = (
         "university_speciallecture",
@@ -154,31 +155,31 @@ class ScraperType(Enum):
         "creativeengineering_civil_academic",
         "건설시스템공학부 학사공지",
         "https://cms.kookmin.ac.kr/cee/bbs/notice.do",
-        "CreativeengineeringCivilAcademicScraper",
+        "BoardTemplateScraper",
     )
     SCIENCETECHNOLOGY_SECURITY_ACADEMIC = (
         "sciencetechnology_security_academic",
         "정보보안암호수학과 학사공지",
         "https://cns.kookmin.ac.kr/cns/notice/academic-notice.do",
-        "SciencetechnologySecurityAcademicScraper",
+        "BoardTemplateScraper",
     )
     DESIGN_AUTOMOTIVE_ACADEMIC = (
         "design_automotive_academic",
         "자동차·운송디자인학과 학사공지",
         "https://mobility.kookmin.ac.kr/mobility/etc-board/employment-information.do",
-        "DesignAutomotiveAcademicScraper",
+        "BoardTemplateScraper",
     )
     SOCIALSCIENCE_EDUCATION_ACADEMIC = (
         "socialscience_education_academic",
         "교육학과 학사공지",
         "https://cms.kookmin.ac.kr/kmuedu/community/notice.do",
-        "SocialscienceEducationAcademicScraper",
+        "BoardTemplateScraper",
     )
     SOCIALSCIENCE_POLITICALSCIENCE_ACADEMIC = (
         "socialscience_politicalscience_academic",
         "정치외교학과 학사공지",
         "https://polisci.kookmin.ac.kr/polisci/etc-board/board02.do",
-        "SocialsciencePoliticalscienceAcademicScraper",
+        "BoardTemplateScraper",
     )
     ECONOMICCOMMERCE_ACADEMIC_RSS = (
         "economiccommerce_academic_rss",
@@ -208,13 +209,13 @@ class ScraperType(Enum):
         "socialscience_sociology_academic",
         "사회학과 학사공지",
         "https://kmusoc.kookmin.ac.kr/kmusoc/etc-board/major_notice.do",
-        "SocialscienceSociologyAcademicScraper",
+        "BoardTemplateScraper",
     )
     SOCIALSCIENCE_COMMUNICATION_MEDIA_ACADEMIC = (
         "socialscience_communication_media_academic",
         "미디어전공 학사공지",
         "https://kmumedia.kookmin.ac.kr/kmumedia/community/major-notice.do",
-        "SocialscienceCommunicationMediaAcademicScraper",
+        "BoardTemplateScraper",
     )
     ARTS_ACADEMIC = (
         "arts_academic",
@@ -226,7 +227,7 @@ class ScraperType(Enum):
         "physicaleducation_academic",
         "체육대학 학사공지",
         "https://sport.kookmin.ac.kr/sports/notice/notice01.do",
-        "PhysicaleducationAcademicScraper",
+        "BoardTemplateScraper",
     )
     DESIGN_CERAMICS_ACADEMIC = (
         "design_ceramics_academic",
@@ -238,19 +239,19 @@ class ScraperType(Enum):
         "socialscience_communication_advertising_academic",
         "광고홍보학전공 학사공지",
         "https://adpr.kookmin.ac.kr/adpr/menu/undergraduate-notice.do",
-        "SocialscienceCommunicationAdvertisingAcademicScraper",
+        "BoardTemplateScraper",
     )
     SOCIALSCIENCE_ACADEMIC = (
         "socialscience_academic",
         "사회과학대학 학사공지",
         "https://social.kookmin.ac.kr/social/menu/social_notice.do",
-        "SocialscienceAcademicScraper",
+        "BoardTemplateScraper",
     )
     GLOBALHUMANITIES_EURASIAN_ACADEMIC = (
         "globalhumanities_eurasian_academic",
         "러시아유라시아학과 학사공지",
         "https://cms.kookmin.ac.kr/Russian-EurasianStudies/community/department-notice.do",
-        "GlobalhumanitiesEurasianAcademicScraper",
+        "BoardTemplateScraper",
     )
 
     GLOBALHUMANITIES_ACADEMIC_RSS = (
@@ -288,21 +289,21 @@ class ScraperType(Enum):
         "coss_academic",
         "미래자동차사업단 학사공지",
         "https://coss.kookmin.ac.kr/fvedu/community/notice.do",
-        "CossAcademicScraper",
+        "BoardTemplateScraper",
     )
 
     FUTUREMOBILITY_ACADEMIC = (
         "futuremobility_academic",
         "미래모빌리티학과 학사공지",
         "https://cms.kookmin.ac.kr/futuremobility/board/notice.do",
-        "FuturemobilityAcademicScraper",
+        "BoardTemplateScraper",
     )
 
     NCCOSS_GENERAL = (
         "nccoss_general",
         "차세대통신사업단 학사공지",
         "https://nccoss.kookmin.ac.kr/NCCOSS/community/notice.do",
-        "NccossGeneralScraper",
+        "BoardTemplateScraper",
     )
 
     JO_CODING_YOUTUBE = (
@@ -373,7 +374,12 @@ class ScraperType(Enum):
     def get_active_scrapers(cls) -> list:
         """활성화된 스크래퍼 타입들을 반환합니다.
 
+        ACTIVE_SCRAPERS 환경 변수에 이름을 지정하면 해당 스크래퍼만 활성화합니다.
+
         Returns:
-            list[ScraperType]: 현재 활성화된 모든 스크래퍼 타입 목록
+            list[ScraperType]: 현재 활성화된 스크래퍼 타입 목록
         """
-        return list(cls)
+        active = ENV["ACTIVE_SCRAPERS"]
+        if not active:
+            return list(cls)
+        return [scraper_type for scraper_type in cls if scraper_type.name in active]
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from pymongo import ASCENDING, ReturnDocument
+from config.db_config import get_database
+from config.logger_config import setup_logger
+from template.notice_data import NoticeData
+from utils.scraper_type import ScraperType
+
+logger = setup_logger(__name__)
+
+# 스크랩 워커가 감지한 공지를 디스코드 프로세스로 넘기는 컬렉션
+QUEUE_COLLECTION = "notice-queue"
+# 가져간 뒤 이 시간 안에 완료(ack)되지 않으면 다시 전송 대상이 됨
+CLAIM_TIMEOUT = timedelta(minutes=5)
+
+
+def _collection():
+    return get_database()[QUEUE_COLLECTION]
+
+
+def ensure_queue_indexes():
+    """대기열 조회용 인덱스를 생성합니다."""
+    try:
+        _collection().create_index(
+            [("claimed_at", ASCENDING), ("queued_at", ASCENDING)]
+        )
+    except Exception as e:
+        logger.error(f"대기열 인덱스 생성 중 오류 발생: {e}")
+
+
+def enqueue_notice(notice: NoticeData):
+    """DB에 저장된 새 공지사항을 전송 대기열에 넣습니다."""
+    _collection().insert_one(
+        {
+            "scraper_type": notice.scraper_type.name,
+            "title": notice.title,
+            "link": notice.link,
+            "published": notice.published.isoformat(),
+            "detected_at": notice.detected_at,
+            "saved_at": notice.saved_at,
+            "queued_at": datetime.now(timezone.utc),
+            "claimed_at": None,
+        }
+    )
+
+
+def claim_notice() -> Optional[Tuple[object, NoticeData]]:
+    """가장 오래된 대기 공지를 가져옵니다. 없으면 None을 반환합니다.
+
+    반환값은 (대기열 문서 ID, NoticeData)이며, 전송이 끝나면 ack_notice를 호출해야 합니다.
+    """
+    now = datetime.now(timezone.utc)
+    document = _collection().find_one_and_update(
+        {
+            "$or": [
+                {"claimed_at": None},
+                {"claimed_at": {"$lt": now - CLAIM_TIMEOUT}},
+            ]
+        },
+        {"$set": {"claimed_at": now}},
+        sort=[("queued_at", ASCENDING)],
+        return_document=ReturnDocument.AFTER,
+    )
+    if document is None:
+        return None
+
+    notice = NoticeData(
+        title=document["title"],
+        link=document["link"],
+        published=datetime.fromisoformat(document["published"]),
+        scraper_type=ScraperType[document["scraper_type"]],
+    )
+    notice.detected_at = document.get("detected_at")
+    notice.saved_at = document.get("saved_at")
+    return document["_id"], notice
+
+
+def ack_notice(document_id):
+    """전송이 끝난 공지를 대기열에서 삭제합니다."""
+    _collection().delete_one({"_id": document_id})
+
+
+def count_queued() -> int:
+    """대기열에 남아 있는 공지 수를 반환합니다 (가져갔지만 아직 확인하지 않은 공지 포함)."""
+    return _collection().count_documents({})
@@ -0,0 +1,182 @@
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+from config.env_loader import ENV
+from config.logger_config import setup_logger
+from utils.scraper_type import ScraperType
+from utils.metrics import NEW_NOTICES, SCRAPER_STAGE_SECONDS
+
+# 단계 이름 (check_updates 실행 순서)
+STAGE_DB_LOAD = "db_load"
+STAGE_FETCH = "fetch"
+STAGE_DECODE = "decode"
+STAGE_PARSE = "parse"
+STAGE_ELEMENT = "parse_element"
+STAGE_DEDUP = "dedup"
+STAGES = (
+    STAGE_DB_LOAD,
+    STAGE_FETCH,
+    STAGE_DECODE,
+    STAGE_PARSE,
+    STAGE_ELEMENT,
+    STAGE_DEDUP,
+)
+
+# 구조화 기록은 별도 로거로 내보내 다른 로그와 구분합니다
+record_logger = setup_logger("stage_timing")
+
+
+class StageTimer:
+    """스크래퍼 한 번의 check_updates 실행에서 단계별 소요 시간을 측정하는 클래스
+
+    같은 단계를 여러 번 측정하면 합산됩니다. 요소별 파싱(parse_element)은
+    합계와 함께 요소 수와 가장 느린 요소의 시간도 기록합니다.
+    """
+
+    def __init__(self, scraper_type: ScraperType, tick_id: int):
+        self.scraper_type = scraper_type
+        self.tick_id = tick_id
+        self.stages: Dict[str, float] = {}
+        self.element_count = 0
+        self.element_max = 0.0
+        self.new_count = 0
+        self._started = time.perf_counter()
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, stage: str):
+        """with 블록의 소요 시간을 stage에 더합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    @contextmanager
+    def element(self):
+        """공지 요소 하나의 파싱 시간을 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.add(STAGE_ELEMENT, elapsed)
+            self.element_count += 1
+            self.element_max = max(self.element_max, elapsed)
+
+    def to_record(self) -> dict:
+        """구조화 기록(dict)을 반환합니다. 시간 단위는 ms입니다.
+
+        total_ms는 측정한 단계의 합계이고, wall_ms는 시작부터 끝까지의 경과 시간입니다.
+        공지를 하나씩 내보내는 동안 소비하는 쪽(저장/전송)에 쓴 시간은 wall_ms에만 포함됩니다.
+        """
+        return {
+            "tick": self.tick_id,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "scraper_type": self.scraper_type.name,
+            "total_ms": round(sum(self.stages.values()) * 1000, 2),
+            "wall_ms": round((time.perf_counter() - self._started) * 1000, 2),
+            "stages": {
+                stage: round(self.stages[stage] * 1000, 2)
+                for stage in STAGES
+                if stage in self.stages
+            },
+            "elements": self.element_count,
+            "element_max_ms": round(self.element_max * 1000, 2),
+            "new": self.new_count,
+        }
+
+
+class StageAggregate:
+    """스크래퍼 타입별 단계 시간 누적값"""
+
+    def __init__(self):
+        self.runs = 0
+        self.total_ms = 0.0
+        self.stage_ms: Dict[str, float] = {}
+        self.stage_max_ms: Dict[str, float] = {}
+
+    def observe(self, record: dict):
+        self.runs += 1
+        self.total_ms += record["total_ms"]
+        for stage, value in record["stages"].items():
+            self.stage_ms[stage] = self.stage_ms.get(stage, 0.0) + value
+            self.stage_max_ms[stage] = max(self.stage_max_ms.get(stage, 0.0), value)
+
+    def slowest_stage(self) -> Optional[str]:
+        if not self.stage_ms:
+            return None
+        return max(self.stage_ms, key=self.stage_ms.get)
+
+
+class StageRecorder:
+    """틱마다 스크래퍼별 단계 시간 기록을 내보내고 누적하는 클래스
+
+    기록은 stage_timing 로거에 JSON 한 줄로 남기고, STAGE_TIMING_PATH가
+    설정되어 있으면 같은 내용을 JSON Lines 파일에 덧붙입니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.tick_id = 0
+        self.by_scraper: Dict[ScraperType, StageAggregate] = {}
+
+    def new_tick(self) -> int:
+        """새 틱을 시작하고 틱 번호를 반환합니다."""
+        self.tick_id += 1
+        return self.tick_id
+
+    def start(self, scraper_type: ScraperType) -> StageTimer:
+        return StageTimer(scraper_type, self.tick_id)
+
+    def finish(self, timer: StageTimer):
+        """측정을 마치고 기록을 내보냅니다."""
+        try:
+            record = timer.to_record()
+            for stage, seconds in timer.stages.items():
+                SCRAPER_STAGE_SECONDS.observe(
+                    seconds, scraper_type=timer.scraper_type.name, stage=stage
+                )
+            if timer.new_count:
+                NEW_NOTICES.inc(timer.new_count, scraper_type=timer.scraper_type.name)
+            self.by_scraper.setdefault(
+                timer.scraper_type, StageAggregate()
+            ).observe(record)
+
+            line = json.dumps(record, ensure_ascii=False)
+            record_logger.info(line)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except Exception as e:
+            record_logger.error(f"단계 시간 기록 중 오류: {e}")
+
+    def get_summary_lines(self, limit: int = 15) -> List[str]:
+        """평균 실행 시간이 긴 게시판 순으로 가장 느린 단계를 요약합니다."""
+        aggregates = sorted(
+            self.by_scraper.items(),
+            key=lambda item: item[1].total_ms / item[1].runs,
+            reverse=True,
+        )
+        lines = []
+        for scraper_type, aggregate in aggregates[:limit]:
+            slowest = aggregate.slowest_stage()
+            stage_text = ""
+            if slowest:
+                stage_text = (
+                    f", 가장 느린 단계 {slowest} "
+                    f"평균 {aggregate.stage_ms[slowest] / aggregate.runs:.0f}ms "
+                    f"최대 {aggregate.stage_max_ms[slowest]:.0f}ms"
+                )
+            lines.append(
+                f"{scraper_type.get_korean_name()}: n={aggregate.runs} "
+                f"평균 {aggregate.total_ms / aggregate.runs:.0f}ms{stage_text}"
+            )
+        return lines
+
+
+stage_recorder = StageRecorder(ENV["STAGE_TIMING_PATH"])
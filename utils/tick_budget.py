@@ -0,0 +1,70 @@
+import time
+from typing import Optional
+from config.logger_config import setup_logger
+from utils.metrics import (
+    TICK_BACKLOG,
+    TICK_DEFERRED_BOARDS,
+    TICK_OVERRUNS,
+    TICK_START_DELAY_SECONDS,
+)
+
+logger = setup_logger(__name__)
+
+
+class TickBudget:
+    """확인 틱 하나에 쓸 수 있는 시간을 관리합니다.
+
+    틱이 시작되면 budget초 뒤를 마감으로 잡고, 마감이 지나면 남은 게시판을 시작하지 않고 다음 틱으로
+    넘깁니다 (scheduler.defer). 넘긴 게시판은 확인한 지 오래된 순서로 다음 틱에 먼저 실행되므로
+    한 틱이 길어져도 다음 틱에 일이 쌓이지 않고, 매번 같은 게시판만 밀리지 않습니다.
+
+    Args:
+        interval: 틱 주기 (초)
+        budget: 틱 하나의 시간 예산 (초)
+    """
+
+    def __init__(self, interval: float, budget: float):
+        self.interval = interval
+        self.budget = budget
+        self.started: Optional[float] = None
+        self.deadline: Optional[float] = None
+
+    def start(self):
+        """틱 시작을 기록하고, 이전 틱 기준 예정 시각보다 늦게 시작했으면 그만큼 기록합니다.
+
+        확인할 게시판이 없는 틱을 포함해 루프가 도는 모든 틱에서 호출해야 합니다.
+        """
+        now = time.monotonic()
+        if self.started is not None:
+            TICK_START_DELAY_SECONDS.observe(
+                max(now - self.started - self.interval, 0.0)
+            )
+        self.started = now
+        self.deadline = now + self.budget
+
+    def exhausted(self) -> bool:
+        """시간 예산을 다 썼는지 반환합니다."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def defer(self, scheduler, scraper_types: list):
+        """시작하지 못한 게시판을 다음 틱으로 넘깁니다."""
+        if not scraper_types:
+            return
+        scheduler.defer(scraper_types)
+        for scraper_type in scraper_types:
+            TICK_DEFERRED_BOARDS.inc(scraper_type=scraper_type.name)
+        logger.warning(
+            f"틱 시간 예산({self.budget:.0f}초) 초과로 게시판 {len(scraper_types)}개를 다음 틱으로 넘깁니다."
+        )
+
+    def finish(self, scheduler) -> float:
+        """틱 종료를 기록하고 소요 시간(초)을 반환합니다."""
+        elapsed = time.monotonic() - self.started
+        TICK_BACKLOG.set(len(scheduler.deferred))
+        if elapsed > self.budget:
+            TICK_OVERRUNS.inc()
+            logger.warning(
+                f"틱이 시간 예산을 넘겼습니다: {elapsed:.1f}초 (예산 {self.budget:.0f}초, "
+                f"밀린 게시판 {len(scheduler.deferred)}개)"
+            )
+        return elapsed
@@ -0,0 +1,70 @@
+from typing import Awaitable, Callable, List, Optional
+from config.logger_config import log_context, setup_logger
+from template.notice_data import NoticeData
+from utils.scheduler import scheduler
+from utils.scraper_factory import ScraperFactory
+from utils.scraper_type import ScraperType
+from utils.stage_timer import stage_recorder
+from utils.tick_budget import TickBudget
+
+logger = setup_logger(__name__)
+
+
+async def run_tick(
+    tick_budget: TickBudget,
+    scraper_types: List[ScraperType],
+    on_notice: Callable[[NoticeData], Awaitable[None]],
+    owns: Optional[Callable[[ScraperType], bool]] = None,
+) -> bool:
+    """확인 주기가 된 게시판을 스크래핑하고 새 공지를 on_notice에 넘기는 확인 틱 본문입니다.
+
+    봇(main.py)과 스크랩 워커(scrape_worker.py)가 같은 틱을 공유하며, 틱 종료 기록(tick_budget.finish)은
+    새 공지 처리가 끝나는 시점이 달라 호출하는 쪽에서 합니다.
+
+    Args:
+        tick_budget: 이번 틱의 시간 예산
+        scraper_types: 확인할 수 있는 게시판 목록
+        on_notice: 새 공지사항 하나를 처리하는 코루틴 함수
+        owns: 지정하면 틱 도중에도 이 함수가 False인 게시판은 시작하지 않고, 스크래핑 중이면 멈춤 (임대 확인용)
+
+    Returns:
+        bool: 확인할 게시판이 있었으면 True
+    """
+    # 확인할 게시판이 없는 틱도 시작 시각을 기록해야 틱 시작 지연을 잴 수 있음
+    tick_budget.start()
+    # 게시판별 일정(config/schedule.json)에 따라 이번에 확인할 게시판 선택
+    due_scrapers = scheduler.get_due_scrapers(scraper_types)
+    if not due_scrapers:
+        return False
+
+    # 단계 시간 기록을 틱 단위로 묶음
+    tick_id = stage_recorder.new_tick()
+    for index, scraper_type in enumerate(due_scrapers):
+        # 시간 예산을 다 썼으면 남은 게시판은 다음 틱에 먼저 실행
+        if tick_budget.exhausted():
+            tick_budget.defer(scheduler, due_scrapers[index:])
+            break
+        if owns is not None and not owns(scraper_type):
+            continue
+        scheduler.mark_run(scraper_type)
+        try:
+            with log_context(scraper_type=scraper_type, tick_id=tick_id):
+                # 게시판별로 재사용하는 스크래퍼
+                scraper = ScraperFactory().get_scraper(scraper_type)
+                if not scraper:
+                    logger.error(f"지원하지 않는 스크래퍼 타입: {scraper_type.name}")
+                    continue
+
+                # 새 공지는 파싱되는 즉시 넘겨 처리
+                async for notice in scraper.iter_new_notices():
+                    if owns is not None and not owns(scraper_type):
+                        logger.info(
+                            f"{scraper_type.get_korean_name()} 임대를 잃어 스크래핑을 중단합니다."
+                        )
+                        break
+                    await on_notice(notice)
+
+        except Exception as e:
+            logger.error(f"{scraper_type.get_korean_name()} 스크래핑 중 오류 발생: {e}")
+
+    return True
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from urllib.parse import urlsplit
 import aiohttp
 from bs4 import BeautifulSoup
 import pytz
@@ -8,54 +11,306 @@ from template.notice_data import NoticeData
 from config.db_config import get_collection
 from config.logger_config import setup_logger
 from utils.scraper_type import ScraperType
-from typing import List
+from utils.latency_tracker import latency_tracker
+from utils.html_parser import ListRegion, get_parser_backend, parse_html
+from utils.charset import charset_resolver
+from utils.circuit_breaker import circuit_breaker
+from utils.metrics import DEDUP_HITS, FETCH_RESPONSES, MONGO_SECONDS
+from config.env_loader import ENV
+from utils.parse_pool import parse_pool
+from utils.stage_timer import (
+    STAGE_DB_LOAD,
+    STAGE_DECODE,
+    STAGE_DEDUP,
+    STAGE_FETCH,
+    STAGE_PARSE,
+    StageTimer,
+    stage_recorder,
+)
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# 요청 시간 제한 (aiohttp 기본값은 전체 5분이라 죽은 사이트에서 틱이 오래 멈춤)
+FETCH_TIMEOUT = aiohttp.ClientTimeout(
+    total=ENV["FETCH_TIMEOUT"], connect=min(ENV["FETCH_TIMEOUT"], 5)
+)
+# 메모리에 들고 있는 등록 공지 목록을 DB에서 다시 읽는 주기 (초)
+# 다른 프로세스(테스트 명령어, 다른 워커)가 저장한 공지와 저장에 실패한 공지를 반영합니다
+SEEN_REFRESH_SECONDS = 60 * 60
+
+
+def decode_html(html: bytes, content_type: Optional[str] = None, url: str = "") -> str:
+    """응답 바이트를 Content-Type/meta/호스트별 인코딩으로 한 번만 디코딩합니다."""
+    return charset_resolver.decode(html, content_type, url)
 
 
 class WebScraper(ABC):
     """웹 스크래퍼 추상 클래스"""
 
+    # 공지사항 목록을 감싸는 영역 (태그 이름, 속성), 지정하면 이 영역만 파싱합니다
+    LIST_REGION: Optional[ListRegion] = None
+    # 상단 고정 공지 아래 일반 공지가 최신순으로 정렬된 게시판이면 True
+    # True이면 이미 등록된 일반 공지를 만나는 순간 나머지 행은 파싱하지 않습니다
+    ORDERED_BOARD: bool = False
+    # 목록 파싱을 파싱 프로세스 풀에서 실행할 수 있으면 True
+    # parse_notice_from_element에서 네트워크 요청을 하는 스크래퍼는 False로 지정합니다
+    SUPPORTS_PROCESS_POOL: bool = True
+
     def __init__(self, url: str, scraper_type: ScraperType):
         self.url = url
         self.scraper_type = scraper_type
         self.kst = pytz.timezone("Asia/Seoul")
         self.logger = setup_logger(self.scraper_type.get_collection_name())
+        # 네트워크 대신 페이지를 제공하는 객체 (녹화된 페이지 재생 등)
+        # async get(url) -> (본문 바이트, Content-Type) 또는 None
+        self.page_source = None
+
+        # 틱이 지나도 유지하는 게시판별 상태 (ScraperFactory.get_scraper로 재사용할 때 의미가 있음)
+        # 이미 등록된 공지의 링크/제목과 마지막으로 DB에서 읽은 시각
+        self.seen_links: set = set()
+        self.seen_titles: set = set()
+        self.seen_loaded_at: Optional[float] = None
+        # 목록 페이지 조건부 요청 헤더 (If-None-Match, If-Modified-Since)와 본문 지문
+        self.validators: Dict[str, str] = {}
+        self.fingerprint: Optional[str] = None
+        # 이번 틱에 받은 값, 확인이 끝까지 성공했을 때만 위 값으로 옮김
+        self._pending_validators: Optional[Dict[str, str]] = None
+        self._pending_fingerprint: Optional[str] = None
+        # 이번 틱에 목록 페이지가 받은 4xx 응답 (호스트가 아닌 이 게시판 주소의 문제)
+        self._list_client_error: Optional[str] = None
+        # 파싱 중 예외나 목록 페이지 4xx 응답이 이어질 때의 대기 (연속 실패 횟수, 다시 확인할 monotonic 시각)
+        self.failures = 0
+        self.retry_at = 0.0
+
+        self.configure()
+
+    def configure(self):
+        """설정에서 읽는 값(파서 백엔드, 목록 영역 등)을 적용합니다. reload에서 다시 호출됩니다."""
+        self.parser_backend = get_parser_backend(self.scraper_type)
+        self.list_region = self.LIST_REGION
+        self.ordered_board = self.ORDERED_BOARD
+
+    def reload(self):
+        """설정을 다시 적용하고 목록 페이지 상태와 실패 대기를 초기화합니다. 등록 공지 목록은 유지합니다."""
+        self.configure()
+        self.reset_page_state()
+        self.failures = 0
+        self.retry_at = 0.0
+        self.logger.info("스크래퍼 설정을 다시 적용했습니다.")
+
+    def reset_page_state(self):
+        """조건부 요청 헤더와 본문 지문을 지워 다음 확인에서 목록을 다시 파싱하게 합니다."""
+        self.validators = {}
+        self.fingerprint = None
+
+    def forget_seen(self):
+        """등록 공지 목록을 버리고 다음 확인에서 DB로부터 다시 읽게 합니다."""
+        self.seen_links = set()
+        self.seen_titles = set()
+        self.seen_loaded_at = None
+        self.reset_page_state()
+
+    def _load_seen(self):
+        """DB에서 등록된 공지의 링크와 제목을 읽어옵니다."""
+        started = time.perf_counter()
+        collection = get_collection(self.scraper_type.get_collection_name())
+        recent_notices = list(
+            collection.find(projection={"link": 1, "title": 1, "_id": 0})
+        )
+        MONGO_SECONDS.observe(time.perf_counter() - started, operation="load_recent")
+
+        self.seen_links = {notice["link"] for notice in recent_notices}
+        self.seen_titles = {notice["title"] for notice in recent_notices}
+        self.seen_loaded_at = time.monotonic()
+        # DB 기준이 바뀌었으므로 같은 페이지라도 다시 비교
+        self.reset_page_state()
 
     async def check_updates(self) -> List[NoticeData]:
         """웹페이지를 확인하여 새로운 공지사항이 있으면 반환합니다."""
+        return [notice async for notice in self.iter_new_notices()]
+
+    async def iter_new_notices(self) -> AsyncIterator[NoticeData]:
+        """새로운 공지사항을 파싱되는 즉시 하나씩 내보냅니다.
+
+        목록 전체를 파싱할 때까지 기다리지 않으므로, 소비하는 쪽에서 저장/전송을
+        진행하는 동안 다음 요소 파싱(상세 페이지 요청 등)이 이어집니다.
+        """
+        if time.monotonic() < self.retry_at:
+            self.logger.debug("연속 %d회 실패로 확인을 미룹니다", self.failures)
+            return
+
+        timer = stage_recorder.start(self.scraper_type)
         try:
-            # DB에서 해당 스크래퍼 타입의 최신 공지사항 가져오기
-            collection = get_collection(self.scraper_type.get_collection_name())
-            recent_notices = list(collection.find(sort=[("published", -1)]))
-
-            # 링크와 제목으로 비교하기 위한 set
-            recent_links = {notice["link"] for notice in recent_notices}
-            recent_titles = {notice["title"] for notice in recent_notices}
-
-            # 웹페이지 가져오기 (fetch_page 메서드 사용)
-            soup = await self.fetch_page()
-            if not soup:
-                return []
+            # 등록된 공지 목록은 메모리에 두고 주기적으로만 DB에서 다시 읽음
+            if (
+                self.seen_loaded_at is None
+                or time.monotonic() - self.seen_loaded_at >= SEEN_REFRESH_SECONDS
+            ):
+                with timer.stage(STAGE_DB_LOAD):
+                    self._load_seen()
+
+            self._pending_validators = None
+            self._pending_fingerprint = None
+            self._list_client_error = None
+            # 읽기를 멈출 위치는 이번 틱 시작 시점의 등록 목록으로만 판단 (이번 틱에 내보낸 링크에서 멈추면
+            # 고정 공지와 일반 목록에 함께 있는 새 공지 뒤의 새 공지를 놓침)
+            recent_links = frozenset(self.seen_links)
+            async for notice in self.stream_notices(recent_links, timer):
+                with timer.stage(STAGE_DEDUP):
+                    is_new = self._is_new(notice, self.seen_links, self.seen_titles)
+                if is_new:
+                    timer.new_count += 1
+                    # 저장은 소비하는 쪽에서 하지만, 다음 틱에서 다시 감지하지 않도록 바로 기록
+                    self.seen_links.add(notice.link)
+                    self.seen_titles.add(notice.title)
+                    yield notice
+
+            # 게시판 주소가 4xx를 돌려주면 회로 차단기 대신 이 게시판만 대기
+            if self._list_client_error is not None:
+                raise RuntimeError(f"목록 페이지 요청 실패 ({self._list_client_error})")
+
+            # 끝까지 확인했을 때만 목록 페이지 상태를 갱신 (중간에 실패하면 다음 틱에 다시 파싱)
+            if self._pending_validators is not None:
+                self.validators = self._pending_validators
+            if self._pending_fingerprint is not None:
+                self.fingerprint = self._pending_fingerprint
+            self.failures = 0
+            self.retry_at = 0.0
+            self.logger.info(f"총 {timer.new_count}개의 새로운 공지사항")
+
+        except Exception as e:
+            self.logger.error(f"공지사항 확인 중 오류 발생: {e}")
+            self._back_off()
+        finally:
+            stage_recorder.finish(timer)
+
+    def _back_off(self):
+        """연속 실패가 기준을 넘으면 다음 확인을 미룹니다 (시간 초과·연결 오류·5xx는 회로 차단기가 따로 처리).
+
+        대기 시간은 회로 차단기와 같은 설정을 쓰고 실패할 때마다 두 배로 늘립니다.
+        """
+        self.failures += 1
+        excess = self.failures - ENV["CIRCUIT_FAILURE_THRESHOLD"]
+        if excess < 0:
+            return
+        backoff = min(
+            ENV["CIRCUIT_BASE_BACKOFF"] * 2 ** excess, ENV["CIRCUIT_MAX_BACKOFF"]
+        )
+        self.retry_at = time.monotonic() + backoff
+        self.logger.warning(
+            f"연속 {self.failures}회 실패, {backoff / 60:.0f}분 동안 확인하지 않습니다"
+        )
+
+    def page_changed(self, body: bytes) -> bool:
+        """목록 페이지 본문이 마지막으로 끝까지 확인한 본문과 다르면 True를 반환합니다."""
+        fingerprint = hashlib.sha1(body).hexdigest()
+        if fingerprint == self.fingerprint:
+            self.logger.debug("목록 페이지가 바뀌지 않아 파싱을 건너뜁니다")
+            return False
+        self._pending_fingerprint = fingerprint
+        return True
+
+    async def stream_notices(
+        self, recent_links: set, timer: StageTimer
+    ) -> AsyncIterator[NoticeData]:
+        """목록 페이지를 가져와 공지사항을 하나씩 내보냅니다. 중복 여부는 확인하지 않습니다.
+
+        RSS/API처럼 HTML 목록 페이지가 없는 스크래퍼는 이 메서드를 재정의합니다.
+        """
+        with timer.stage(STAGE_FETCH):
+            fetched = await self._fetch_bytes()
+        if fetched is None:
+            return
+
+        body, content_type = fetched
+        if not self.page_changed(body):
+            return
+        with timer.stage(STAGE_DECODE):
+            html_text = decode_html(body, content_type, self.url)
+
+        # 파싱 (프로세스 풀을 쓸 수 있으면 워커 프로세스에서)
+        if parse_pool.enabled and self.SUPPORTS_PROCESS_POOL:
+            with timer.stage(STAGE_PARSE):
+                notices = await parse_pool.parse(
+                    self.scraper_type, html_text, recent_links
+                )
+            for notice in notices:
+                yield notice
+            return
+
+        with timer.stage(STAGE_PARSE):
+            soup = self.parse_html(html_text)
+        if not soup:
+            return
+        async for notice in self.iter_notices(soup, recent_links, timer):
+            yield notice
+
+    async def collect_notices(
+        self, soup, recent_links: set, timer: Optional[StageTimer] = None
+    ) -> List[NoticeData]:
+        """iter_notices의 결과를 목록으로 반환합니다 (프로세스 풀 워커, 벤치마크용)."""
+        return [notice async for notice in self.iter_notices(soup, recent_links, timer)]
+
+    async def iter_notices(
+        self, soup, recent_links: set, timer: Optional[StageTimer] = None
+    ) -> AsyncIterator[NoticeData]:
+        """파싱된 목록 페이지에서 공지사항을 하나씩 추출합니다. 중복 여부는 확인하지 않습니다.
+
+        recent_links는 ORDERED_BOARD 게시판에서 읽기를 멈출 위치를 찾는 데만 사용합니다.
+        timer를 주면 목록 선택은 parse 단계에, 요소별 파싱은 parse_element 단계에 기록합니다.
+        """
+        if timer is None:
+            # 프로세스 풀 워커와 벤치마크에서는 단계 시간을 기록하지 않음
+            timer = StageTimer(self.scraper_type, 0)
+
+        with timer.stage(STAGE_PARSE):
             elements = self.get_list_elements(soup)
 
-            new_notices = []
-            for element in elements:
+            # 고정 공지를 먼저 모두 확인하고, 일반 공지는 최신순으로 읽다가
+            # 이미 등록된 공지를 만나면 멈춥니다
+            pinned, regular = [], []
+            if self.ordered_board:
+                for element in elements:
+                    (pinned if self.is_pinned(element) else regular).append(element)
+            else:
+                regular = elements
+
+        for element in pinned:
+            with timer.element():
                 notice = await self.parse_notice_from_element(element)
-                if notice:
-                    self.logger.debug(f"[크롤링된 공지] {notice.title}")
+            if notice:
+                yield notice
 
-                    if notice.link in recent_links or notice.title in recent_titles:
-                        self.logger.debug("=> 이미 등록된 공지사항입니다")
-                    else:
-                        self.logger.debug("=> 새로운 공지사항입니다!")
-                        new_notices.append(notice)
+        for index, element in enumerate(regular):
+            with timer.element():
+                notice = await self.parse_notice_from_element(element)
+            if not notice:
+                continue
+            if self.ordered_board and notice.link in recent_links:
+                self.logger.debug(
+                    "이미 등록된 공지에 도달, 나머지 %d개 행 건너뜀",
+                    len(regular) - index - 1,
+                )
+                break
+            yield notice
 
-            self.logger.info(f"총 {len(new_notices)}개의 새로운 공지사항")
+    def _is_new(
+        self, notice: NoticeData, recent_links: set, recent_titles: set
+    ) -> bool:
+        """이미 등록된 공지사항이 아니면 감지 시각을 기록하고 True를 반환합니다."""
+        self.logger.debug("[크롤링된 공지] %s", notice.title)
 
-            return new_notices
+        if notice.link in recent_links or notice.title in recent_titles:
+            self.logger.debug("=> 이미 등록된 공지사항입니다")
+            DEDUP_HITS.inc(scraper_type=self.scraper_type.name)
+            return False
 
-        except Exception as e:
-            self.logger.error(f"공지사항 확인 중 오류 발생: {e}")
-            return []
+        self.logger.debug("=> 새로운 공지사항입니다!")
+        latency_tracker.mark_detected(notice)
+        return True
+
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다. ORDERED_BOARD 스크래퍼는 재정의해야 합니다."""
+        return False
 
     @abstractmethod
     async def parse_notice_from_element(self, element) -> NoticeData:
@@ -67,29 +322,90 @@ class WebScraper(ABC):
         """공지사항 목록의 HTML 요소들을 가져옵니다."""
         pass
 
-    async def fetch_page(self) -> BeautifulSoup:
-        """웹 페이지를 비동기적으로 가져와 BeautifulSoup 객체로 반환합니다."""
+    def parse_html(self, html_text: str, list_only: bool = True):
+        """스크래퍼 타입에 설정된 파서 백엔드로 HTML을 파싱합니다.
+
+        list_only이면 목록 영역만 파싱하고, 상세 페이지처럼 목록이 없는 페이지는 False로 전체를 파싱합니다.
+        """
+        region = self.list_region if list_only else None
+        return parse_html(html_text, self.parser_backend, region)
+
+    async def _fetch_bytes(self) -> Optional[Tuple[bytes, Optional[str]]]:
+        """목록 페이지 본문 바이트와 Content-Type 헤더를 가져옵니다.
+
+        실패했거나 마지막 확인 이후 바뀌지 않았으면(304) None을 반환합니다.
+        """
+        return await self.fetch_url(self.url, conditional=True)
+
+    async def fetch_url(
+        self, url: str, conditional: bool = False
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """URL의 본문 바이트와 Content-Type 헤더를 가져옵니다. 실패하면 None을 반환합니다.
+
+        page_source가 지정되어 있으면 네트워크 대신 page_source에서 가져옵니다.
+        호스트의 회로가 열려 있으면 요청하지 않고 None을 반환합니다.
+        conditional이면 저장해 둔 ETag/Last-Modified로 조건부 요청을 보내고, 304 응답은 None으로 반환합니다.
+        """
+        if self.page_source is not None:
+            return await self.page_source.get(url)
+
+        host = urlsplit(url).netloc
+        if not circuit_breaker.allow(url):
+            self.logger.debug("회로가 열린 호스트라 요청하지 않음: %s", url)
+            FETCH_RESPONSES.inc(host=host, status="circuit_open")
+            return None
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.url) as response:
+            async with aiohttp.ClientSession(timeout=FETCH_TIMEOUT) as session:
+                headers = self.validators if conditional else None
+                async with session.get(url, headers=headers) as response:
+                    FETCH_RESPONSES.inc(host=host, status=response.status)
+                    if conditional and response.status == 304:
+                        self.logger.debug("목록 페이지가 바뀌지 않았습니다 (304)")
+                        circuit_breaker.record_success(url)
+                        return None
                     if response.status != 200:
                         self.logger.error(
-                            f"페이지 요청 실패: {self.url}, 상태 코드: {response.status}"
+                            f"페이지 요청 실패: {url}, 상태 코드: {response.status}"
                         )
+                        if response.status >= 500:
+                            circuit_breaker.record_failure(url, f"HTTP {response.status}")
+                        else:
+                            # 4xx는 호스트는 응답하는 상태이므로 같은 호스트의 다른 게시판을 막지 않음
+                            circuit_breaker.record_success(url)
+                            if url == self.url:
+                                self._list_client_error = f"HTTP {response.status}"
                         return None
 
-                    html = await response.read()
+                    body = await response.read()
+                    circuit_breaker.record_success(url)
+                    if conditional:
+                        self._pending_validators = {
+                            name: response.headers[header]
+                            for name, header in (
+                                ("If-None-Match", "ETag"),
+                                ("If-Modified-Since", "Last-Modified"),
+                            )
+                            if header in response.headers
+                        }
+                    return body, response.headers.get("Content-Type")
+        except Exception as e:
+            # 시간 초과는 메시지가 비어 있으므로 예외 이름을 함께 남김
+            reason = f"{type(e).__name__}: {e}".rstrip(": ")
+            self.logger.error(f"페이지 요청 중 오류: {url}, {reason}")
+            FETCH_RESPONSES.inc(host=host, status="error")
+            circuit_breaker.record_failure(url, reason)
+            return None
 
-                    # 인코딩 문제 해결: 먼저 UTF-8로 시도하고, 실패하면 EUC-KR 등으로 시도
-                    try:
-                        html_text = html.decode("utf-8")
-                    except UnicodeDecodeError:
-                        try:
-                            html_text = html.decode("euc-kr")
-                        except UnicodeDecodeError:
-                            html_text = html.decode("cp949", errors="replace")
+    async def fetch_page(self) -> BeautifulSoup:
+        """웹 페이지를 비동기적으로 가져와 파싱된 문서 객체로 반환합니다."""
+        fetched = await self._fetch_bytes()
+        if fetched is None:
+            return None
 
-                    return BeautifulSoup(html_text, "html.parser")
+        body, content_type = fetched
+        try:
+            return self.parse_html(decode_html(body, content_type, self.url))
         except Exception as e:
-            self.logger.error(f"페이지 요청 중 오류: {e}")
+            self.logger.error(f"페이지 파싱 중 오류: {e}")
             return None
@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,8 @@ logger = setup_logger(__name__)
 class ArchitectureAcademicScraper(WebScraper):
     """건축대학 단과대공지 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "board-list-type01"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.ARCHITECTURE_ACADEMIC)
 
@@ -42,8 +44,9 @@ class ArchitectureAcademicScraper(WebScraper):
             if not date_tag:
                 return None
 
-            date = date_tag.text.strip()
-            published = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=self.kst)
+            published = date_parser.parse_or_now(
+                date_tag.text.strip(), self.scraper_type, logger
+            )
 
             return NoticeData(
                 title=title,
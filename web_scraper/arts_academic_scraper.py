@@ -3,6 +3,7 @@ from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +12,9 @@ logger = setup_logger(__name__)
 class ArtsAcademicScraper(WebScraper):
     """예술대학 학사공지 스크래퍼"""
 
+    LIST_REGION = ("div", {"class": "list-tbody"})
+    ORDERED_BOARD = True
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.ARTS_ACADEMIC)
         self.base_url = "https://art.kookmin.ac.kr"
@@ -19,14 +23,18 @@ class ArtsAcademicScraper(WebScraper):
         """예술대학 학사공지 목록의 HTML 요소들을 가져옵니다."""
         # div.list-tbody 내의 모든 ul 요소 선택
         elements = soup.select("div.list-tbody > ul")
-        self.logger.debug(f"총 {len(elements)}개의 공지사항 요소를 찾았습니다")
+        self.logger.debug("총 %d개의 공지사항 요소를 찾았습니다", len(elements))
         return elements if elements else []
 
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        return element.select_one("li.notice") is not None
+
     async def parse_notice_from_element(self, element) -> NoticeData:
         """HTML 요소에서 예술대학 학사공지 정보를 추출합니다."""
         try:
             # 공지사항 여부 확인
-            is_notice = element.select_one("li.notice") is not None
+            is_notice = self.is_pinned(element)
 
             # 제목과 링크 추출
             subject_li = element.select_one("li.subject")
@@ -54,19 +62,9 @@ class ArtsAcademicScraper(WebScraper):
                 self.logger.warning("날짜 요소를 찾을 수 없음")
                 published = datetime.now(self.kst)
             else:
-                date_str = date_li.text.strip()
-                try:
-                    published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                        tzinfo=self.kst
-                    )
-                except ValueError:
-                    try:
-                        published = datetime.strptime(date_str, "%Y.%m.%d").replace(
-                            tzinfo=self.kst
-                        )
-                    except ValueError:
-                        self.logger.error(f"날짜 파싱 오류: {date_str}")
-                        published = datetime.now(self.kst)
+                published = date_parser.parse_or_now(
+                    date_li.text.strip(), self.scraper_type, self.logger
+                )
 
             # 공지사항인 경우 제목 앞에 [공지] 표시 추가
             if is_notice and not title.startswith("[공지]"):
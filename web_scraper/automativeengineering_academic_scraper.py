@@ -1,13 +1,15 @@
 from bs4 import BeautifulSoup, Tag
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
-from datetime import datetime
 
 
 class AutomativeengineeringAcademicScraper(WebScraper):
     """자동차융합대학 학사공지 스크래퍼"""
 
+    LIST_REGION = ("div", {"class": "list-type01"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.AUTOMATIVEENGINEERING_ACADEMIC)
 
@@ -43,8 +45,9 @@ class AutomativeengineeringAcademicScraper(WebScraper):
             date_tag = element.select_one("span.list01-date")
             if not date_tag:
                 raise ValueError("날짜를 찾을 수 없습니다")
-            date_str = date_tag.text.strip()
-            date = datetime.strptime(date_str, "%Y.%m.%d")
+            date = date_parser.parse_or_now(
+                date_tag.text.strip(), self.scraper_type, self.logger
+            )
 
             # 전체 URL 생성
             full_url = f"https://auto.kookmin.ac.kr/board/notice/{link}"
@@ -0,0 +1,38 @@
+from bs4 import BeautifulSoup
+from template.notice_data import NoticeData
+from utils.web_scraper import WebScraper
+from config import board_templates
+
+
+class BoardTemplateScraper(WebScraper):
+    """board-table / b-title-box 계열 학과 게시판 공통 스크래퍼
+
+    게시판별 차이(목록/제목/날짜 선택자, 고정 공지 표시, 링크 변환 방식)는
+    config/board_templates.py의 BoardTemplate 항목으로 정의합니다.
+    """
+
+    def configure(self):
+        """게시판 템플릿을 읽어 목록 영역과 정렬 방식을 적용합니다."""
+        super().configure()
+        # 모듈을 통해 참조해야 ScraperFactory.reload에서 다시 읽은 템플릿이 반영됨
+        self.template = board_templates.get_board_template(self.scraper_type)
+        self.list_region = self.template.template.list_region
+        self.ordered_board = self.template.template.ordered_board
+
+    def get_list_elements(self, soup: BeautifulSoup) -> list:
+        """게시판 템플릿의 목록 선택자로 공지사항 요소들을 가져옵니다."""
+        return self.template.get_list_elements(soup)
+
+    def is_pinned(self, element) -> bool:
+        """게시판 템플릿의 고정 공지 조건으로 확인합니다."""
+        return self.template.is_pinned(element)
+
+    async def parse_notice_from_element(self, element) -> NoticeData:
+        """게시판 템플릿에 따라 공지사항 정보를 추출합니다."""
+        try:
+            return self.template.parse(
+                element, self.url, self.scraper_type, self.logger
+            )
+        except Exception as e:
+            self.logger.error(f"공지사항 파싱 중 오류: {e}")
+            return None
@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,8 @@ logger = setup_logger(__name__)
 class CreativeengineeringMechanicalAcademicScraper(WebScraper):
     """기계공학부 학사공지 스크래퍼"""
 
+    LIST_REGION = ("table", {"class": "board-table"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.CREATIVEENGINEERING_MECHANICAL_ACADEMIC)
 
@@ -36,18 +38,7 @@ class CreativeengineeringMechanicalAcademicScraper(WebScraper):
 
             # 날짜 추출 (마지막 td 요소)
             date = row.select("td")[-1].get_text(strip=True)
-
-            try:
-                published = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=self.kst)
-            except ValueError:
-                try:
-                    published = datetime.strptime(date, "%Y.%m.%d").replace(
-                        tzinfo=self.kst
-                    )
-                except ValueError:
-                    published = datetime.strptime(date, "%y.%m.%d").replace(
-                        tzinfo=self.kst
-                    )
+            published = date_parser.parse_or_now(date, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
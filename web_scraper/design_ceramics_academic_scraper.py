@@ -1,8 +1,9 @@
 from bs4 import BeautifulSoup
-from datetime import datetime, date, time
+from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +12,8 @@ logger = setup_logger(__name__)
 class DesignCeramicsAcademicScraper(WebScraper):
     """도자공예학과 학사공지 스크래퍼"""
 
+    LIST_REGION = ("div", {"class": "kboard-list"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.DESIGN_CERAMICS_ACADEMIC)
         self.base_url = "https://kmuceramics.com"
@@ -24,7 +27,7 @@ class DesignCeramicsAcademicScraper(WebScraper):
             return []
 
         elements = table.select("tbody tr")
-        self.logger.debug(f"총 {len(elements)}개의 공지사항 요소를 찾았습니다")
+        self.logger.debug("총 %d개의 공지사항 요소를 찾았습니다", len(elements))
         return elements if elements else []
 
     async def parse_notice_from_element(self, element) -> NoticeData:
@@ -68,33 +71,11 @@ class DesignCeramicsAcademicScraper(WebScraper):
 
             # 날짜 추출 및 파싱
             date_td = element.select_one("td.kboard-list-date")
-            published = None
             if date_td:
-                date_str = date_td.text.strip()
-                # 시도할 날짜 형식 리스트
-                date_formats = ["%Y.%m.%d", "%Y-%m-%d", "%y.%m.%d", "%H:%M"]
-
-                for fmt in date_formats:
-                    try:
-                        if fmt == "%H:%M":
-                            # 시간 형식인 경우 오늘 날짜와 결합
-                            time_obj = datetime.strptime(date_str, fmt).time()
-                            today_date = date.today()
-                            published = datetime.combine(today_date, time_obj).replace(tzinfo=self.kst)
-                        else:
-                            # 다른 날짜 형식 시도
-                            published = datetime.strptime(date_str, fmt).replace(tzinfo=self.kst)
-
-                        # 파싱 성공 시 반복 중단
-                        break
-                    except ValueError:
-                        # 파싱 실패 시 다음 형식 시도
-                        continue
-
-                # 모든 형식이 실패한 경우
-                if published is None:
-                    self.logger.error(f"지원하지 않는 날짜 형식 또는 파싱 오류: {date_str}")
-                    published = datetime.now(self.kst) # Fallback
+                # 오늘 올라온 글은 시각(HH:MM)만 표시됨
+                published = date_parser.parse_or_now(
+                    date_td.text.strip(), self.scraper_type, self.logger
+                )
             else:
                 self.logger.warning("날짜 요소를 찾을 수 없음")
                 published = datetime.now(self.kst) # Fallback
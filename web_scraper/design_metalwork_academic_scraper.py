@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,8 @@ logger = setup_logger(__name__)
 class DesignMetalworkAcademicScraper(WebScraper):
     """금속공예학과 학사공지 스크래퍼"""
 
+    LIST_REGION = (None, {"id": "kboard-default-list"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.DESIGN_METALWORK_ACADEMIC)
 
@@ -40,20 +42,7 @@ class DesignMetalworkAcademicScraper(WebScraper):
 
             # 날짜 추출
             date_str = element.select_one(".kboard-list-date").get_text(strip=True)
-
-            try:
-                published = datetime.strptime(date_str, "%Y.%m.%d").replace(
-                    tzinfo=self.kst
-                )
-            except ValueError:
-                try:
-                    published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                        tzinfo=self.kst
-                    )
-                except ValueError:
-                    published = datetime.strptime(date_str, "%y.%m.%d").replace(
-                        tzinfo=self.kst
-                    )
+            published = date_parser.parse_or_now(date_str, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
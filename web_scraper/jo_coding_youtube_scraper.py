@@ -1,9 +1,13 @@
+import asyncio
+import time
+from typing import AsyncIterator
 import requests
-from datetime import datetime
 from bs4 import BeautifulSoup
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
+from utils.stage_timer import STAGE_FETCH, StageTimer
 from config.logger_config import setup_logger
 from config.env_loader import ENV
 
@@ -11,8 +15,13 @@ logger = setup_logger(__name__)
 
 class JoCodingYoutubeScraper(WebScraper):
     """조코딩 유튜브 스크래퍼 (YouTube Data API 사용)"""
-    current_youtube_API_delay = 18
-    YOUTUBE_API_DELAY = 18 # 18 * 10분 에 한번 실행 (3시간 간격)
+    # 확인 주기는 config/schedule.json(180분)에서 정하고, 여기서는 API 할당량 보호용 하한만 둠.
+    # 일정은 5초 일찍 확인 대상이 되고 틱 안의 실행 순서에 따라 호출 시각이 달라지므로,
+    # 하한을 일정과 같게 두면 정상 주기의 호출이 막힌 채 확인이 끝난 것으로 기록되어 한 주기를 더 건너뜀
+    last_api_call = None
+    YOUTUBE_API_MIN_INTERVAL = 170 * 60  # 일정보다 10분 짧은 최소 호출 간격 (초)
+    # 목록을 YouTube API로 가져오므로 파싱 프로세스 풀을 쓰지 않음
+    SUPPORTS_PROCESS_POOL = False
 
     def __init__(self, url: str):
         super().__init__(url, ScraperType.JO_CODING_YOUTUBE)
@@ -23,10 +32,11 @@ class JoCodingYoutubeScraper(WebScraper):
 
     def get_list_elements(self, soup: BeautifulSoup) -> list:
         """유튜브 영상 목록의 HTML 요소들을 가져오는 대신, API로 데이터를 가져옵니다."""
-        if JoCodingYoutubeScraper.current_youtube_API_delay < JoCodingYoutubeScraper.YOUTUBE_API_DELAY:
-            JoCodingYoutubeScraper.current_youtube_API_delay += 1
+        now = time.monotonic()
+        last_call = JoCodingYoutubeScraper.last_api_call
+        if last_call is not None and now - last_call < self.YOUTUBE_API_MIN_INTERVAL:
             return []
-        JoCodingYoutubeScraper.current_youtube_API_delay = 0
+        JoCodingYoutubeScraper.last_api_call = now
 
         url = f'https://www.googleapis.com/youtube/v3/search'
         params = {
@@ -49,6 +59,21 @@ class JoCodingYoutubeScraper(WebScraper):
             logger.error(f"유튜브 API 호출 중 오류: {e}")
             return []
 
+    async def stream_notices(
+        self, recent_links: set, timer: StageTimer
+    ) -> AsyncIterator[NoticeData]:
+        """채널 페이지 대신 YouTube API로 최근 영상을 가져와 NoticeData로 하나씩 내보냅니다."""
+        # requests 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+        with timer.stage(STAGE_FETCH):
+            loop = asyncio.get_running_loop()
+            videos = await loop.run_in_executor(None, self.get_list_elements, None)
+
+        for video in videos:
+            with timer.element():
+                notice = await self.parse_notice_from_element(video)
+            if notice:
+                yield notice
+
     async def parse_notice_from_element(self, element) -> NoticeData:
         """API에서 받은 영상 데이터를 NoticeData 객체로 변환"""
         try:
@@ -56,7 +81,7 @@ class JoCodingYoutubeScraper(WebScraper):
             video_id = element['id']['videoId']
             link = f'https://www.youtube.com/watch?v={video_id}'
             published_at = element['snippet']['publishedAt']
-            published = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%S%z')
+            published = date_parser.parse_or_now(published_at, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,9 @@ logger = setup_logger(__name__)
 class LincAcademicScraper(WebScraper):
     """LINC 3.0 사업단 공지사항 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "board_list"})
+    ORDERED_BOARD = True
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.LINC_ACADEMIC)
 
@@ -18,11 +21,15 @@ class LincAcademicScraper(WebScraper):
         """공지사항 목록의 HTML 요소들을 가져옵니다."""
         return soup.select(".board_list .content_wrap li")
 
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        return element.select_one(".icon_notice") is not None
+
     async def parse_notice_from_element(self, element) -> NoticeData:
         """HTML 요소에서 공지사항 정보를 추출합니다."""
         try:
             # 공지사항 여부 확인
-            is_notice = element.select_one(".icon_notice") is not None
+            is_notice = self.is_pinned(element)
 
             # 제목과 링크 추출
             title_element = element.select_one("a")
@@ -44,15 +51,7 @@ class LincAcademicScraper(WebScraper):
 
             # 날짜 추출
             date_str = element.select_one(".date").get_text(strip=True)
-
-            try:
-                published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                    tzinfo=self.kst
-                )
-            except ValueError:
-                published = datetime.strptime(date_str, "%Y.%m.%d").replace(
-                    tzinfo=self.kst
-                )
+            published = date_parser.parse_or_now(date_str, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
@@ -1,9 +1,10 @@
+from typing import AsyncIterator
 import feedparser
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
-from config.db_config import get_collection
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
+from utils.stage_timer import STAGE_FETCH, STAGE_PARSE, StageTimer
 from bs4 import BeautifulSoup
 from config.logger_config import setup_logger
 
@@ -11,6 +12,9 @@ from config.logger_config import setup_logger
 class RSSNoticeScraper(WebScraper):
     """RSS 피드 스크래퍼"""
 
+    # 피드는 feedparser로 직접 처리하므로 파싱 프로세스 풀을 쓰지 않음
+    SUPPORTS_PROCESS_POOL = False
+
     def __init__(self, url: str, scraper_type: ScraperType):
         """RSS 피드 스크래퍼를 초기화합니다.
 
@@ -23,12 +27,7 @@ class RSSNoticeScraper(WebScraper):
 
     def parse_date(self, date_str):
         """날짜 문자열을 datetime 객체로 변환합니다."""
-        try:
-            dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-            return dt
-        except Exception as e:
-            self.logger.error(f"날짜 파싱 오류: {e}")
-            return datetime.now(self.kst)
+        return date_parser.parse_or_now(date_str, self.scraper_type, self.logger)
 
     def get_list_elements(self, soup: BeautifulSoup) -> list:
         """RSS 피드에서는 사용하지 않습니다."""
@@ -38,40 +37,28 @@ class RSSNoticeScraper(WebScraper):
         """RSS 피드에서는 사용하지 않습니다."""
         return None
 
-    async def check_updates(self) -> list:
-        """RSS 피드를 확인하여 새로운 글이 있으면 반환합니다."""
-        try:
-            # DB에서 해당 스크래퍼 타입의 최신 공지사항 가져오기
-            collection = get_collection(self.scraper_type.get_collection_name())
-            recent_notices = list(collection.find(sort=[("published", -1)]))
-
-            # 링크와 제목으로 비교하기 위한 set
-            recent_links = {notice["link"] for notice in recent_notices}
-            recent_titles = {notice["title"] for notice in recent_notices}
+    async def stream_notices(
+        self, recent_links: set, timer: StageTimer
+    ) -> AsyncIterator[NoticeData]:
+        """RSS 피드를 가져와 최근 글을 NoticeData로 하나씩 내보냅니다."""
+        # 피드는 aiohttp로 받아 이벤트 루프를 막지 않고, 파싱만 feedparser로 합니다
+        with timer.stage(STAGE_FETCH):
+            fetched = await self._fetch_bytes()
+        if fetched is None:
+            return
 
-            # RSS 피드 파싱
-            feed = feedparser.parse(self.url)
-            new_notices = []
+        body, _ = fetched
+        if not self.page_changed(body):
+            return
+        with timer.stage(STAGE_PARSE):
+            feed = feedparser.parse(body)
 
-            for entry in feed.entries[:20]:  # 최근 20개만 가져오기
+        for entry in feed.entries[:20]:  # 최근 20개만 가져오기
+            with timer.element():
                 notice = NoticeData(
                     title=entry.title,
                     link=entry.link,
                     published=self.parse_date(entry.published),
                     scraper_type=self.scraper_type,
                 )
-
-                self.logger.debug(f"[크롤링된 공지] {notice.title}")
-
-                if notice.link in recent_links or notice.title in recent_titles:
-                    self.logger.debug("=> 이미 등록된 공지사항입니다")
-                else:
-                    self.logger.debug("=> 새로운 공지사항입니다!")
-                    new_notices.append(notice)
-
-            self.logger.info(f"총 {len(new_notices)}개의 새로운 공지사항")
-            return new_notices
-
-        except Exception as e:
-            self.logger.error(f"RSS 피드 확인 중 오류 발생: {e}")
-            return []
+            yield notice
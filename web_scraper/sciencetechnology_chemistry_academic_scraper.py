@@ -3,6 +3,7 @@ from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +12,8 @@ logger = setup_logger(__name__)
 class SciencetechnologyChemistryAcademicScraper(WebScraper):
     """응용화학부 학사공지 스크래퍼"""
 
+    LIST_REGION = ("div", {"id": "ezsBBS"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.SCIENCETECHNOLOGY_CHEMISTRY_ACADEMIC)
         self.base_url = "http://chem.kookmin.ac.kr"
@@ -23,7 +26,7 @@ class SciencetechnologyChemistryAcademicScraper(WebScraper):
             return []
 
         rows = table.select("tr")
-        self.logger.debug(f"테이블에서 총 {len(rows)} 개의 행을 찾았습니다")
+        self.logger.debug("테이블에서 총 %d 개의 행을 찾았습니다", len(rows))
 
         # 헤더 행을 제외한 모든 행 반환
         return rows[1:] if len(rows) > 1 else []
@@ -48,19 +51,9 @@ class SciencetechnologyChemistryAcademicScraper(WebScraper):
             # 날짜 추출
             date_cells = element.select("td.txtc.txtN")
             if len(date_cells) >= 3:  # 번호, 날짜, 조회수 순서로 있을 것으로 예상
-                date_str = date_cells[1].text.strip()
-                try:
-                    published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                        tzinfo=self.kst
-                    )
-                except ValueError:
-                    try:
-                        published = datetime.strptime(date_str, "%Y.%m.%d").replace(
-                            tzinfo=self.kst
-                        )
-                    except ValueError:
-                        logger.error(f"날짜 파싱 오류: {date_str}")
-                        published = datetime.now(self.kst)
+                published = date_parser.parse_or_now(
+                    date_cells[1].text.strip(), self.scraper_type, logger
+                )
             else:
                 logger.warning("날짜 요소를 찾을 수 없음")
                 published = datetime.now(self.kst)
@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,9 @@ logger = setup_logger(__name__)
 class UniversityAcademicScraper(WebScraper):
     """대학 학사공지 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "list-tbody"})
+    ORDERED_BOARD = True
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.UNIVERSITY_ACADEMIC)
 
@@ -18,6 +21,10 @@ class UniversityAcademicScraper(WebScraper):
         """학사공지 목록의 HTML 요소들을 가져옵니다."""
         return soup.select(".list-tbody .normal-bg, .list-tbody .notice-bg")
 
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        return "notice-bg" in element.get("class", [])
+
     async def parse_notice_from_element(self, row) -> NoticeData:
         """HTML 요소에서 학사공지 정보를 추출합니다."""
         try:
@@ -31,7 +38,7 @@ class UniversityAcademicScraper(WebScraper):
                 link = f"https://cs.kookmin.ac.kr/news/kookmin/academic/{link}"
 
             date = row.select_one(".date").text.strip()
-            published = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=self.kst)
+            published = date_parser.parse_or_now(date, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
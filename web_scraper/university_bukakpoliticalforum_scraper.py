@@ -1,7 +1,7 @@
-import re
 from bs4 import BeautifulSoup
 from datetime import datetime
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from utils.scraper_type import ScraperType
 from template.notice_data import NoticeData
 from config.logger_config import setup_logger
@@ -12,6 +12,8 @@ logger = setup_logger(__name__)
 class UniversityBukakpoliticalforumScraper(WebScraper):
     """북악정치포럼 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "board_list"})
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.UNIVERSITY_BUKAKPOLITICALFORUM)
 
@@ -43,21 +45,10 @@ class UniversityBukakpoliticalforumScraper(WebScraper):
                 if spans:
                     # 날짜 추출 및 변환
                     date_text = spans[0].text.strip().replace("일시 및 기간: ", "")
-                    try:
-                        # "2025.04.29 (18:45~20:15)" 형식에서 날짜 부분만 추출
-                        date_match = re.search(r"(\d{4})\.(\d{2})\.(\d{2})", date_text)
-                        if date_match:
-                            year, month, day = date_match.groups()
-                            published = datetime.strptime(
-                                f"{year}-{month}-{day}", "%Y-%m-%d"
-                            )
-                            published = self.kst.localize(published)
-                        else:
-                            logger.warning(f"날짜 형식 변환 실패: {date_text}")
-                            published = datetime.now(self.kst)
-                    except ValueError as e:
-                        logger.error(f"날짜 파싱 오류: {e}")
-                        published = datetime.now(self.kst)
+                    # "2025.04.29 (18:45~20:15)" 형식에서 날짜 부분만 추출
+                    published = date_parser.parse_or_now(
+                        date_text, self.scraper_type, logger
+                    )
 
                     # 장소 정보 추출
                     location = spans[1].text.strip() if len(spans) > 1 else ""
@@ -78,7 +69,7 @@ class UniversityBukakpoliticalforumScraper(WebScraper):
                 link = self.url
 
             # 로깅
-            logger.debug(f"공지사항 파싱: {title}")
+            logger.debug("공지사항 파싱: %s", title)
 
             return NoticeData(
                 title=title,
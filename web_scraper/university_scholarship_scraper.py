@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,9 @@ logger = setup_logger(__name__)
 class UniversityScholarshipScraper(WebScraper):
     """대학 장학공지 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "list-tbody"})
+    ORDERED_BOARD = True
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.UNIVERSITY_SCHOLARSHIP)
 
@@ -18,11 +21,15 @@ class UniversityScholarshipScraper(WebScraper):
         """장학공지 목록의 HTML 요소들을 가져옵니다."""
         return soup.select(".list-tbody ul")
 
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        return element.select_one(".notice") is not None
+
     async def parse_notice_from_element(self, element) -> NoticeData:
         """HTML 요소에서 장학공지 정보를 추출합니다."""
         try:
             # 공지사항 여부 확인
-            is_notice = element.select_one(".notice") is not None
+            is_notice = self.is_pinned(element)
 
             # 제목과 링크 추출
             title_element = element.select_one(".subject a")
@@ -35,24 +42,7 @@ class UniversityScholarshipScraper(WebScraper):
 
             # 날짜 추출
             date_str = element.select_one(".date").get_text(strip=True)
-
-            # 다양한 날짜 형식 처리
-            try:
-                # YYYY-MM-DD 형식
-                published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                    tzinfo=self.kst
-                )
-            except ValueError:
-                try:
-                    # YYYY.MM.DD 형식
-                    published = datetime.strptime(date_str, "%Y.%m.%d").replace(
-                        tzinfo=self.kst
-                    )
-                except ValueError:
-                    # YY.MM.DD 형식
-                    published = datetime.strptime(date_str, "%y.%m.%d").replace(
-                        tzinfo=self.kst
-                    )
+            published = date_parser.parse_or_now(date_str, self.scraper_type, logger)
 
             return NoticeData(
                 title=title,
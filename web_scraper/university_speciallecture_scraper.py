@@ -1,8 +1,8 @@
 from bs4 import BeautifulSoup
-from datetime import datetime
 from template.notice_data import NoticeData
 from utils.scraper_type import ScraperType
 from utils.web_scraper import WebScraper
+from utils.date_parser import date_parser
 from config.logger_config import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +11,9 @@ logger = setup_logger(__name__)
 class UniversitySpeciallectureScraper(WebScraper):
     """대학 특강공지 스크래퍼"""
 
+    LIST_REGION = (None, {"class": "list-tbody"})
+    ORDERED_BOARD = True
+
     def __init__(self, url: str):
         super().__init__(url, ScraperType.UNIVERSITY_SPECIALLECTURE)
 
@@ -20,11 +23,15 @@ class UniversitySpeciallectureScraper(WebScraper):
         elements = soup.select(".list-tbody .normal-bg, .list-tbody .notice-bg")
         return elements if elements else []
 
+    def is_pinned(self, element) -> bool:
+        """상단 고정 공지 행인지 확인합니다."""
+        return "notice-bg" in element.get("class", [])
+
     async def parse_notice_from_element(self, element) -> NoticeData:
         """HTML 요소에서 특강공지 정보를 추출합니다."""
         try:
             # 공지사항 여부 확인
-            is_notice = "notice-bg" in element.get("class", [])
+            is_notice = self.is_pinned(element)
 
             # 제목과 링크 추출
             title_tag = element.select_one(".subject a")
@@ -38,7 +45,7 @@ class UniversitySpeciallectureScraper(WebScraper):
 
             # 날짜 추출
             date = element.select_one(".date").text.strip()
-            published = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=self.kst)
+            published = date_parser.parse_or_now(date, self.scraper_type, logger)
 
             # 공지사항인 경우 제목 앞에 [공지] 표시 추가
             if is_notice and not title.startswith("[공지]"):